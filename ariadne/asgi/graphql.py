@@ -6,12 +6,16 @@ from starlette.types import Receive, Scope, Send
 
 from ..explorer import Explorer, ExplorerGraphiQL
 from ..format_error import format_error
+from ..introspection_cache import IntrospectionCache
+from ..rate_limit import CostRateLimiter
+from ..scheduling import OperationScheduler
 from ..types import (
     ContextValue,
     ErrorFormatter,
     RootValue,
     ValidationRules,
 )
+from ..validation.query_limits import QueryLimits
 from .handlers import (
     GraphQLHTTPHandler,
     GraphQLWebsocketHandler,
@@ -34,6 +38,10 @@ class GraphQL:
         error_formatter: ErrorFormatter = format_error,
         http_handler: Optional[GraphQLHTTPHandler] = None,
         websocket_handler: Optional[GraphQLWebsocketHandler] = None,
+        query_limits: Optional[QueryLimits] = None,
+        introspection_cache: Optional[IntrospectionCache] = None,
+        rate_limiter: Optional[CostRateLimiter] = None,
+        scheduler: Optional[OperationScheduler] = None,
     ) -> None:
         if http_handler:
             self.http_handler = http_handler
@@ -58,6 +66,10 @@ class GraphQL:
             explorer,
             logger,
             error_formatter,
+            query_limits=query_limits,
+            introspection_cache=introspection_cache,
+            rate_limiter=rate_limiter,
+            scheduler=scheduler,
         )
         self.websocket_handler.configure(
             schema,
@@ -69,6 +81,10 @@ class GraphQL:
             explorer,
             logger,
             error_formatter,
+            query_limits=query_limits,
+            introspection_cache=introspection_cache,
+            rate_limiter=rate_limiter,
+            scheduler=scheduler,
             http_handler=self.http_handler,
         )
 
@@ -8,6 +8,9 @@ from starlette.types import Receive, Scope, Send
 
 from ...explorer import Explorer
 from ...format_error import format_error
+from ...introspection_cache import IntrospectionCache
+from ...rate_limit import CostRateLimiter
+from ...scheduling import OperationScheduler
 from ...types import (
     ContextValue,
     ErrorFormatter,
@@ -19,6 +22,7 @@ from ...types import (
     RootValue,
     ValidationRules,
 )
+from ...validation.query_limits import QueryLimits
 
 
 class GraphQLHandler(ABC):
@@ -32,6 +36,10 @@ class GraphQLHandler(ABC):
         self.logger: Union[None, str, Logger, LoggerAdapter] = None
         self.root_value: Optional[RootValue] = None
         self.validation_rules: Optional[ValidationRules] = None
+        self.query_limits: Optional[QueryLimits] = None
+        self.introspection_cache: Optional[IntrospectionCache] = None
+        self.rate_limiter: Optional[CostRateLimiter] = None
+        self.scheduler: Optional[OperationScheduler] = None
 
     @abstractmethod
     async def handle(self, scope: Scope, receive: Receive, send: Send):
@@ -48,6 +56,10 @@ class GraphQLHandler(ABC):
         explorer: Optional[Explorer] = None,
         logger: Union[None, str, Logger, LoggerAdapter] = None,
         error_formatter: ErrorFormatter = format_error,
+        query_limits: Optional[QueryLimits] = None,
+        introspection_cache: Optional[IntrospectionCache] = None,
+        rate_limiter: Optional[CostRateLimiter] = None,
+        scheduler: Optional[OperationScheduler] = None,
     ):
         self.context_value = context_value
         self.debug = debug
@@ -58,6 +70,10 @@ class GraphQLHandler(ABC):
         self.root_value = root_value
         self.schema = schema
         self.validation_rules = validation_rules
+        self.query_limits = query_limits
+        self.introspection_cache = introspection_cache
+        self.rate_limiter = rate_limiter
+        self.scheduler = scheduler
 
     async def get_context_for_request(
         self,
@@ -199,6 +199,8 @@ class GraphQLWSHandler(GraphQLWebsocketHandler):
             context_value=context_value,
             root_value=self.root_value,
             validation_rules=self.validation_rules,
+            query_limits=self.query_limits,
+            rate_limiter=self.rate_limiter,
             debug=self.debug,
             introspection=self.introspection,
             logger=self.logger,
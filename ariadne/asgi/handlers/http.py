@@ -1,4 +1,5 @@
 import json
+from asyncio import CancelledError, FIRST_COMPLETED, ensure_future, wait
 from inspect import isawaitable
 from typing import Any, Optional, cast
 
@@ -26,16 +27,36 @@ from ...types import (
 from .base import GraphQLHttpHandlerBase
 
 
+# Non-standard status used by proxies for requests closed by client
+HTTP_STATUS_499_CLIENT_CLOSED_REQUEST = 499
+
+
 class GraphQLHTTPHandler(GraphQLHttpHandlerBase):
+    """Executes GraphQL queries sent over HTTP
+
+    If `cancel_on_disconnect` is enabled, query execution is cancelled when
+    client disconnects before result is returned, and response with
+    non-standard 499 status is sent instead of result. Cancelled mutations may
+    be left with only some of their side effects applied, so this is disabled
+    by default.
+    """
+
     def __init__(
         self,
         extensions: Optional[Extensions] = None,
         middleware: Optional[Middlewares] = None,
+        cancel_on_disconnect: bool = False,
     ) -> None:
         super().__init__()
 
         self.extensions = extensions
         self.middleware = middleware
+        self.cancel_on_disconnect = cancel_on_disconnect
+        self.middleware_manager: Optional[MiddlewareManager] = None
+        if middleware and not callable(middleware):
+            # Static middleware list shares single manager between requests, so
+            # resolvers wrapped with middleware are cached
+            self.middleware_manager = MiddlewareManager(*middleware)
 
     async def handle(self, scope: Scope, receive: Receive, send: Send):
         request = Request(scope=scope, receive=receive)
@@ -71,10 +92,12 @@ class GraphQLHTTPHandler(GraphQLHttpHandlerBase):
         self, request: Any, context: Optional[ContextValue]
     ) -> Optional[MiddlewareManager]:
         middleware = self.middleware
-        if callable(middleware):
-            middleware = middleware(request, context)
-            if isawaitable(middleware):
-                middleware = await middleware  # type: ignore
+        if not callable(middleware):
+            return self.middleware_manager
+
+        middleware = middleware(request, context)
+        if isawaitable(middleware):
+            middleware = await middleware  # type: ignore
         if middleware:
             middleware = cast(list, middleware)
             return MiddlewareManager(*middleware)
@@ -94,6 +117,10 @@ class GraphQLHTTPHandler(GraphQLHttpHandlerBase):
             context_value=context_value,
             root_value=self.root_value,
             validation_rules=self.validation_rules,
+            query_limits=self.query_limits,
+            introspection_cache=self.introspection_cache,
+            rate_limiter=self.rate_limiter,
+            scheduler=self.scheduler,
             debug=self.debug,
             introspection=self.introspection,
             logger=self.logger,
@@ -108,9 +135,42 @@ class GraphQLHTTPHandler(GraphQLHttpHandlerBase):
         except HttpError as error:
             return PlainTextResponse(error.message or error.status, status_code=400)
 
-        success, result = await self.execute_graphql_query(request, data)
+        if self.cancel_on_disconnect:
+            query_result = await self.execute_graphql_query_until_disconnect(
+                request, data
+            )
+            if query_result is None:
+                # Client is gone, there is no one to send result to
+                return Response(status_code=HTTP_STATUS_499_CLIENT_CLOSED_REQUEST)
+            success, result = query_result
+        else:
+            success, result = await self.execute_graphql_query(request, data)
         return await self.create_json_response(request, result, success)
 
+    async def execute_graphql_query_until_disconnect(
+        self, request: Request, data: Any
+    ) -> Optional[GraphQLResult]:
+        """Executes query, cancelling its execution if client disconnects
+
+        Returns `None` if execution was cancelled.
+        """
+        execution = ensure_future(self.execute_graphql_query(request, data))
+        disconnect = ensure_future(wait_for_disconnect(request))
+        try:
+            await wait((execution, disconnect), return_when=FIRST_COMPLETED)
+        finally:
+            disconnect.cancel()
+            if not execution.done():
+                execution.cancel()
+                try:
+                    await execution
+                except CancelledError:
+                    pass
+
+        if execution.cancelled():
+            return None
+        return execution.result()
+
     async def create_json_response(
         self,
         request: Request,  # pylint: disable=unused-argument
@@ -180,3 +240,11 @@ class GraphQLHTTPHandler(GraphQLHttpHandlerBase):
             return Response(headers=allow_header)
 
         return Response(status_code=405, headers=allow_header)
+
+
+async def wait_for_disconnect(request: Request) -> None:
+    # Request's body was already read, so next message is a disconnect
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            return
@@ -0,0 +1,163 @@
+from functools import partial
+from inspect import isawaitable
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
+
+from graphql import GraphQLObjectType, GraphQLResolveInfo
+
+from ...types import ContextValue, Extension, Resolver
+from .apollotracing import perf_counter_ns
+from .utils import is_traceable_field
+
+# Upper bounds (in nanoseconds) of duration buckets: 1us, 2us, 4us, ... ~17s
+DURATION_BUCKETS = tuple(1000 << i for i in range(25))
+DEFAULT_PERCENTILES = (50, 95, 99)
+DEFAULT_MAX_FIELDS = 1000
+
+FieldCoordinate = Tuple[str, str]
+
+
+class FieldStats:
+    """Aggregated timings of all calls to single field's resolver"""
+
+    __slots__ = ("count", "errors", "total", "min", "max", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+        self.buckets: List[int] = [0] * (len(DURATION_BUCKETS) + 1)
+
+    def record(self, duration: int, error: bool = False) -> None:
+        if not self.count or duration < self.min:
+            self.min = duration
+        self.max = max(self.max, duration)
+        self.count += 1
+        self.total += duration
+        if error:
+            self.errors += 1
+        # Buckets bounds double, so bucket index is the bit length of microseconds
+        self.buckets[min((duration // 1000).bit_length(), len(DURATION_BUCKETS))] += 1
+
+    def percentile(self, percent: float) -> int:
+        threshold = self.count * percent / 100
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= threshold and seen:
+                if index >= len(DURATION_BUCKETS):
+                    return self.max
+                return min(DURATION_BUCKETS[index], self.max)
+        return self.max
+
+    def format(self, percentiles: Tuple[int, ...]) -> dict:
+        formatted = {
+            "count": self.count,
+            "errors": self.errors,
+            "totalDuration": self.total,
+            "minDuration": self.min,
+            "maxDuration": self.max,
+        }
+        for percent in percentiles:
+            formatted["p%sDuration" % percent] = self.percentile(percent)
+        return formatted
+
+
+class AggregatedTracingExtension(Extension):
+    """Traces resolvers as call counts and durations summary per schema coordinate
+
+    Size of tracing data depends on number of distinct fields in query instead of
+    number of resolver calls.
+    """
+
+    fields: Dict[FieldCoordinate, FieldStats]
+
+    def __init__(
+        self,
+        trace_default_resolver: bool = False,
+        *,
+        percentiles: Tuple[int, ...] = DEFAULT_PERCENTILES,
+        max_fields: int = DEFAULT_MAX_FIELDS,
+    ) -> None:
+        self.trace_default_resolver = trace_default_resolver
+        self.percentiles = percentiles
+        self.max_fields = max_fields
+        self.start_timestamp = 0
+        self.fields = {}
+        self.skipped_calls = 0
+
+    def request_started(self, context: ContextValue):
+        self.start_timestamp = perf_counter_ns()
+
+    def should_resolve_field(
+        self, parent_type: GraphQLObjectType, field_name: str
+    ) -> bool:
+        return is_traceable_field(parent_type, field_name, self.trace_default_resolver)
+
+    def resolve(
+        self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs
+    ):  # pylint: disable=invalid-overridden-method
+        stats = self.get_field_stats((info.parent_type.name, info.field_name))
+        if stats is None:
+            return next_(obj, info, **kwargs)
+
+        start_timestamp = perf_counter_ns()
+        try:
+            result = next_(obj, info, **kwargs)
+        except Exception:
+            stats.record(perf_counter_ns() - start_timestamp, True)
+            raise
+
+        if isawaitable(result):
+            return self.resolve_async(result, stats, start_timestamp)
+
+        stats.record(perf_counter_ns() - start_timestamp)
+        return result
+
+    async def resolve_async(
+        self, result: Awaitable, stats: FieldStats, start_timestamp: int
+    ):
+        try:
+            result = await result
+        except Exception:
+            stats.record(perf_counter_ns() - start_timestamp, True)
+            raise
+        stats.record(perf_counter_ns() - start_timestamp)
+        return result
+
+    def get_field_stats(self, coordinate: FieldCoordinate) -> Optional[FieldStats]:
+        stats = self.fields.get(coordinate)
+        if stats is None:
+            if len(self.fields) >= self.max_fields:
+                self.skipped_calls += 1
+                return None
+            stats = self.fields[coordinate] = FieldStats()
+        return stats
+
+    def format(self, context: ContextValue):
+        summary: Dict[str, Any] = {
+            "version": 1,
+            "duration": perf_counter_ns() - self.start_timestamp,
+            "fields": {
+                "%s.%s" % coordinate: stats.format(self.percentiles)
+                for coordinate, stats in self.fields.items()
+            },
+        }
+        if self.skipped_calls:
+            summary["skippedCalls"] = self.skipped_calls
+        return {"fieldStats": summary}
+
+
+def aggregated_tracing_extension(
+    trace_default_resolver: bool = False,
+    *,
+    percentiles: Tuple[int, ...] = DEFAULT_PERCENTILES,
+    max_fields: int = DEFAULT_MAX_FIELDS,
+):
+    return partial(
+        AggregatedTracingExtension,
+        trace_default_resolver,
+        percentiles=percentiles,
+        max_fields=max_fields,
+    )
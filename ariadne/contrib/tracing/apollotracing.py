@@ -1,11 +1,18 @@
 from datetime import datetime
+from functools import partial
 from inspect import isawaitable
-from typing import Any, List, Optional, cast
+from random import random
+from typing import Any, Awaitable, Callable, List, Optional, cast
 
-from graphql import GraphQLResolveInfo
+from graphql import (
+    GraphQLObjectType,
+    GraphQLOutputType,
+    GraphQLResolveInfo,
+    ResponsePath,
+)
 
 from ...types import ContextValue, Extension, Resolver
-from .utils import format_path, should_trace
+from .utils import format_path, is_traceable_field
 
 try:
     from time import perf_counter_ns
@@ -21,46 +28,125 @@ except ImportError:
 
 TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
 
+Sampler = Callable[[ContextValue], bool]
+
+
+class ResolverRecord:
+    """Timing of single resolver call, formatted only when response is built"""
+
+    __slots__ = (
+        "path",
+        "parent_type",
+        "field_name",
+        "return_type",
+        "start_offset",
+        "duration",
+    )
+
+    def __init__(
+        self,
+        path: ResponsePath,
+        parent_type: GraphQLObjectType,
+        field_name: str,
+        return_type: GraphQLOutputType,
+        start_offset: int,
+    ) -> None:
+        self.path = path
+        self.parent_type = parent_type
+        self.field_name = field_name
+        self.return_type = return_type
+        self.start_offset = start_offset
+        self.duration: Optional[int] = None
+
+    def format(self) -> dict:
+        return {
+            "path": format_path(self.path),
+            "parentType": str(self.parent_type),
+            "fieldName": self.field_name,
+            "returnType": str(self.return_type),
+            "startOffset": self.start_offset,
+            "duration": self.duration,
+        }
+
 
 class ApolloTracingExtension(Extension):
-    def __init__(self, trace_default_resolver: bool = False) -> None:
+    def __init__(
+        self,
+        trace_default_resolver: bool = False,
+        *,
+        sample_rate: float = 1.0,
+        sampler: Optional[Sampler] = None,
+        max_resolvers: Optional[int] = None,
+    ) -> None:
         self.trace_default_resolver = trace_default_resolver
+        self.sample_rate = sample_rate
+        self.sampler = sampler
+        self.max_resolvers = max_resolvers
+        self.sampled = True
         self.start_date: Optional[datetime] = None
         self.start_timestamp: int = 0
-        self.resolvers: List[dict] = []
+        self.resolvers: List[ResolverRecord] = []
 
         self._totals = None
 
     def request_started(self, context: ContextValue):
+        if self.sampler:
+            self.sampled = bool(self.sampler(context))
+        else:
+            self.sampled = self.sample_rate >= 1 or random() < self.sample_rate
+
         self.start_date = datetime.utcnow()
         self.start_timestamp = perf_counter_ns()
 
-    async def resolve(
+    def should_resolve(self, context: ContextValue) -> bool:
+        # Unsampled requests are executed without tracing middleware
+        return self.sampled
+
+    def should_resolve_field(
+        self, parent_type: GraphQLObjectType, field_name: str
+    ) -> bool:
+        return is_traceable_field(parent_type, field_name, self.trace_default_resolver)
+
+    def resolve(
         self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs
-    ):
-        if not should_trace(info, self.trace_default_resolver):
-            result = next_(obj, info, **kwargs)
-            if isawaitable(result):
-                result = await result
-            return result
+    ):  # pylint: disable=invalid-overridden-method
+        # Untraced fields are resolved without wrapping result in coroutine
+        if not self.should_record():
+            return next_(obj, info, **kwargs)
 
         start_timestamp = perf_counter_ns()
-        record = {
-            "path": format_path(info.path),
-            "parentType": str(info.parent_type),
-            "fieldName": info.field_name,
-            "returnType": str(info.return_type),
-            "startOffset": start_timestamp - cast(int, self.start_timestamp),
-        }
+        record = ResolverRecord(
+            info.path,
+            info.parent_type,
+            info.field_name,
+            info.return_type,
+            start_timestamp - cast(int, self.start_timestamp),
+        )
         self.resolvers.append(record)
         try:
             result = next_(obj, info, **kwargs)
-            if isawaitable(result):
-                result = await result
-            return result
+        except Exception:
+            record.duration = perf_counter_ns() - start_timestamp
+            raise
+
+        if isawaitable(result):
+            return self.resolve_async(result, record, start_timestamp)
+
+        record.duration = perf_counter_ns() - start_timestamp
+        return result
+
+    async def resolve_async(
+        self, result: Awaitable, record: ResolverRecord, start_timestamp: int
+    ):
+        try:
+            return await result
         finally:
-            end_timestamp = perf_counter_ns()
-            record["duration"] = end_timestamp - start_timestamp
+            record.duration = perf_counter_ns() - start_timestamp
+
+    def should_record(self) -> bool:
+        if not self.sampled:
+            return False
+        return self.max_resolvers is None or len(self.resolvers) < self.max_resolvers
 
     def get_totals(self):
         if self._totals is None:
@@ -72,10 +158,13 @@ class ApolloTracingExtension(Extension):
             "start": self.start_date,
             "end": datetime.utcnow(),
             "duration": perf_counter_ns() - self.start_timestamp,
-            "resolvers": self.resolvers,
+            "resolvers": [record.format() for record in self.resolvers],
         }
 
     def format(self, context: ContextValue):
+        if not self.sampled:
+            return None
+
         totals = self.get_totals()
 
         return {
@@ -90,25 +179,20 @@ class ApolloTracingExtension(Extension):
 
 
 class ApolloTracingExtensionSync(ApolloTracingExtension):
-    def resolve(
-        self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs
-    ):  # pylint: disable=invalid-overridden-method
-        if not should_trace(info):
-            result = next_(obj, info, **kwargs)
-            return result
-
-        start_timestamp = perf_counter_ns()
-        record = {
-            "path": format_path(info.path),
-            "parentType": str(info.parent_type),
-            "fieldName": info.field_name,
-            "returnType": str(info.return_type),
-            "startOffset": start_timestamp - cast(int, self.start_timestamp),
-        }
-        self.resolvers.append(record)
-        try:
-            result = next_(obj, info, **kwargs)
-            return result
-        finally:
-            end_timestamp = perf_counter_ns()
-            record["duration"] = end_timestamp - start_timestamp
+    """ApolloTracingExtension resolves synchronous fields without coroutines"""
+
+
+def apollo_tracing_extension(
+    trace_default_resolver: bool = False,
+    *,
+    sample_rate: float = 1.0,
+    sampler: Optional[Sampler] = None,
+    max_resolvers: Optional[int] = None,
+):
+    return partial(
+        ApolloTracingExtension,
+        trace_default_resolver,
+        sample_rate=sample_rate,
+        sampler=sampler,
+        max_resolvers=max_resolvers,
+    )
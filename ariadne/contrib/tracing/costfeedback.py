@@ -0,0 +1,348 @@
+from functools import partial
+from inspect import isawaitable
+from statistics import median
+from typing import Any, Awaitable, Dict, Optional, Tuple
+
+from graphql import (
+    DocumentNode,
+    FragmentDefinitionNode,
+    GraphQLObjectType,
+    GraphQLResolveInfo,
+    OperationDefinitionNode,
+    get_operation_ast,
+)
+
+from ...types import ContextValue, Extension, Resolver
+from ...validation.query_cost import get_query_cost
+from .apollotracing import perf_counter_ns
+from .signature import Fragments, get_signature
+from .utils import is_traceable_field
+
+NS_IN_MS = 1000000
+
+DEFAULT_MAX_OPERATIONS = 100
+DEFAULT_MAX_FIELDS = 1000
+
+
+class OperationCostStats:
+    """Estimated cost of operation next to its observed execution"""
+
+    __slots__ = (
+        "name",
+        "signature",
+        "estimates",
+        "total_estimated_cost",
+        "max_estimated_cost",
+        "count",
+        "resolver_calls",
+        "max_resolver_calls",
+        "list_items",
+        "duration",
+    )
+
+    def __init__(self, name: Optional[str], signature: str) -> None:
+        self.name = name
+        self.signature = signature
+        # Estimated cost depends on variables, so it's aggregated like others
+        self.estimates = 0
+        self.total_estimated_cost = 0
+        self.max_estimated_cost = 0
+        self.count = 0
+        self.resolver_calls = 0
+        self.max_resolver_calls = 0
+        self.list_items = 0
+        self.duration = 0
+
+    def record_estimated_cost(self, cost: int) -> None:
+        self.estimates += 1
+        self.total_estimated_cost += cost
+        self.max_estimated_cost = max(self.max_estimated_cost, cost)
+
+
+class FieldCostStats:
+    """Observed calls of field's resolver
+
+    Tracks integer arguments (and lengths of list arguments) that were never
+    smaller than size of list returned by resolver. Those are candidates for
+    field's multipliers. Calls that raised errors are counted, but their results
+    are not recorded.
+    """
+
+    __slots__ = (
+        "calls",
+        "errors",
+        "duration",
+        "lists",
+        "list_items",
+        "max_list_size",
+        "bounds",
+    )
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.duration = 0
+        self.lists = 0
+        self.list_items = 0
+        self.max_list_size = 0
+        self.bounds: Optional[Dict[str, int]] = None
+
+    def record(
+        self, duration: int, result: Any, kwargs: dict, error: bool = False
+    ) -> None:
+        self.calls += 1
+        self.duration += duration
+        if error:
+            self.errors += 1
+            return
+        if not isinstance(result, (list, tuple)):
+            return
+
+        size = len(result)
+        self.lists += 1
+        self.list_items += size
+        self.max_list_size = max(self.max_list_size, size)
+
+        bounds = {
+            name: value
+            for name, value in get_numeric_arguments(kwargs).items()
+            if size <= value
+        }
+        if self.bounds is None:
+            self.bounds = bounds
+        else:
+            # Argument stays a candidate only if it bounded every list
+            self.bounds = {
+                name: max(self.bounds[name], value)
+                for name, value in bounds.items()
+                if name in self.bounds
+            }
+
+
+def get_numeric_arguments(kwargs: dict) -> Dict[str, int]:
+    arguments = {}
+    for name, value in kwargs.items():
+        if isinstance(value, bool):
+            continue
+        if isinstance(value, int):
+            arguments[name] = value
+        elif isinstance(value, (list, tuple)):
+            arguments[name] = len(value)
+    return arguments
+
+
+class CostFeedbackRecorder:
+    """Observed costs of operations and fields shared by all requests
+
+    Operations are grouped by their signature. Operations and fields over the
+    limits are not recorded.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_operations: int = DEFAULT_MAX_OPERATIONS,
+        max_fields: int = DEFAULT_MAX_FIELDS,
+    ) -> None:
+        self.max_operations = max_operations
+        self.max_fields = max_fields
+        self.operations: Dict[str, OperationCostStats] = {}
+        self.fields: Dict[Tuple[str, str], FieldCostStats] = {}
+
+    def get_operation_stats(
+        self, operation: OperationDefinitionNode, fragments: Fragments
+    ) -> Optional[OperationCostStats]:
+        signature = get_signature(operation, fragments)
+        stats = self.operations.get(signature.hash)
+        if stats is None:
+            if len(self.operations) >= self.max_operations:
+                return None
+            name = operation.name.value if operation.name else None
+            stats = self.operations.setdefault(
+                signature.hash, OperationCostStats(name, signature.signature)
+            )
+        return stats
+
+    def get_field_stats(self, type_name: str, field_name: str) -> FieldCostStats:
+        stats = self.fields.get((type_name, field_name))
+        if stats is None:
+            if len(self.fields) >= self.max_fields:
+                return FieldCostStats()  # Recorded but discarded
+            stats = self.fields.setdefault((type_name, field_name), FieldCostStats())
+        return stats
+
+    def get_report(self) -> dict:
+        return {
+            "operations": [
+                {
+                    "hash": key,
+                    "name": stats.name,
+                    "signature": stats.signature,
+                    "count": stats.count,
+                    "averageEstimatedCost": (
+                        stats.total_estimated_cost / stats.estimates
+                        if stats.estimates
+                        else None
+                    ),
+                    "maxEstimatedCost": (
+                        stats.max_estimated_cost if stats.estimates else None
+                    ),
+                    "averageResolverCalls": stats.resolver_calls / stats.count,
+                    "maxResolverCalls": stats.max_resolver_calls,
+                    "averageListItems": stats.list_items / stats.count,
+                    "averageDuration": to_ms(stats.duration / stats.count),
+                }
+                for key, stats in list(self.operations.items())
+                if stats.count
+            ],
+            "fields": [
+                {
+                    "field": "%s.%s" % coordinate,
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "averageDuration": to_ms(stats.duration / stats.calls),
+                    "averageListSize": (
+                        stats.list_items / stats.lists if stats.lists else None
+                    ),
+                    "maxListSize": stats.max_list_size if stats.lists else None,
+                }
+                for coordinate, stats in list(self.fields.items())
+                if stats.calls
+            ],
+        }
+
+    def suggest_cost_map(self) -> Dict[str, Dict[str, Any]]:
+        """Suggests cost map for `cost_validator` based on recorded data
+
+        Complexity is field's average duration relative to median of average
+        durations of all fields. Multipliers are arguments that were never
+        smaller than size of list returned by field.
+        """
+        averages = {
+            coordinate: stats.duration / stats.calls
+            for coordinate, stats in list(self.fields.items())
+            if stats.calls
+        }
+        unit = median(averages.values()) if averages else 0
+
+        cost_map: Dict[str, Dict[str, Any]] = {}
+        for (type_name, field_name), average in averages.items():
+            stats = self.fields[(type_name, field_name)]
+            complexity = max(1, round(average / unit)) if unit else 1
+            multipliers = sorted(stats.bounds or {}) if stats.lists else []
+            if complexity > 1 or multipliers:
+                cost_args: Dict[str, Any] = {"complexity": complexity}
+                if multipliers:
+                    cost_args["multipliers"] = multipliers
+                cost_map.setdefault(type_name, {})[field_name] = cost_args
+        return cost_map
+
+
+class CostFeedbackExtension(Extension):
+    """Records operations estimated costs next to their resolvers calls
+
+    Estimated cost is taken from `cost_validator` which has to be included in
+    validation rules. All fields resolvers are measured, including the default
+    ones, because estimated cost counts them too. Resolvers that raised errors
+    are measured too.
+    """
+
+    def __init__(self, recorder: CostFeedbackRecorder) -> None:
+        self.recorder = recorder
+        self.start_timestamp = 0
+        self.operation: Optional[OperationDefinitionNode] = None
+        self.fragments: Fragments = {}
+        self.resolver_calls = 0
+        self.list_items = 0
+
+    def request_started(self, context: ContextValue):
+        self.start_timestamp = perf_counter_ns()
+
+    def document_parsed(
+        self,
+        document: DocumentNode,
+        operation_name: Optional[str],
+        variables: Optional[dict],
+        context: ContextValue,
+    ):
+        self.operation = get_operation_ast(document, operation_name)
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+
+    def should_resolve_field(
+        self, parent_type: GraphQLObjectType, field_name: str
+    ) -> bool:
+        return is_traceable_field(parent_type, field_name, trace_default_resolver=True)
+
+    def resolve(
+        self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs
+    ):  # pylint: disable=invalid-overridden-method
+        stats = self.recorder.get_field_stats(info.parent_type.name, info.field_name)
+        start_timestamp = perf_counter_ns()
+        try:
+            result = next_(obj, info, **kwargs)
+        except Exception:
+            self.record_field(stats, start_timestamp, None, kwargs, True)
+            raise
+
+        if isawaitable(result):
+            return self.resolve_async(result, stats, start_timestamp, kwargs)
+
+        self.record_field(stats, start_timestamp, result, kwargs)
+        return result
+
+    async def resolve_async(
+        self,
+        result: Awaitable,
+        stats: FieldCostStats,
+        start_timestamp: int,
+        kwargs: dict,
+    ):
+        try:
+            result = await result
+        except Exception:
+            self.record_field(stats, start_timestamp, None, kwargs, True)
+            raise
+        self.record_field(stats, start_timestamp, result, kwargs)
+        return result
+
+    def record_field(
+        self,
+        stats: FieldCostStats,
+        start_timestamp: int,
+        result: Any,
+        kwargs: dict,
+        error: bool = False,
+    ) -> None:
+        stats.record(perf_counter_ns() - start_timestamp, result, kwargs, error)
+        self.resolver_calls += 1
+        if isinstance(result, (list, tuple)):
+            self.list_items += len(result)
+
+    def request_finished(self, context: ContextValue):
+        if self.operation is None or not self.resolver_calls:
+            return  # Operation was not executed
+
+        stats = self.recorder.get_operation_stats(self.operation, self.fragments)
+        if stats is None:
+            return
+
+        estimated_cost = get_query_cost(self.operation)
+        if estimated_cost is not None:
+            stats.record_estimated_cost(estimated_cost)
+        stats.count += 1
+        stats.resolver_calls += self.resolver_calls
+        stats.max_resolver_calls = max(stats.max_resolver_calls, self.resolver_calls)
+        stats.list_items += self.list_items
+        stats.duration += perf_counter_ns() - self.start_timestamp
+
+
+def cost_feedback_extension(recorder: CostFeedbackRecorder):
+    return partial(CostFeedbackExtension, recorder)
+
+
+def to_ms(duration: float) -> float:
+    return round(duration / NS_IN_MS, 3)
@@ -0,0 +1,210 @@
+import json
+from base64 import b64encode
+from functools import partial
+from inspect import isawaitable
+from time import time_ns
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from graphql import GraphQLError, GraphQLObjectType, GraphQLResolveInfo
+
+from ...types import ContextValue, Extension, Resolver
+from .apollotracing import perf_counter_ns
+from .utils import format_path, get_request_header, is_traceable_field
+
+TRACE_HEADER = "apollo-federation-include-trace"
+TRACE_VERSION = "ftv1"
+
+NodePath = Tuple[Union[str, int], ...]
+TraceRequested = Callable[[ContextValue], bool]
+
+
+def is_trace_requested(context: ContextValue) -> bool:
+    """Checks if gateway asked for trace using `apollo-federation-include-trace`"""
+    return get_request_header(context, TRACE_HEADER) == TRACE_VERSION
+
+
+class TraceNode:
+    """Node of trace tree, encoded as `Trace.Node` protobuf message"""
+
+    __slots__ = (
+        "key",
+        "original_field_name",
+        "type",
+        "parent_type",
+        "start_time",
+        "end_time",
+        "errors",
+        "children",
+    )
+
+    def __init__(self, key: Union[str, int, None] = None) -> None:
+        self.key = key
+        self.original_field_name: Optional[str] = None
+        self.type: Optional[str] = None
+        self.parent_type: Optional[str] = None
+        self.start_time = 0
+        self.end_time = 0
+        self.errors: List[GraphQLError] = []
+        self.children: List["TraceNode"] = []
+
+    def encode(self, start_timestamp: int) -> bytes:
+        data = bytearray()
+        if isinstance(self.key, int):
+            data += encode_varint_field(2, self.key)
+        elif self.key is not None:
+            data += encode_string_field(1, self.key)
+        if self.type:
+            data += encode_string_field(3, self.type)
+        if self.start_time:
+            data += encode_varint_field(8, self.start_time - start_timestamp)
+        if self.end_time:
+            data += encode_varint_field(9, self.end_time - start_timestamp)
+        for error in self.errors:
+            data += encode_bytes_field(11, encode_error(error))
+        for child in self.children:
+            data += encode_bytes_field(12, child.encode(start_timestamp))
+        if self.parent_type:
+            data += encode_string_field(13, self.parent_type)
+        if self.original_field_name and self.original_field_name != self.key:
+            data += encode_string_field(14, self.original_field_name)
+        return bytes(data)
+
+
+class FederatedTracingExtension(Extension):
+    """Builds Apollo federated trace (ftv1) for gateway that requested it
+
+    Requests without trace are executed without extension's middleware.
+    """
+
+    nodes: Dict[NodePath, TraceNode]
+
+    def __init__(
+        self,
+        *,
+        trace_requested: TraceRequested = is_trace_requested,
+        trace_default_resolver: bool = False,
+    ):
+        self.trace_requested = trace_requested
+        self.trace_default_resolver = trace_default_resolver
+        self.enabled = False
+        self.start_time = 0
+        self.start_timestamp = 0
+        self.root = TraceNode()
+        self.nodes = {(): self.root}
+
+    def request_started(self, context: ContextValue):
+        self.enabled = self.trace_requested(context)
+        if self.enabled:
+            self.start_time = time_ns()
+            self.start_timestamp = perf_counter_ns()
+
+    def should_resolve(self, context: ContextValue) -> bool:
+        return self.enabled
+
+    def should_resolve_field(
+        self, parent_type: GraphQLObjectType, field_name: str
+    ) -> bool:
+        return is_traceable_field(parent_type, field_name, self.trace_default_resolver)
+
+    def resolve(
+        self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs
+    ):  # pylint: disable=invalid-overridden-method
+        node = self.get_node(tuple(format_path(info.path)))
+        node.original_field_name = info.field_name
+        node.type = str(info.return_type)
+        node.parent_type = info.parent_type.name
+        node.start_time = perf_counter_ns()
+        try:
+            result = next_(obj, info, **kwargs)
+        except Exception:
+            node.end_time = perf_counter_ns()
+            raise
+
+        if isawaitable(result):
+            return self.resolve_async(result, node)
+
+        node.end_time = perf_counter_ns()
+        return result
+
+    async def resolve_async(self, result: Awaitable, node: TraceNode):
+        try:
+            return await result
+        finally:
+            node.end_time = perf_counter_ns()
+
+    def get_node(self, path: NodePath) -> TraceNode:
+        node = self.nodes.get(path)
+        if node is None:
+            node = self.nodes[path] = TraceNode(path[-1])
+            self.get_node(path[:-1]).children.append(node)
+        return node
+
+    def has_errors(self, errors: List[GraphQLError], context: ContextValue):
+        if not self.enabled:
+            return
+
+        for error in errors:
+            if error.path:
+                self.get_node(tuple(error.path)).errors.append(error)
+            else:
+                self.root.errors.append(error)
+
+    def format(self, context: ContextValue):
+        if not self.enabled:
+            return None
+
+        duration = perf_counter_ns() - self.start_timestamp
+        trace = bytearray()
+        trace += encode_bytes_field(3, encode_timestamp(self.start_time + duration))
+        trace += encode_bytes_field(4, encode_timestamp(self.start_time))
+        trace += encode_varint_field(11, duration)
+        trace += encode_bytes_field(14, self.root.encode(self.start_timestamp))
+        return {TRACE_VERSION: b64encode(bytes(trace)).decode("ascii")}
+
+
+def federated_tracing_extension(
+    *,
+    trace_requested: TraceRequested = is_trace_requested,
+    trace_default_resolver: bool = False,
+):
+    return partial(
+        FederatedTracingExtension,
+        trace_requested=trace_requested,
+        trace_default_resolver=trace_default_resolver,
+    )
+
+
+def encode_error(error: GraphQLError) -> bytes:
+    data = bytearray(encode_string_field(1, error.message))
+    for location in error.locations or []:
+        encoded_location = encode_varint_field(1, location.line)
+        encoded_location += encode_varint_field(2, location.column)
+        data += encode_bytes_field(2, encoded_location)
+    data += encode_string_field(4, json.dumps(error.formatted))
+    return bytes(data)
+
+
+def encode_timestamp(timestamp_ns: int) -> bytes:
+    seconds, nanos = divmod(timestamp_ns, 1000000000)
+    return encode_varint_field(1, seconds) + encode_varint_field(2, nanos)
+
+
+def encode_varint(value: int) -> bytes:
+    data = bytearray()
+    while value > 0x7F:
+        data.append((value & 0x7F) | 0x80)
+        value >>= 7
+    data.append(value)
+    return bytes(data)
+
+
+def encode_varint_field(field_number: int, value: int) -> bytes:
+    return encode_varint(field_number << 3) + encode_varint(value)
+
+
+def encode_bytes_field(field_number: int, value: bytes) -> bytes:
+    return encode_varint((field_number << 3) | 2) + encode_varint(len(value)) + value
+
+
+def encode_string_field(field_number: int, value: str) -> bytes:
+    return encode_bytes_field(field_number, value.encode("utf-8"))
@@ -0,0 +1,371 @@
+from bisect import bisect_left
+from functools import partial
+from inspect import isawaitable
+from typing import Any, Awaitable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from graphql import (
+    DocumentNode,
+    GraphQLError,
+    GraphQLObjectType,
+    GraphQLResolveInfo,
+    get_operation_ast,
+)
+from starlette.responses import PlainTextResponse
+from starlette.types import Receive, Scope, Send
+
+from ...exceptions import ExecutionCancelledError
+from ...types import ContextValue, Extension, Resolver
+from .apollotracing import perf_counter_ns
+from .utils import is_traceable_field
+
+NS_IN_SECOND = 1000000000
+
+# Buckets upper bounds in seconds
+DEFAULT_OPERATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+DEFAULT_FIELD_BUCKETS = (
+    0.00001,
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1,
+)
+DEFAULT_SIZE_BUCKETS = (100, 1000, 5000, 10000, 50000, 100000, 500000, 1000000)
+
+DEFAULT_MAX_OPERATIONS = 100
+DEFAULT_MAX_FIELDS = 1000
+
+ANONYMOUS_OPERATION = "anonymous"
+OTHER_LABEL = "__other__"
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4"
+
+
+class Histogram:
+    """Histogram with fixed buckets, cheap to record from many threads
+
+    Counts are updated without a lock. Increments can be lost when threads race,
+    which is acceptable for metrics and keeps recording cost low.
+    """
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.bounds = bounds
+        self.counts: List[int] = [0] * (len(bounds) + 1)
+        self.sum: float = 0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self) -> List[int]:
+        total = 0
+        cumulative = []
+        for count in self.counts:
+            total += count
+            cumulative.append(total)
+        return cumulative
+
+
+class LimitedMetrics:
+    """Histograms, error and cancellation counters keyed by limited labels
+
+    Values for labels over the limit are recorded under `__other__` label.
+    """
+
+    def __init__(
+        self, bounds: Sequence[float], max_keys: int, other_key: Hashable
+    ) -> None:
+        self.bounds = bounds
+        self.max_keys = max_keys
+        self.other_key = other_key
+        self.histograms: Dict[Hashable, Histogram] = {}
+        self.errors: Dict[Hashable, int] = {}
+        self.cancellations: Dict[Hashable, int] = {}
+
+    def get_histogram(self, key: Hashable) -> Histogram:
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            if len(self.histograms) >= self.max_keys:
+                key = self.other_key
+            histogram = self.histograms.setdefault(key, Histogram(self.bounds))
+        return histogram
+
+    def add_error(self, key: Hashable) -> None:
+        if key not in self.histograms:
+            key = self.other_key
+        self.errors[key] = self.errors.get(key, 0) + 1
+
+    def add_cancellation(self, key: Hashable) -> None:
+        if key not in self.histograms:
+            key = self.other_key
+        self.cancellations[key] = self.cancellations.get(key, 0) + 1
+
+
+class MetricsRegistry:
+    """Metrics shared by all requests that are handled by `MetricsExtension`"""
+
+    def __init__(
+        self,
+        *,
+        operation_buckets: Sequence[float] = DEFAULT_OPERATION_BUCKETS,
+        field_buckets: Sequence[float] = DEFAULT_FIELD_BUCKETS,
+        size_buckets: Sequence[float] = DEFAULT_SIZE_BUCKETS,
+        max_operations: int = DEFAULT_MAX_OPERATIONS,
+        max_fields: int = DEFAULT_MAX_FIELDS,
+    ) -> None:
+        # Durations are recorded in nanoseconds and reported in seconds
+        self.operations = LimitedMetrics(
+            seconds_to_ns(operation_buckets), max_operations, OTHER_LABEL
+        )
+        self.fields = LimitedMetrics(
+            seconds_to_ns(field_buckets), max_fields, (OTHER_LABEL, OTHER_LABEL)
+        )
+        self.sizes = LimitedMetrics(size_buckets, max_operations, OTHER_LABEL)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        render_histograms(
+            lines,
+            "graphql_operation_duration_seconds",
+            "Duration of GraphQL operations.",
+            ("operation",),
+            self.operations,
+            NS_IN_SECOND,
+        )
+        render_errors(
+            lines,
+            "graphql_operation_errors_total",
+            "Number of GraphQL operations that returned errors.",
+            ("operation",),
+            self.operations,
+        )
+        render_counters(
+            lines,
+            "graphql_operations_cancelled_total",
+            "Number of GraphQL operations cancelled before completing.",
+            ("operation",),
+            self.operations.cancellations,
+        )
+        render_histograms(
+            lines,
+            "graphql_request_size_bytes",
+            "Size of GraphQL operations documents.",
+            ("operation",),
+            self.sizes,
+        )
+        render_histograms(
+            lines,
+            "graphql_field_duration_seconds",
+            "Duration of GraphQL fields resolvers.",
+            ("type", "field"),
+            self.fields,
+            NS_IN_SECOND,
+        )
+        render_errors(
+            lines,
+            "graphql_field_errors_total",
+            "Number of errors raised by GraphQL fields resolvers.",
+            ("type", "field"),
+            self.fields,
+        )
+        return "\n".join(lines) + "\n"
+
+
+def seconds_to_ns(bounds: Sequence[float]) -> Tuple[int, ...]:
+    return tuple(int(bound * NS_IN_SECOND) for bound in bounds)
+
+
+def render_histograms(
+    lines: List[str],
+    name: str,
+    description: str,
+    label_names: Tuple[str, ...],
+    metrics: LimitedMetrics,
+    divisor: int = 1,
+) -> None:
+    lines.append(f"# HELP {name} {description}")
+    lines.append(f"# TYPE {name} histogram")
+    for key, histogram in list(metrics.histograms.items()):
+        labels = format_labels(label_names, key)
+        counts = histogram.cumulative_counts()
+        for bound, count in zip(histogram.bounds, counts):
+            bucket_labels = f'{labels},le="{format_value(bound / divisor)}"'
+            lines.append(f"{name}_bucket{{{bucket_labels}}} {count}")
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {counts[-1]}')
+        lines.append(f"{name}_sum{{{labels}}} {format_value(histogram.sum / divisor)}")
+        lines.append(f"{name}_count{{{labels}}} {counts[-1]}")
+
+
+def render_errors(
+    lines: List[str],
+    name: str,
+    description: str,
+    label_names: Tuple[str, ...],
+    metrics: LimitedMetrics,
+) -> None:
+    render_counters(lines, name, description, label_names, metrics.errors)
+
+
+def render_counters(
+    lines: List[str],
+    name: str,
+    description: str,
+    label_names: Tuple[str, ...],
+    counters: Dict[Hashable, int],
+) -> None:
+    lines.append(f"# HELP {name} {description}")
+    lines.append(f"# TYPE {name} counter")
+    for key, count in list(counters.items()):
+        lines.append(f"{name}{{{format_labels(label_names, key)}}} {count}")
+
+
+def format_labels(label_names: Tuple[str, ...], key: Hashable) -> str:
+    values = key if isinstance(key, tuple) else (key,)
+    return ",".join(
+        f'{label}="{escape_label_value(str(value))}"'
+        for label, value in zip(label_names, values)
+    )
+
+
+def escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_value(value: float) -> str:
+    return repr(float(value))
+
+
+class MetricsExtension(Extension):
+    """Records operations and fields durations, errors and documents sizes
+
+    Operations cancelled before completing are counted apart from errors.
+    """
+
+    def __init__(self, registry: MetricsRegistry) -> None:
+        self.registry = registry
+        self.start_timestamp = 0
+        self.operation_name: Optional[str] = None
+        self.document_size: Optional[int] = None
+        self.has_error = False
+        self.cancelled = False
+
+    def request_started(self, context: ContextValue):
+        self.start_timestamp = perf_counter_ns()
+
+    def should_resolve_field(
+        self, parent_type: GraphQLObjectType, field_name: str
+    ) -> bool:
+        return is_traceable_field(parent_type, field_name)
+
+    def resolve(
+        self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs
+    ):  # pylint: disable=invalid-overridden-method
+        coordinate = (info.parent_type.name, info.field_name)
+        histogram = self.registry.fields.get_histogram(coordinate)
+        start_timestamp = perf_counter_ns()
+        try:
+            result = next_(obj, info, **kwargs)
+        except Exception:
+            histogram.observe(perf_counter_ns() - start_timestamp)
+            self.registry.fields.add_error(coordinate)
+            raise
+
+        if isawaitable(result):
+            return self.resolve_async(result, coordinate, histogram, start_timestamp)
+
+        histogram.observe(perf_counter_ns() - start_timestamp)
+        return result
+
+    async def resolve_async(
+        self,
+        result: Awaitable,
+        coordinate: Tuple[str, str],
+        histogram: Histogram,
+        start_timestamp: int,
+    ):
+        try:
+            result = await result
+        except Exception:
+            histogram.observe(perf_counter_ns() - start_timestamp)
+            self.registry.fields.add_error(coordinate)
+            raise
+        histogram.observe(perf_counter_ns() - start_timestamp)
+        return result
+
+    def document_parsed(
+        self,
+        document: DocumentNode,
+        operation_name: Optional[str],
+        variables: Optional[dict],
+        context: ContextValue,
+    ):
+        operation = get_operation_ast(document, operation_name)
+        if operation and operation.name:
+            self.operation_name = operation.name.value
+        if document.loc:
+            self.document_size = len(document.loc.source.body.encode("utf-8"))
+
+    def has_errors(self, errors: List[GraphQLError], context: ContextValue):
+        if any(isinstance(error, ExecutionCancelledError) for error in errors):
+            self.cancelled = True
+        else:
+            self.has_error = True
+
+    def request_finished(self, context: ContextValue):
+        # Unnamed operations and documents that failed to parse are anonymous
+        operation_name = self.operation_name or ANONYMOUS_OPERATION
+        operations = self.registry.operations
+        operations.get_histogram(operation_name).observe(
+            perf_counter_ns() - self.start_timestamp
+        )
+        if self.cancelled:
+            operations.add_cancellation(operation_name)
+        elif self.has_error:
+            operations.add_error(operation_name)
+        if self.document_size is not None:
+            self.registry.sizes.get_histogram(operation_name).observe(
+                self.document_size
+            )
+
+
+def metrics_extension(registry: MetricsRegistry):
+    return partial(MetricsExtension, registry)
+
+
+class MetricsASGIApp:
+    """ASGI application that renders metrics in Prometheus text format"""
+
+    def __init__(self, registry: MetricsRegistry) -> None:
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        response = PlainTextResponse(
+            self.registry.render(), media_type=PROMETHEUS_CONTENT_TYPE
+        )
+        await response(scope, receive, send)
+
+
+class MetricsWSGIApp:
+    """WSGI application that renders metrics in Prometheus text format"""
+
+    def __init__(self, registry: MetricsRegistry) -> None:
+        self.registry = registry
+
+    def __call__(self, environ: dict, start_response) -> List[bytes]:
+        body = self.registry.render().encode("utf-8")
+        start_response(
+            "200 OK",
+            [
+                ("Content-Type", PROMETHEUS_CONTENT_TYPE + "; charset=utf-8"),
+                ("Content-Length", str(len(body))),
+            ],
+        )
+        return [body]
@@ -0,0 +1,218 @@
+import os
+from functools import partial
+from inspect import isawaitable
+from io import BytesIO
+from tempfile import SpooledTemporaryFile
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+
+from graphql import GraphQLObjectType, GraphQLResolveInfo
+from graphql.pyutils import Path
+from opentelemetry.context import Context
+from opentelemetry.trace import Span, Status, StatusCode, Tracer, get_tracer
+from opentelemetry.trace import set_span_in_context
+
+from ...types import ContextValue, Extension, Resolver
+from .utils import format_path, is_traceable_field
+
+ArgFilter = Callable[[Dict[str, Any], GraphQLResolveInfo], Dict[str, Any]]
+
+DEFAULT_OPERATION_NAME = "GraphQL Operation"
+DEFAULT_MAX_ARG_LENGTH = 1000
+
+
+class OpenTelemetryExtension(Extension):
+    """Traces GraphQL operation and its fields using OpenTelemetry API
+
+    Span of every field is child of span of the closest traced field above it,
+    or of operation's root span. Arguments are copied for span's attributes only
+    if span is recording.
+    """
+
+    _arg_filter: Optional[ArgFilter]
+    _root_context: Optional[Context]
+    _fields_contexts: Dict[Path, Context]
+    _root_span: Optional[Span]
+    _tracer: Tracer
+
+    def __init__(
+        self,
+        *,
+        tracer: Optional[Tracer] = None,
+        arg_filter: Optional[ArgFilter] = None,
+        max_arg_length: int = DEFAULT_MAX_ARG_LENGTH,
+        root_span_name: str = DEFAULT_OPERATION_NAME,
+    ) -> None:
+        self._arg_filter = arg_filter
+        self._max_arg_length = max_arg_length
+        self._root_span_name = root_span_name
+        self._tracer = tracer or get_tracer("ariadne")
+        self._root_context = None
+        self._root_span = None
+        self._fields_contexts = {}
+        self._recording = False
+
+    def request_started(self, context: ContextValue):
+        self._root_span = self._tracer.start_span(self._root_span_name)
+        # Sampling decision is made when root span is started. Spans for fields
+        # of unsampled requests would be dropped, so they are not created at all.
+        self._recording = self._root_span.is_recording()
+        if self._recording:
+            self._root_span.set_attribute("component", "graphql")
+            self._root_context = set_span_in_context(self._root_span)
+
+    def should_resolve(self, context: ContextValue) -> bool:
+        return self._recording
+
+    def request_finished(self, context: ContextValue):
+        if self._root_span:
+            self._root_span.end()
+
+    def should_resolve_field(
+        self, parent_type: GraphQLObjectType, field_name: str
+    ) -> bool:
+        return is_traceable_field(parent_type, field_name)
+
+    def resolve(
+        self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs
+    ):  # pylint: disable=invalid-overridden-method
+        span = self._tracer.start_span(
+            info.field_name, context=self.get_parent_context(info.path)
+        )
+        self._fields_contexts[info.path] = set_span_in_context(span)
+        span.set_attribute("component", "graphql")
+        span.set_attribute("graphql.parentType", info.parent_type.name)
+        span.set_attribute(
+            "graphql.path", ".".join(str(key) for key in format_path(info.path))
+        )
+        if kwargs and span.is_recording():
+            filtered_kwargs = self.filter_resolver_args(kwargs, info)
+            for kwarg, value in filtered_kwargs.items():
+                span.set_attribute(
+                    f"graphql.param.{kwarg}", self.format_attribute_value(value)
+                )
+
+        try:
+            result = next_(obj, info, **kwargs)
+        except Exception as error:
+            end_span_with_error(span, error)
+            raise
+
+        if isawaitable(result):
+            return self.resolve_async(result, span)
+
+        span.end()
+        return result
+
+    def get_parent_context(self, path: Path) -> Optional[Context]:
+        # Fields with default resolvers and list items don't have spans
+        parent_path = path.prev
+        while parent_path:
+            context = self._fields_contexts.get(parent_path)
+            if context is not None:
+                return context
+            parent_path = parent_path.prev
+        return self._root_context
+
+    async def resolve_async(self, result: Awaitable, span: Span):
+        try:
+            result = await result
+        except Exception as error:
+            end_span_with_error(span, error)
+            raise
+        span.end()
+        return result
+
+    def filter_resolver_args(
+        self, args: Dict[str, Any], info: GraphQLResolveInfo
+    ) -> Dict[str, Any]:
+        args_to_trace = copy_args_for_tracing(args, self._max_arg_length)
+
+        if not self._arg_filter:
+            return args_to_trace
+
+        return self._arg_filter(args_to_trace, info)
+
+    def format_attribute_value(self, value: Any) -> Union[str, bool, int, float]:
+        if isinstance(value, (bool, int, float)):
+            return value
+        if not isinstance(value, str):
+            value = repr(value)
+        return truncate(value, self._max_arg_length)
+
+
+def opentelemetry_extension(
+    *,
+    tracer: Optional[Tracer] = None,
+    arg_filter: Optional[ArgFilter] = None,
+    max_arg_length: int = DEFAULT_MAX_ARG_LENGTH,
+    root_span_name: str = DEFAULT_OPERATION_NAME,
+):
+    return partial(
+        OpenTelemetryExtension,
+        tracer=tracer,
+        arg_filter=arg_filter,
+        max_arg_length=max_arg_length,
+        root_span_name=root_span_name,
+    )
+
+
+def end_span_with_error(span: Span, error: Exception) -> None:
+    span.record_exception(error)
+    span.set_status(Status(StatusCode.ERROR, str(error)))
+    span.end()
+
+
+def copy_args_for_tracing(value: Any, max_length: int) -> Any:
+    if isinstance(value, dict):
+        return {k: copy_args_for_tracing(v, max_length) for k, v in value.items()}
+    if isinstance(value, list):
+        return [copy_args_for_tracing(v, max_length) for v in value]
+    if is_upload_file(value):
+        return repr_upload_file(value)
+    if isinstance(value, str):
+        return truncate(value, max_length)
+    return value
+
+
+def truncate(value: str, max_length: int) -> str:
+    if len(value) > max_length:
+        return value[:max_length] + "..."
+    return value
+
+
+def is_upload_file(value: Any) -> bool:
+    # Matches Starlette's UploadFile and cgi's FieldStorage used by WSGI app
+    return hasattr(value, "filename") and hasattr(value, "file")
+
+
+def repr_upload_file(upload_file: Any) -> str:
+    filename = upload_file.filename
+    mime_type = getattr(upload_file, "content_type", None) or getattr(
+        upload_file, "type", None
+    )
+
+    size: Optional[int]
+    if upload_file.file is None:
+        value = getattr(upload_file, "value", None)
+        size = len(value) if value is not None else 0
+    else:
+        size = getattr(upload_file, "size", None)
+        if size is None:
+            size = get_file_size(upload_file.file)
+
+    return (
+        f"{type(upload_file)}(mime_type={mime_type}, size={size}, filename={filename})"
+    )
+
+
+def get_file_size(file_: Any) -> Optional[int]:
+    """Returns size of file without moving its position or None if its unknown"""
+    if isinstance(file_, SpooledTemporaryFile):
+        # Calling fileno() would move in-memory file to disk
+        file_ = file_._file  # pylint: disable=protected-access
+    if isinstance(file_, BytesIO):
+        return file_.getbuffer().nbytes
+    try:
+        return os.fstat(file_.fileno()).st_size
+    except (AttributeError, OSError, ValueError):
+        return None
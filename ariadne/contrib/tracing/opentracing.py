@@ -4,13 +4,13 @@ from functools import partial
 from inspect import isawaitable
 from typing import Any, Callable, Dict, Optional, Union
 
-from graphql import GraphQLResolveInfo
+from graphql import GraphQLObjectType, GraphQLResolveInfo
 from opentracing import Scope, Tracer, global_tracer
 from opentracing.ext import tags
 from starlette.datastructures import UploadFile
 
 from ...types import ContextValue, Extension, Resolver
-from .utils import format_path, should_trace
+from .utils import format_path, is_traceable_field
 
 ArgFilter = Callable[[Dict[str, Any], GraphQLResolveInfo], Dict[str, Any]]
 
@@ -31,15 +31,14 @@ class OpenTracingExtension(Extension):
     def request_finished(self, context: ContextValue):
         self._root_scope.close()
 
+    def should_resolve_field(
+        self, parent_type: GraphQLObjectType, field_name: str
+    ) -> bool:
+        return is_traceable_field(parent_type, field_name)
+
     async def resolve(
         self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs
     ):
-        if not should_trace(info):
-            result = next_(obj, info, **kwargs)
-            if isawaitable(result):
-                result = await result
-            return result
-
         with self._tracer.start_active_span(info.field_name) as scope:
             span = scope.span
             span.set_tag(tags.COMPONENT, "graphql")
@@ -75,10 +74,6 @@ class OpenTracingExtensionSync(OpenTracingExtension):
     def resolve(
         self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs
     ):  # pylint: disable=invalid-overridden-method
-        if not should_trace(info):
-            result = next_(obj, info, **kwargs)
-            return result
-
         with self._tracer.start_active_span(info.field_name) as scope:
             span = scope.span
             span.set_tag(tags.COMPONENT, "graphql")
@@ -0,0 +1,170 @@
+import hmac
+import os
+from cProfile import Profile
+from functools import partial
+from hashlib import sha256
+from pstats import Stats
+from time import time
+from typing import Callable, Optional, Union
+from uuid import uuid4
+
+from ...types import ContextValue, Extension
+from .utils import get_request_header
+
+PROFILE_CONTEXT_KEY = "profile"
+PROFILE_HEADER = "x-ariadne-profile"
+DEFAULT_MAX_AGE = 300
+DEFAULT_TOP = 20
+SORT_KEYS = {"cumulative": 3, "total": 2, "calls": 1}
+
+ProfileRequested = Callable[[ContextValue], bool]
+
+
+def is_profile_requested(context: ContextValue) -> bool:
+    """Checks if context has `profile` flag set to `True`"""
+    return isinstance(context, dict) and context.get(PROFILE_CONTEXT_KEY) is True
+
+
+def sign_profile_request(
+    secret: Union[str, bytes], timestamp: Optional[int] = None
+) -> str:
+    """Returns value of `x-ariadne-profile` header for `signed_header_requested`"""
+    timestamp = int(time()) if timestamp is None else timestamp
+    return f"{timestamp}.{get_signature(secret, str(timestamp))}"
+
+
+def signed_header_requested(
+    secret: Union[str, bytes],
+    *,
+    header: str = PROFILE_HEADER,
+    max_age: int = DEFAULT_MAX_AGE,
+) -> ProfileRequested:
+    """Returns check for header with timestamp signed with secret
+
+    Signatures older than `max_age` seconds are rejected.
+    """
+
+    def check_header(context: ContextValue) -> bool:
+        value = get_request_header(context, header)
+        if not value or "." not in value:
+            return False
+
+        timestamp, signature = value.split(".", 1)
+        if not hmac.compare_digest(signature, get_signature(secret, timestamp)):
+            return False
+
+        try:
+            return abs(time() - int(timestamp)) <= max_age
+        except ValueError:
+            return False
+
+    return check_header
+
+
+def get_signature(secret: Union[str, bytes], value: str) -> str:
+    if isinstance(secret, str):
+        secret = secret.encode("utf-8")
+    return hmac.new(secret, value.encode("utf-8"), sha256).hexdigest()
+
+
+class ProfilingExtension(Extension):
+    """Runs operations under `cProfile` profiler when profiling was requested
+
+    Top functions are reported in `profile` key of result's extensions. If
+    `output_dir` is set, full profile is also written to file in it that can be
+    read with `pstats`.
+
+    Profiler measures all code ran by the thread. When used in asynchronous
+    server it will also include other requests handled by event loop meanwhile.
+    """
+
+    def __init__(
+        self,
+        *,
+        profile_requested: ProfileRequested = is_profile_requested,
+        top: int = DEFAULT_TOP,
+        sort_by: str = "cumulative",
+        output_dir: Optional[str] = None,
+        report: bool = True,
+    ) -> None:
+        if sort_by not in SORT_KEYS:
+            raise ValueError(
+                "sort_by must be one of: %s" % ", ".join(sorted(SORT_KEYS))
+            )
+
+        self.profile_requested = profile_requested
+        self.top = top
+        self.sort_by = sort_by
+        self.output_dir = output_dir
+        self.report = report
+        self.profiler: Optional[Profile] = None
+
+    def request_started(self, context: ContextValue):
+        if not self.profile_requested(context):
+            return
+
+        profiler = Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            return  # Other profiler is already active in this thread
+        self.profiler = profiler
+
+    def request_finished(self, context: ContextValue):
+        self.stop_profiler()
+
+    def stop_profiler(self):
+        if self.profiler:
+            self.profiler.disable()
+
+    def format(self, context: ContextValue):
+        if not self.profiler:
+            return None
+
+        self.stop_profiler()
+        stats = Stats(self.profiler)
+        data: dict = {"totalCalls": stats.total_calls}  # type: ignore
+        if self.output_dir:
+            file_name = "%d-%s.prof" % (time(), uuid4().hex)
+            stats.dump_stats(os.path.join(self.output_dir, file_name))
+            data["file"] = file_name
+        if self.report:
+            data["functions"] = self.get_top_functions(stats)
+        return {"profile": data}
+
+    def get_top_functions(self, stats: Stats) -> list:
+        sort_index = SORT_KEYS[self.sort_by]
+        functions = sorted(
+            stats.stats.items(),  # type: ignore
+            key=lambda item: item[1][sort_index],
+            reverse=True,
+        )
+        return [
+            {
+                "function": "%s:%d(%s)" % function,
+                "calls": calls,
+                "totalTime": total_time,
+                "cumulativeTime": cumulative_time,
+            }
+            for function, (_, calls, total_time, cumulative_time, _) in functions[
+                : self.top
+            ]
+        ]
+
+
+def profiling_extension(
+    *,
+    profile_requested: ProfileRequested = is_profile_requested,
+    top: int = DEFAULT_TOP,
+    sort_by: str = "cumulative",
+    output_dir: Optional[str] = None,
+    report: bool = True,
+):
+    return partial(
+        ProfilingExtension,
+        profile_requested=profile_requested,
+        top=top,
+        sort_by=sort_by,
+        output_dir=output_dir,
+        report=report,
+    )
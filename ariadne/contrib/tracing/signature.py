@@ -0,0 +1,150 @@
+from hashlib import sha256
+from threading import Lock
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FloatValueNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLResolveInfo,
+    InlineFragmentNode,
+    IntValueNode,
+    ListValueNode,
+    Node,
+    ObjectValueNode,
+    OperationDefinitionNode,
+    SelectionNode,
+    SelectionSetNode,
+    StringValueNode,
+    Visitor,
+    print_ast,
+    visit,
+)
+
+SIGNATURES_CACHE_SIZE = 1024
+
+Fragments = Dict[str, FragmentDefinitionNode]
+
+
+class OperationSignature(NamedTuple):
+    """Normalized operation's text and its hash, usable as stable operation key"""
+
+    signature: str
+    hash: str
+
+
+# Signatures are cached by query text and operation name
+signatures_cache: Dict[Tuple[str, Optional[str]], OperationSignature] = {}
+# Oldest signature is evicted and new one is inserted atomically, as threads
+# could try to evict the same one
+signatures_cache_lock = Lock()
+
+
+def get_operation_signature(info: GraphQLResolveInfo) -> OperationSignature:
+    """Returns signature of operation that is currently executed"""
+    return get_signature(info.operation, info.fragments)
+
+
+def get_signature(
+    operation: OperationDefinitionNode, fragments: Fragments
+) -> OperationSignature:
+    if not operation.loc:
+        return create_signature(operation, fragments)
+
+    operation_name = operation.name.value if operation.name else None
+    cache_key = (operation.loc.source.body, operation_name)
+    signature = signatures_cache.get(cache_key)
+    if signature is None:
+        signature = create_signature(operation, fragments)
+        with signatures_cache_lock:
+            if len(signatures_cache) >= SIGNATURES_CACHE_SIZE:
+                del signatures_cache[next(iter(signatures_cache))]
+            signatures_cache[cache_key] = signature
+    return signature
+
+
+def create_signature(
+    operation: OperationDefinitionNode, fragments: Fragments
+) -> OperationSignature:
+    signature = print_signature(operation, fragments)
+    return OperationSignature(signature, sha256(signature.encode("utf-8")).hexdigest())
+
+
+def print_signature(operation: OperationDefinitionNode, fragments: Fragments) -> str:
+    """Prints operation with literals, aliases and whitespace stripped
+
+    Selections and arguments are sorted and only fragments used by operation
+    are included, sorted by name.
+    """
+    used_fragments = [
+        fragments[name] for name in sorted(find_used_fragments(operation, fragments))
+    ]
+    document = DocumentNode(definitions=(operation, *used_fragments))
+    normalized = visit(document, SignatureVisitor())
+    return " ".join(print_ast(normalized).split())
+
+
+def find_used_fragments(operation: Node, fragments: Fragments) -> Set[str]:
+    used: Set[str] = set()
+    pending: List[Node] = [operation]
+    while pending:
+        visitor = FragmentSpreadsVisitor()
+        visit(pending.pop(), visitor)
+        for name in visitor.names - used:
+            if name in fragments:
+                used.add(name)
+                pending.append(fragments[name])
+    return used
+
+
+class FragmentSpreadsVisitor(Visitor):
+    def __init__(self) -> None:
+        super().__init__()
+        self.names: Set[str] = set()
+
+    def enter_fragment_spread(self, node: FragmentSpreadNode, *_):
+        self.names.add(node.name.value)
+
+
+class SignatureVisitor(Visitor):
+    def leave_int_value(self, *_):
+        return IntValueNode(value="0")
+
+    def leave_float_value(self, *_):
+        return FloatValueNode(value="0")
+
+    def leave_string_value(self, *_):
+        return StringValueNode(value="", block=False)
+
+    def leave_list_value(self, *_):
+        return ListValueNode(values=())
+
+    def leave_object_value(self, *_):
+        return ObjectValueNode(fields=())
+
+    def leave_field(self, node: FieldNode, *_):
+        return FieldNode(
+            alias=None,
+            name=node.name,
+            arguments=tuple(sorted(node.arguments, key=get_name)),
+            directives=node.directives,
+            selection_set=node.selection_set,
+        )
+
+    def leave_selection_set(self, node: SelectionSetNode, *_):
+        return SelectionSetNode(
+            selections=tuple(sorted(node.selections, key=get_selection_sort_key))
+        )
+
+
+def get_name(node: Node) -> str:
+    return node.name.value  # type: ignore
+
+
+def get_selection_sort_key(node: SelectionNode) -> Tuple[str, str]:
+    if isinstance(node, InlineFragmentNode):
+        type_name = node.type_condition.name.value if node.type_condition else ""
+        return (node.kind, type_name)
+    return (node.kind, get_name(node))
@@ -0,0 +1,214 @@
+import json
+import logging
+from functools import partial
+from inspect import isawaitable
+from typing import Any, Awaitable, Dict, Optional, Union
+
+from graphql import (
+    DocumentNode,
+    FragmentDefinitionNode,
+    GraphQLObjectType,
+    GraphQLResolveInfo,
+    OperationDefinitionNode,
+    get_operation_ast,
+)
+
+from ...types import ContextValue, Extension, Resolver
+from .apollotracing import perf_counter_ns
+from .signature import Fragments, get_signature
+from .utils import is_traceable_field
+
+NS_IN_MS = 1000000
+
+DEFAULT_THRESHOLD = 1000  # Milliseconds
+DEFAULT_TOP_FIELDS = 5
+
+
+class FieldTimings:
+    __slots__ = ("calls", "total", "max")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, duration: int) -> None:
+        self.calls += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+
+
+class SlowOperationLogExtension(Extension):
+    """Logs operations that took longer than threshold (in milliseconds)
+
+    Logged data includes operation's normalized signature and its hash, shape of
+    variables (without their values), timings of parsing and of validation and
+    execution, and fields with biggest total duration.
+
+    Operation is known to extension after query was parsed.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold: float = DEFAULT_THRESHOLD,
+        logger: Union[None, str, logging.Logger, logging.LoggerAdapter] = None,
+        level: int = logging.WARNING,
+        top_fields: int = DEFAULT_TOP_FIELDS,
+    ) -> None:
+        self.threshold = int(threshold * NS_IN_MS)
+        self.logger = logger
+        self.level = level
+        self.top_fields = top_fields
+        self.start_timestamp = 0
+        self.parsed_timestamp = 0
+        self.operation: Optional[OperationDefinitionNode] = None
+        self.fragments: Fragments = {}
+        self.variables: Dict[str, Any] = {}
+        self.fields: Dict[str, FieldTimings] = {}
+
+    def request_started(self, context: ContextValue):
+        self.start_timestamp = perf_counter_ns()
+
+    def document_parsed(
+        self,
+        document: DocumentNode,
+        operation_name: Optional[str],
+        variables: Optional[dict],
+        context: ContextValue,
+    ):
+        self.parsed_timestamp = perf_counter_ns()
+        self.operation = get_operation_ast(document, operation_name)
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+        if isinstance(variables, dict):
+            self.variables = variables
+
+    def should_resolve_field(
+        self, parent_type: GraphQLObjectType, field_name: str
+    ) -> bool:
+        return is_traceable_field(parent_type, field_name)
+
+    def resolve(
+        self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs
+    ):  # pylint: disable=invalid-overridden-method
+        start_timestamp = perf_counter_ns()
+        coordinate = "%s.%s" % (info.parent_type.name, info.field_name)
+        timings = self.fields.get(coordinate)
+        if timings is None:
+            timings = self.fields[coordinate] = FieldTimings()
+
+        try:
+            result = next_(obj, info, **kwargs)
+        except Exception:
+            timings.record(perf_counter_ns() - start_timestamp)
+            raise
+
+        if isawaitable(result):
+            return self.resolve_async(result, timings, start_timestamp)
+
+        timings.record(perf_counter_ns() - start_timestamp)
+        return result
+
+    async def resolve_async(
+        self, result: Awaitable, timings: FieldTimings, start_timestamp: int
+    ):
+        try:
+            return await result
+        finally:
+            timings.record(perf_counter_ns() - start_timestamp)
+
+    def request_finished(self, context: ContextValue):
+        end_timestamp = perf_counter_ns()
+        if end_timestamp - self.start_timestamp < self.threshold:
+            return
+
+        logger = self.logger or "ariadne"
+        if isinstance(logger, str):
+            logger = logging.getLogger(logger)
+
+        data = self.get_log_data(end_timestamp)
+        logger.log(
+            self.level,
+            "Slow GraphQL operation: %s",
+            json.dumps(data),
+            extra={"graphql_operation": data},
+        )
+
+    def get_log_data(self, end_timestamp: int) -> dict:
+        data: Dict[str, Any] = {
+            "operationName": None,
+            "signature": None,
+            "hash": None,
+            "variables": get_variables_shape(self.variables),
+            "duration": to_ms(end_timestamp - self.start_timestamp),
+        }
+
+        if self.operation:
+            signature = get_signature(self.operation, self.fragments)
+            data.update(
+                {
+                    "operationName": (
+                        self.operation.name.value if self.operation.name else None
+                    ),
+                    "signature": signature.signature,
+                    "hash": signature.hash,
+                }
+            )
+
+        if self.parsed_timestamp:
+            data["stages"] = {
+                "parsing": to_ms(self.parsed_timestamp - self.start_timestamp),
+                "validationAndExecution": to_ms(end_timestamp - self.parsed_timestamp),
+            }
+        else:
+            # Query failed to parse or request was invalid
+            data["stages"] = {"parsing": data["duration"], "validationAndExecution": 0}
+
+        slowest_fields = sorted(
+            self.fields.items(), key=lambda item: item[1].total, reverse=True
+        )
+        data["slowFields"] = [
+            {
+                "field": coordinate,
+                "calls": timings.calls,
+                "totalDuration": to_ms(timings.total),
+                "maxDuration": to_ms(timings.max),
+            }
+            for coordinate, timings in slowest_fields[: self.top_fields]
+        ]
+        return data
+
+
+def slow_operation_log_extension(
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    logger: Union[None, str, logging.Logger, logging.LoggerAdapter] = None,
+    level: int = logging.WARNING,
+    top_fields: int = DEFAULT_TOP_FIELDS,
+):
+    return partial(
+        SlowOperationLogExtension,
+        threshold=threshold,
+        logger=logger,
+        level=level,
+        top_fields=top_fields,
+    )
+
+
+def get_variables_shape(value: Any) -> Any:
+    """Replaces values with names of their types"""
+    if isinstance(value, dict):
+        return {key: get_variables_shape(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [get_variables_shape(value[0])] if value else []
+    if value is None:
+        return "null"
+    return type(value).__name__
+
+
+def to_ms(duration: int) -> float:
+    return round(duration / NS_IN_MS, 3)
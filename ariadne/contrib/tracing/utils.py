@@ -1,6 +1,9 @@
-from graphql import GraphQLResolveInfo, ResponsePath
+from typing import Optional
+
+from graphql import GraphQLObjectType, GraphQLResolveInfo, ResponsePath
 
 from ...resolvers import is_default_resolver
+from ...types import ContextValue
 
 
 def format_path(path: ResponsePath):
@@ -23,6 +26,24 @@ def should_trace(info: GraphQLResolveInfo, trace_default_resolver: bool = False)
     return not (default_resolver_bool or is_introspection_field(info))
 
 
+def is_traceable_field(
+    parent_type: GraphQLObjectType,
+    field_name: str,
+    trace_default_resolver: bool = False,
+) -> bool:
+    """Decides if field should be traced, for use in `should_resolve_field` hook
+
+    Unlike `should_trace` this is called once per field in schema instead of for
+    every resolver call. Fields of introspection types are found by type name
+    instead of walking the response path.
+    """
+    if parent_type.name.startswith("__"):
+        return False
+    if trace_default_resolver:
+        return True
+    return not is_default_resolver(parent_type.fields[field_name].resolve)
+
+
 def is_introspection_field(info: GraphQLResolveInfo):
     path = info.path
     while path:
@@ -43,3 +64,21 @@ def is_introspection_key(key: str):
         "__enumvalue",
         "__typekind",
     ]  # from graphql.type.introspection.introspection_types
+
+
+def get_request_header(context: ContextValue, name: str) -> Optional[str]:
+    """Returns value of HTTP header from request in context or None
+
+    Supports default context values of ASGI and WSGI `GraphQL` applications.
+    """
+    if not isinstance(context, dict):
+        return None
+
+    request = context.get("request")
+    if isinstance(request, dict):
+        return request.get("HTTP_" + name.upper().replace("-", "_"))
+
+    headers = getattr(request, "headers", None)
+    if headers is None:
+        return None
+    return headers.get(name)
@@ -32,6 +32,7 @@ from graphql.type.definition import (
     GraphQLScalarType,
 )
 
+from .scalars import BulkSerializer
 from .types import SchemaBindable
 
 
@@ -97,6 +98,36 @@ class EnumType(SchemaBindable):
             )
 
 
+def get_enum_bulk_serializer(graphql_type: GraphQLEnumType) -> Optional[BulkSerializer]:
+    """Returns bulk serializer looking up names of enum's values
+
+    Enums with replaced `serialize` don't have bulk serializer.
+    """
+    if "serialize" in vars(graphql_type) or (
+        type(graphql_type).serialize is not GraphQLEnumType.serialize
+    ):
+        return None
+
+    # Same as lookup used by GraphQLEnumType.serialize: first name of value wins
+    lookup: Dict[Any, str] = {}
+    for name, enum_value in graphql_type.values.items():
+        value = enum_value.value
+        if value is None or value is Undefined:
+            value = name
+        try:
+            lookup.setdefault(value, name)
+        except TypeError:
+            pass  # Unhashable values are serialized one by one
+
+    def bulk_serialize_enum(values: List[Any]) -> Optional[List[Any]]:
+        try:
+            return [lookup[value] for value in values]
+        except (KeyError, TypeError):
+            return None
+
+    return bulk_serialize_enum
+
+
 def set_default_enum_values_on_schema(schema: GraphQLSchema):
     for type_object in schema.type_map.values():
         if isinstance(type_object, GraphQLEnumType):
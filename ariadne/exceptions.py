@@ -1,3 +1,5 @@
+from graphql import GraphQLError
+
 from .constants import HTTP_STATUS_400_BAD_REQUEST
 
 
@@ -13,6 +15,17 @@ class HttpBadRequestError(HttpError):
     status = HTTP_STATUS_400_BAD_REQUEST
 
 
+class ExecutionCancelledError(GraphQLError):
+    """Reported to extensions when query execution was cancelled
+
+    Execution is cancelled when its task is cancelled, eg. because client has
+    disconnected before result was returned.
+    """
+
+    def __init__(self, message: str = "Execution was cancelled.") -> None:
+        super().__init__(message)
+
+
 class GraphQLFileSyntaxError(Exception):
     def __init__(self, schema_file, message) -> None:
         super().__init__()
@@ -14,6 +14,7 @@ from .enums import (
 )
 from .schema_visitor import SchemaDirectiveVisitor
 from .types import SchemaBindable
+from .utils import cache_schema_snake_case_names
 
 
 def make_executable_schema(
@@ -26,6 +27,7 @@ def make_executable_schema(
 
     ast_document = parse(type_defs)
     schema = build_ast_schema(ast_document)
+    cache_schema_snake_case_names(schema)
     flat_bindables: List[SchemaBindable] = flatten_bindables(*bindables)
 
     for bindable in flat_bindables:
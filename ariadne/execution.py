@@ -0,0 +1,899 @@
+from array import array
+from asyncio import Semaphore, gather, isfuture
+from collections.abc import Mapping
+from types import CoroutineType, GeneratorType
+from typing import (
+    Any,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    cast,
+)
+from weakref import WeakKeyDictionary
+
+from graphql import (
+    ExecutionContext,
+    FieldNode,
+    GraphQLEnumType,
+    GraphQLError,
+    GraphQLLeafType,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLOutputType,
+    GraphQLResolveInfo,
+    GraphQLScalarType,
+    GraphQLSchema,
+    default_field_resolver,
+    is_leaf_type,
+    is_list_type,
+    is_non_null_type,
+    is_object_type,
+    located_error,
+)
+from graphql.execution.execute import get_field_def
+from graphql.execution.values import get_argument_values, get_directive_values
+from graphql.pyutils import AwaitableOrValue, Path, Undefined, inspect, is_iterable
+
+from .enums import get_enum_bulk_serializer
+from .resolvers import get_default_resolver_field_name
+from .scalars import BulkSerializer, get_scalar_bulk_serializer
+
+# Completes resolved value at given path
+Completer = Callable[[Any, Path], AwaitableOrValue[Any]]
+
+# Field of compiled object: response name, name of parent's attribute read by
+# default resolver (None for __typename), field nodes, field type and completer
+# (None if field is executed by ExecutionContext)
+CompiledField = Tuple[
+    str, Optional[str], List[FieldNode], GraphQLOutputType, Optional[Completer]
+]
+
+# Kinds of resolved values
+PLAIN_VALUE = 0
+AWAITABLE_VALUE = 1
+EXCEPTION_VALUE = 2
+
+# Methods of ExecutionContext that compiled completers are used in place of
+COMPILED_METHODS = (
+    "execute_field",
+    "execute_fields",
+    "complete_value",
+    "complete_list_value",
+    "complete_leaf_value",
+    "complete_object_value",
+)
+
+# Concurrency limits of lists items and fields resolvers set with directive,
+# per schema
+schemas_concurrency_limits: WeakKeyDictionary = WeakKeyDictionary()
+
+concurrency_directive = """
+directive @concurrency(limit: Int!) on FIELD_DEFINITION
+"""
+
+FieldCoordinate = Tuple[str, str]
+ConcurrencyLimits = Tuple[Dict[FieldCoordinate, int], Dict[FieldCoordinate, int]]
+
+
+class CompiledExecutionContext(ExecutionContext):
+    """Execution context that completes default resolved fields without overhead
+
+    Selections of objects are compiled once per execution into completers that
+    read values of fields resolved by default resolvers directly from parent
+    objects and complete them without building `GraphQLResolveInfo`, checking
+    field types or awaiting results. Fields with custom resolvers or abstract
+    types are executed as usual.
+
+    It's not used by default and has to be passed as `execution_context_class`
+    to `graphql` or `graphql_sync`, directly or through `concurrency_limit` and
+    `eager_execution` utilities.
+
+    Resolved values are still checked for awaitables, but this check is cached
+    per value's type, so large lists of dicts or objects are completed without
+    per-item `is_awaitable` calls, coroutines or `gather`.
+
+    Compiled completers are not used when middleware (including extensions
+    implementing `resolve` hook) or custom default field resolver are used, or
+    when subclass overrides one of value completion methods.
+
+    Number of awaitable items of single list that are completed at same time
+    can be limited with `max_list_concurrency`, or for list fields with
+    `@concurrency(limit: Int!)` directive. On other fields this directive limits
+    number of field's resolvers awaited at same time during the operation.
+    Results are kept in the same order as items.
+
+    Lists of scalars and enums are serialized at once by bulk serializers, when
+    one is available for item's type. Lists, tuples and objects supporting buffer
+    protocol (eg. `array.array`) are serialized this way. Lists that can't be
+    serialized in bulk are completed item by item.
+
+    With `eager_resolvers` enabled, coroutines returned by resolvers are run
+    until they suspend when resolvers are called. Results of those that return
+    without suspending are completed without scheduling them on the event loop.
+    Because resolvers run immediately, list concurrency limits don't apply to
+    them until they suspend for the first time.
+    """
+
+    max_list_concurrency: Optional[int] = None
+    eager_resolvers: bool = False
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.compiled = (
+            self.middleware_manager is None
+            and self.field_resolver is default_field_resolver
+            and not overrides_compiled_methods(type(self))
+        )
+        self.completers: Dict[Any, Optional[Completer]] = {}
+        self.values_kinds: Dict[type, int] = {}
+        # Incremented every time compiled completer returns awaitable result
+        self.awaitables = 0
+        self.lists_concurrency, self.fields_concurrency = get_concurrency_limits(
+            self.schema
+        )
+        self.semaphores: Dict[FieldCoordinate, Semaphore] = {}
+
+    def execute_field(
+        self,
+        parent_type: GraphQLObjectType,
+        source: Any,
+        field_nodes: List[FieldNode],
+        path: Path,
+    ) -> AwaitableOrValue[Any]:
+        coordinate = self.get_concurrency_coordinate(parent_type, field_nodes)
+        if coordinate or self.eager_resolvers:
+            return self.execute_resolver(
+                parent_type, source, field_nodes, path, coordinate
+            )
+
+        return super().execute_field(parent_type, source, field_nodes, path)
+
+    def get_concurrency_coordinate(
+        self, parent_type: GraphQLObjectType, field_nodes: List[FieldNode]
+    ) -> Optional[FieldCoordinate]:
+        if self.fields_concurrency:
+            coordinate = (parent_type.name, field_nodes[0].name.value)
+            if coordinate in self.fields_concurrency:
+                return coordinate
+        return None
+
+    def execute_resolver(
+        self,
+        parent_type: GraphQLObjectType,
+        source: Any,
+        field_nodes: List[FieldNode],
+        path: Path,
+        coordinate: Optional[FieldCoordinate] = None,
+    ) -> AwaitableOrValue[Any]:
+        """Executes field awaiting its resolver with limited concurrency or eagerly
+
+        If `coordinate` is set, only resolver is awaited under its limit, so
+        nested fields with the same coordinate can't be blocked by their parents.
+        Otherwise, if eager resolvers are enabled, coroutine returned by resolver
+        is stepped eagerly and its result is completed without awaiting if it
+        returns without suspending.
+        """
+        field_def = get_field_def(self.schema, parent_type, field_nodes[0])
+        if not field_def:
+            return Undefined
+
+        return_type = field_def.type
+        resolve_fn = field_def.resolve or self.field_resolver
+        if self.middleware_manager:
+            resolve_fn = self.middleware_manager.get_field_resolver(resolve_fn)
+
+        info = self.build_resolve_info(field_def, field_nodes, parent_type, path)
+        try:
+            args = get_argument_values(field_def, field_nodes[0], self.variable_values)
+            result = resolve_fn(source, info, **args)
+            if (
+                coordinate is None
+                and self.eager_resolvers
+                and isinstance(result, CoroutineType)
+            ):
+                returned, result = step_coroutine(result)
+                if returned:
+                    return self.complete_resolved_field(
+                        return_type, field_nodes, info, path, result
+                    )
+        except Exception as raw_error:
+            error = located_error(raw_error, field_nodes, path.as_list())
+            self.handle_field_error(error, return_type, path)
+            return None
+
+        if not self.is_awaitable(result):
+            return self.complete_resolved_field(
+                return_type, field_nodes, info, path, result
+            )
+
+        async def await_result() -> Any:
+            try:
+                resolved = await self.await_resolver(result, coordinate)
+            except Exception as raw_error:
+                error = located_error(raw_error, field_nodes, path.as_list())
+                self.handle_field_error(error, return_type, path)
+                return None
+
+            completed = self.complete_resolved_field(
+                return_type, field_nodes, info, path, resolved
+            )
+            if self.is_awaitable(completed):
+                return await completed
+            return completed
+
+        return await_result()
+
+    async def await_resolver(
+        self, result: Awaitable[Any], coordinate: Optional[FieldCoordinate]
+    ) -> Any:
+        if coordinate:
+            async with self.get_semaphore(coordinate):
+                return await result
+        return await result
+
+    def get_semaphore(self, coordinate: FieldCoordinate) -> Semaphore:
+        semaphore = self.semaphores.get(coordinate)
+        if semaphore is None:
+            limit = self.fields_concurrency[coordinate]
+            semaphore = self.semaphores[coordinate] = Semaphore(limit)
+        return semaphore
+
+    def complete_resolved_field(
+        self,
+        return_type: GraphQLOutputType,
+        field_nodes: List[FieldNode],
+        info: GraphQLResolveInfo,
+        path: Path,
+        result: Any,
+    ) -> AwaitableOrValue[Any]:
+        try:
+            completed = self.complete_value(
+                return_type, field_nodes, info, path, result
+            )
+        except Exception as raw_error:
+            error = located_error(raw_error, field_nodes, path.as_list())
+            self.handle_field_error(error, return_type, path)
+            return None
+
+        if self.is_awaitable(completed):
+            return self.await_completed(completed, return_type, field_nodes, path)
+        return completed
+
+    def complete_list_value(
+        self,
+        return_type: GraphQLList[GraphQLOutputType],
+        field_nodes: List[FieldNode],
+        info: GraphQLResolveInfo,
+        path: Path,
+        result: Any,
+    ) -> AwaitableOrValue[List[Any]]:
+        if self.compiled:
+            key = (
+                return_type,
+                info.parent_type,
+                *[id(field_node) for field_node in field_nodes],
+            )
+            if key in self.completers:
+                complete_list = self.completers[key]
+            else:
+                complete_list = self.completers[key] = self.compile_list(
+                    return_type, field_nodes, info.parent_type, info.field_name
+                )
+            if complete_list:
+                return complete_list(result, path)
+
+        if self.get_list_concurrency(info.parent_type, info.field_name):
+            complete_list = self.create_list_completer(
+                return_type,
+                self.create_item_completer(return_type.of_type, field_nodes, info),
+                field_nodes,
+                info.parent_type,
+                info.field_name,
+            )
+            return complete_list(result, path)
+
+        return super().complete_list_value(return_type, field_nodes, info, path, result)
+
+    def complete_object_value(
+        self,
+        return_type: GraphQLObjectType,
+        field_nodes: List[FieldNode],
+        info: GraphQLResolveInfo,
+        path: Path,
+        result: Any,
+    ) -> AwaitableOrValue[Dict[str, Any]]:
+        if self.compiled and not return_type.is_type_of:
+            complete_fields = self.get_fields_completer(return_type, field_nodes)
+            if complete_fields:
+                return complete_fields(result, path)
+
+        return super().complete_object_value(
+            return_type, field_nodes, info, path, result
+        )
+
+    def get_value_kind(self, value: Any) -> int:
+        if isinstance(value, Exception):
+            kind = EXCEPTION_VALUE
+        elif self.is_awaitable(value):
+            kind = AWAITABLE_VALUE
+        else:
+            kind = PLAIN_VALUE
+
+        # Generator based coroutines are awaitable depending on their flags
+        if not isinstance(value, GeneratorType):
+            self.values_kinds[value.__class__] = kind
+        return kind
+
+    def get_fields_completer(
+        self, return_type: GraphQLObjectType, field_nodes: List[FieldNode]
+    ) -> Optional[Completer]:
+        key = (return_type, *[id(field_node) for field_node in field_nodes])
+        if key in self.completers:
+            return self.completers[key]
+
+        completer = self.completers[key] = self.compile_fields(return_type, field_nodes)
+        return completer
+
+    def compile_value(
+        self,
+        return_type: GraphQLOutputType,
+        field_nodes: List[FieldNode],
+        parent_type: GraphQLObjectType,
+        field_name: str,
+    ) -> Optional[Completer]:
+        if is_non_null_type(return_type):
+            return self.compile_non_null(
+                cast(GraphQLNonNull, return_type), field_nodes, parent_type, field_name
+            )
+        if is_list_type(return_type):
+            return self.compile_list(
+                cast(GraphQLList, return_type), field_nodes, parent_type, field_name
+            )
+        if is_leaf_type(return_type):
+            return compile_leaf(cast(GraphQLLeafType, return_type))
+        if is_object_type(return_type):
+            return self.compile_object(
+                cast(GraphQLObjectType, return_type), field_nodes
+            )
+        return None  # Abstract types are completed by ExecutionContext
+
+    def compile_non_null(
+        self,
+        return_type: GraphQLNonNull,
+        field_nodes: List[FieldNode],
+        parent_type: GraphQLObjectType,
+        field_name: str,
+    ) -> Optional[Completer]:
+        complete_inner = self.compile_value(
+            return_type.of_type, field_nodes, parent_type, field_name
+        )
+        if not complete_inner:
+            return None
+
+        message = (
+            "Cannot return null for non-nullable field"
+            f" {parent_type.name}.{field_name}."
+        )
+
+        def complete_non_null(value: Any, path: Path) -> AwaitableOrValue[Any]:
+            completed = complete_inner(value, path)
+            if completed is None:
+                raise TypeError(message)
+            return completed
+
+        return complete_non_null
+
+    def compile_list(
+        self,
+        return_type: GraphQLList,
+        field_nodes: List[FieldNode],
+        parent_type: GraphQLObjectType,
+        field_name: str,
+    ) -> Optional[Completer]:
+        item_type = return_type.of_type
+        complete_item = self.compile_value(
+            item_type, field_nodes, parent_type, field_name
+        )
+        if not complete_item:
+            return None
+
+        complete_list = self.create_list_completer(
+            return_type, complete_item, field_nodes, parent_type, field_name
+        )
+
+        if is_non_null_type(item_type):
+            item_type = cast(GraphQLNonNull, item_type).of_type
+        if is_leaf_type(item_type):
+            bulk_serialize = get_bulk_serializer(cast(GraphQLLeafType, item_type))
+            if bulk_serialize:
+                return compile_leaf_list(complete_list, bulk_serialize)
+
+        return complete_list
+
+    def create_list_completer(
+        self,
+        return_type: GraphQLList,
+        complete_item: Completer,
+        field_nodes: List[FieldNode],
+        parent_type: GraphQLObjectType,
+        field_name: str,
+    ) -> Completer:
+        item_type = return_type.of_type
+        concurrency = self.get_list_concurrency(parent_type, field_name)
+        values_kinds = self.values_kinds
+        complete_list_value = super().complete_list_value
+
+        def complete_list(value: Any, path: Path) -> AwaitableOrValue[Any]:
+            if value is None or value is Undefined:
+                return None
+
+            if not is_iterable(value):
+                if isinstance(value, AsyncIterable):
+                    self.awaitables += 1
+                    info = self.build_resolve_info(
+                        parent_type.fields[field_name], field_nodes, parent_type, path
+                    )
+                    return complete_list_value(
+                        return_type, field_nodes, info, path, value
+                    )
+
+                raise GraphQLError(
+                    "Expected Iterable, but did not find one for field"
+                    f" '{parent_type.name}.{field_name}'."
+                )
+
+            awaitables = self.awaitables
+            results: List[Any] = []
+            append_result = results.append
+            for index, item in enumerate(value):
+                item_path = path.add_key(index, None)
+                try:
+                    kind = values_kinds.get(item.__class__)
+                    if kind is None:
+                        kind = self.get_value_kind(item)
+                    if kind == PLAIN_VALUE:
+                        completed = complete_item(item, item_path)
+                    elif kind == AWAITABLE_VALUE:
+                        completed = self.complete_awaitable(
+                            complete_item, item, item_path
+                        )
+                        self.awaitables += 1
+                    else:
+                        raise item
+                except Exception as raw_error:
+                    error = located_error(raw_error, field_nodes, item_path.as_list())
+                    self.handle_field_error(error, item_type, item_path)
+                    completed = None
+                append_result(completed)
+
+            if self.awaitables == awaitables:
+                return results
+
+            return self.gather_items(results, item_type, field_nodes, path, concurrency)
+
+        return complete_list
+
+    def create_item_completer(
+        self,
+        item_type: GraphQLOutputType,
+        field_nodes: List[FieldNode],
+        info: GraphQLResolveInfo,
+    ) -> Completer:
+        """Creates completer of list items that uses ExecutionContext"""
+
+        def complete_item(value: Any, path: Path) -> AwaitableOrValue[Any]:
+            completed = self.complete_value(item_type, field_nodes, info, path, value)
+            if self.is_awaitable(completed):
+                self.awaitables += 1
+            return completed
+
+        return complete_item
+
+    def get_list_concurrency(
+        self, parent_type: GraphQLObjectType, field_name: str
+    ) -> Optional[int]:
+        return self.lists_concurrency.get(
+            (parent_type.name, field_name), self.max_list_concurrency
+        )
+
+    def compile_object(
+        self, return_type: GraphQLObjectType, field_nodes: List[FieldNode]
+    ) -> Optional[Completer]:
+        if return_type.is_type_of:
+            return None
+
+        complete_fields = self.get_fields_completer(return_type, field_nodes)
+        if not complete_fields:
+            return None
+
+        def complete_object(value: Any, path: Path) -> AwaitableOrValue[Any]:
+            if value is None or value is Undefined:
+                return None
+            return complete_fields(value, path)
+
+        return complete_object
+
+    def compile_fields(
+        self, return_type: GraphQLObjectType, field_nodes: List[FieldNode]
+    ) -> Optional[Completer]:
+        type_name = return_type.name
+
+        def complete_typename(*_) -> str:
+            return type_name
+
+        fields: List[CompiledField] = []
+        has_compiled_fields = False
+        for response_name, sub_field_nodes in self.collect_subfields(
+            return_type, field_nodes
+        ).items():
+            field_name = sub_field_nodes[0].name.value
+            if field_name == "__typename":
+                fields.append(
+                    (
+                        response_name,
+                        None,
+                        sub_field_nodes,
+                        return_type,
+                        complete_typename,
+                    )
+                )
+                continue
+
+            field = return_type.fields.get(field_name)
+            if field is None:
+                continue  # Skipped by ExecutionContext
+
+            # Checked per execution, so resolvers set after first execution are used
+            attr = None
+            if not type_name.startswith("__"):  # Introspection types
+                attr = get_default_resolver_field_name(field.resolve, field_name)
+            completer = None
+            if attr:
+                completer = self.compile_value(
+                    field.type, sub_field_nodes, return_type, field_name
+                )
+            if completer:
+                has_compiled_fields = True
+            fields.append((response_name, attr, sub_field_nodes, field.type, completer))
+
+        if not has_compiled_fields:
+            return None
+
+        values_kinds = self.values_kinds
+        execute_field = self.execute_field
+        is_awaitable = self.is_awaitable
+
+        def complete_fields(source: Any, path: Path) -> AwaitableOrValue[Any]:
+            awaitables = self.awaitables
+            is_mapping = isinstance(source, Mapping)
+            results: Dict[str, Any] = {}
+            for response_name, attr, sub_field_nodes, field_type, complete in fields:
+                field_path = Path(path, response_name, type_name)
+                if complete is None:
+                    completed = execute_field(
+                        return_type, source, sub_field_nodes, field_path
+                    )
+                    if is_awaitable(completed):
+                        self.awaitables += 1
+                    results[response_name] = completed
+                    continue
+
+                if attr is None:
+                    results[response_name] = type_name
+                    continue
+
+                try:
+                    if is_mapping:
+                        value = source.get(attr)
+                    else:
+                        value = getattr(source, attr, None)
+
+                    if callable(value):
+                        # Default resolver calls methods with info and arguments
+                        completed = execute_field(
+                            return_type, source, sub_field_nodes, field_path
+                        )
+                        if is_awaitable(completed):
+                            self.awaitables += 1
+                        results[response_name] = completed
+                        continue
+
+                    kind = values_kinds.get(value.__class__)
+                    if kind is None:
+                        kind = self.get_value_kind(value)
+                    if kind == PLAIN_VALUE:
+                        completed = complete(value, field_path)
+                    elif kind == AWAITABLE_VALUE:
+                        completed = self.complete_awaitable(complete, value, field_path)
+                        self.awaitables += 1
+                    else:
+                        raise value
+                except Exception as raw_error:
+                    error = located_error(
+                        raw_error, sub_field_nodes, field_path.as_list()
+                    )
+                    self.handle_field_error(error, field_type, field_path)
+                    completed = None
+                results[response_name] = completed
+
+            if self.awaitables == awaitables:
+                return results
+
+            return self.gather_fields(results, fields, path, type_name)
+
+        return complete_fields
+
+    async def complete_awaitable(
+        self, complete: Completer, value: Awaitable[Any], path: Path
+    ) -> Any:
+        value = await value
+        if isinstance(value, Exception):
+            raise value
+        completed = complete(value, path)
+        if self.is_awaitable(completed):
+            return await cast(Awaitable[Any], completed)
+        return completed
+
+    async def await_completed(
+        self,
+        completed: Awaitable[Any],
+        return_type: GraphQLOutputType,
+        field_nodes: List[FieldNode],
+        path: Path,
+    ) -> Any:
+        try:
+            return await completed
+        except Exception as raw_error:
+            error = located_error(raw_error, field_nodes, path.as_list())
+            self.handle_field_error(error, return_type, path)
+            return None
+
+    async def gather_items(
+        self,
+        results: List[Any],
+        item_type: GraphQLOutputType,
+        field_nodes: List[FieldNode],
+        path: Path,
+        concurrency: Optional[int] = None,
+    ) -> List[Any]:
+        indices = [
+            index for index, result in enumerate(results) if self.is_awaitable(result)
+        ]
+        awaitables = [
+            self.await_completed(
+                results[index], item_type, field_nodes, path.add_key(index, None)
+            )
+            for index in indices
+        ]
+        if concurrency:
+            completed = await gather_limited(awaitables, concurrency)
+        else:
+            completed = await gather(*awaitables)
+        for index, result in zip(indices, completed):
+            results[index] = result
+        return results
+
+    async def gather_fields(
+        self,
+        results: Dict[str, Any],
+        fields: List[CompiledField],
+        path: Path,
+        type_name: str,
+    ) -> Dict[str, Any]:
+        names = []
+        awaitables = []
+        for response_name, _, field_nodes, field_type, _ in fields:
+            result = results[response_name]
+            if self.is_awaitable(result):
+                names.append(response_name)
+                awaitables.append(
+                    self.await_completed(
+                        result,
+                        field_type,
+                        field_nodes,
+                        Path(path, response_name, type_name),
+                    )
+                )
+        results.update(zip(names, await gather(*awaitables)))
+        return results
+
+
+class SuspendedCoroutine:
+    """Awaitable resuming coroutine that suspended when it was stepped eagerly"""
+
+    __slots__ = ("coroutine", "yielded")
+
+    def __init__(self, coroutine: Coroutine, yielded: Any) -> None:
+        self.coroutine = coroutine
+        self.yielded = yielded
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        return resume_coroutine(self.coroutine, self.yielded)
+
+
+def step_coroutine(coroutine: Coroutine) -> Tuple[bool, Any]:
+    """Runs coroutine until it suspends or returns
+
+    Returns `True` and coroutine's result if it returned, or `False` and
+    awaitable resuming it if it suspended.
+    """
+    try:
+        yielded = coroutine.send(None)
+    except StopIteration as stop:
+        return True, stop.value
+
+    if isfuture(yielded):
+        # Future is yielded to the event loop later. Reset flag like task does
+        # so other coroutines can await it meanwhile.
+        yielded._asyncio_future_blocking = False  # pylint: disable=protected-access
+    return False, SuspendedCoroutine(coroutine, yielded)
+
+
+def resume_coroutine(coroutine: Coroutine, yielded: Any) -> Generator[Any, Any, Any]:
+    # Passes value yielded by coroutine (eg. awaited future) to the event loop,
+    # then drives coroutine with values and errors sent back by the loop
+    if isfuture(yielded):
+        # Tells the task that future was awaited, like Future.__await__ does
+        yielded._asyncio_future_blocking = True  # pylint: disable=protected-access
+
+    while True:
+        try:
+            sent = yield yielded
+        except GeneratorExit:
+            coroutine.close()
+            raise
+        except BaseException as error:  # pylint: disable=broad-except
+            try:
+                yielded = coroutine.throw(error)
+            except StopIteration as stop:
+                return stop.value
+        else:
+            try:
+                yielded = coroutine.send(sent)
+            except StopIteration as stop:
+                return stop.value
+
+
+async def gather_limited(awaitables: Sequence[Awaitable[Any]], limit: int) -> List[Any]:
+    """Awaits awaitables, no more than `limit` at same time, keeping their order"""
+    results: List[Any] = [None] * len(awaitables)
+    pending = iter(enumerate(awaitables))
+
+    async def worker() -> None:
+        for index, awaitable in pending:
+            results[index] = await awaitable
+
+    await gather(*(worker() for _ in range(min(limit, len(awaitables)))))
+    return results
+
+
+def compile_leaf(return_type: GraphQLLeafType) -> Completer:
+    serialize = return_type.serialize
+
+    def complete_leaf(value: Any, _: Path) -> Any:
+        if value is None or value is Undefined:
+            return None
+
+        serialized = serialize(value)
+        if serialized is Undefined or serialized is None:
+            raise TypeError(
+                f"Expected `{inspect(return_type)}.serialize({inspect(value)})`"
+                f" to return non-nullable value, returned: {inspect(serialized)}"
+            )
+        return serialized
+
+    return complete_leaf
+
+
+def compile_leaf_list(
+    complete_list: Completer, bulk_serialize: BulkSerializer
+) -> Completer:
+    # Serializes whole list at once, falling back to completing items one by one
+    # when list can't be serialized this way (eg. it contains invalid values)
+    def complete_leaf_list(value: Any, path: Path) -> AwaitableOrValue[Any]:
+        items = get_leaf_list_items(value)
+        if items is not None:
+            serialized = bulk_serialize(items)
+            if serialized is not None:
+                return serialized
+
+        return complete_list(value, path)
+
+    return complete_leaf_list
+
+
+def get_bulk_serializer(return_type: GraphQLLeafType) -> Optional[BulkSerializer]:
+    if isinstance(return_type, GraphQLEnumType):
+        return get_enum_bulk_serializer(return_type)
+    return get_scalar_bulk_serializer(cast(GraphQLScalarType, return_type))
+
+
+def get_leaf_list_items(value: Any) -> Optional[List[Any]]:
+    """Returns items of list, tuple or object supporting buffer protocol
+
+    Returns `None` for other values, which are completed item by item.
+    """
+    if isinstance(value, list):
+        return value
+    if isinstance(value, tuple):
+        return list(value)
+    if isinstance(value, array):
+        return value.tolist()
+    if value is None or isinstance(value, (str, bytes, bytearray)):
+        return None
+
+    try:
+        with memoryview(value) as view:
+            return view.tolist()
+    except (TypeError, NotImplementedError):
+        return None
+
+
+def overrides_compiled_methods(execution_context_class: type) -> bool:
+    return any(
+        getattr(execution_context_class, name)
+        is not getattr(CompiledExecutionContext, name)
+        for name in COMPILED_METHODS
+    )
+
+
+def get_concurrency_limits(schema: GraphQLSchema) -> ConcurrencyLimits:
+    limits = schemas_concurrency_limits.get(schema)
+    if limits is None:
+        limits = schemas_concurrency_limits[schema] = find_concurrency_limits(schema)
+    return limits
+
+
+def find_concurrency_limits(schema: GraphQLSchema) -> ConcurrencyLimits:
+    lists_limits: Dict[FieldCoordinate, int] = {}
+    fields_limits: Dict[FieldCoordinate, int] = {}
+    directive = schema.get_directive("concurrency")
+    if not directive:
+        return lists_limits, fields_limits
+
+    for type_object in schema.type_map.values():
+        if not isinstance(type_object, GraphQLObjectType):
+            continue
+        for field_name, field in type_object.fields.items():
+            if not field.ast_node:
+                continue
+            values = get_directive_values(directive, field.ast_node)
+            if not values:
+                continue
+            field_type = field.type
+            if is_non_null_type(field_type):
+                field_type = cast(GraphQLNonNull, field_type).of_type
+            if is_list_type(field_type):
+                lists_limits[(type_object.name, field_name)] = values["limit"]
+            else:
+                fields_limits[(type_object.name, field_name)] = values["limit"]
+    return lists_limits, fields_limits
+
+
+def concurrency_limit(*, max_list_concurrency: int) -> Type[ExecutionContext]:
+    class _CompiledExecutionContext(CompiledExecutionContext):
+        pass
+
+    _CompiledExecutionContext.max_list_concurrency = max_list_concurrency
+
+    return _CompiledExecutionContext
+
+
+def eager_execution(
+    execution_context_class: Type[CompiledExecutionContext] = CompiledExecutionContext,
+) -> Type[ExecutionContext]:
+    class _EagerExecutionContext(execution_context_class):  # type: ignore
+        pass
+
+    _EagerExecutionContext.eager_resolvers = True
+
+    return _EagerExecutionContext
@@ -0,0 +1,203 @@
+from types import CoroutineType
+from typing import (
+    Any,
+    Awaitable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sized,
+    Type,
+    cast,
+)
+
+from graphql import (
+    FieldNode,
+    GraphQLError,
+    GraphQLList,
+    GraphQLObjectType,
+    GraphQLOutputType,
+    GraphQLResolveInfo,
+    is_leaf_type,
+)
+from graphql.pyutils import AwaitableOrValue, Path
+
+from .execution import CompiledExecutionContext, FieldCoordinate
+
+# Estimated sizes of JSON punctuation around values
+KEY_OVERHEAD = 4  # "key":
+VALUE_OVERHEAD = 1  # ,
+
+
+class ExecutionBudgetExceeded(GraphQLError):
+    """Raised when execution crosses one of limits of its budget"""
+
+
+class BudgetExecutionContext(CompiledExecutionContext):
+    """Execution context that aborts execution when it crosses its budget
+
+    Budget limits number of resolver calls, number of items in completed lists,
+    number of nodes in result (fields and list items) and estimated size of
+    result serialized to JSON. Limits set to `None` are not checked.
+
+    When limit is crossed, no more fields are resolved and whole result is
+    replaced with error. Async resolvers check budget before they are awaited,
+    so resolvers of sibling fields scheduled together don't run after it.
+
+    Budget has to count every field and list item, so compiled completers are
+    not used, but concurrency limits and eager resolvers are still supported.
+    """
+
+    max_resolver_calls: Optional[int] = None
+    max_list_items: Optional[int] = None
+    max_result_nodes: Optional[int] = None
+    max_result_bytes: Optional[int] = None
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.resolver_calls = 0
+        self.list_items = 0
+        self.result_nodes = 0
+        self.result_bytes = 0
+        self.budget_error: Optional[ExecutionBudgetExceeded] = None
+
+    def check_budget(self) -> None:
+        if self.budget_error:
+            raise self.budget_error
+
+        if (
+            self.max_resolver_calls is not None
+            and self.resolver_calls > self.max_resolver_calls
+        ):
+            self.set_budget_error("resolver calls", self.max_resolver_calls)
+        elif self.max_list_items is not None and self.list_items > self.max_list_items:
+            self.set_budget_error("list items", self.max_list_items)
+        elif (
+            self.max_result_nodes is not None
+            and self.result_nodes > self.max_result_nodes
+        ):
+            self.set_budget_error("result nodes", self.max_result_nodes)
+        elif (
+            self.max_result_bytes is not None
+            and self.result_bytes > self.max_result_bytes
+        ):
+            self.set_budget_error("result bytes", self.max_result_bytes)
+
+    def set_budget_error(self, limit_name: str, limit: int) -> None:
+        self.budget_error = ExecutionBudgetExceeded(
+            "Execution was aborted because it exceeded the limit of %d %s."
+            % (limit, limit_name)
+        )
+        raise self.budget_error
+
+    def execute_field(
+        self,
+        parent_type: GraphQLObjectType,
+        source: Any,
+        field_nodes: List[FieldNode],
+        path: Path,
+    ) -> AwaitableOrValue[Any]:
+        self.resolver_calls += 1
+        self.result_nodes += 1
+        self.result_bytes += len(cast(str, path.key)) + KEY_OVERHEAD
+        self.check_budget()
+        # Resolvers are always called by execute_resolver, so awaiting them
+        # can be skipped after budget is exceeded
+        return self.execute_resolver(
+            parent_type,
+            source,
+            field_nodes,
+            path,
+            self.get_concurrency_coordinate(parent_type, field_nodes),
+        )
+
+    async def await_resolver(
+        self, result: Awaitable[Any], coordinate: Optional[FieldCoordinate]
+    ) -> Any:
+        if self.budget_error:
+            if isinstance(result, CoroutineType):
+                result.close()  # Resolver was called but never started
+            raise self.budget_error
+        return await super().await_resolver(result, coordinate)
+
+    def handle_field_error(self, error: GraphQLError, *args) -> None:
+        if isinstance(error, ExecutionBudgetExceeded) or isinstance(
+            error.original_error, ExecutionBudgetExceeded
+        ):
+            raise error  # Budget errors are not limited to single field
+        return super().handle_field_error(error, *args)
+
+    def complete_list_value(
+        self,
+        return_type: GraphQLList[GraphQLOutputType],
+        field_nodes: List[FieldNode],
+        info: GraphQLResolveInfo,
+        path: Path,
+        result: Any,
+    ) -> AwaitableOrValue[List[Any]]:
+        if isinstance(result, Sized) and not isinstance(result, (str, bytes, dict)):
+            self.add_list_items(len(result))
+        elif isinstance(result, Iterable):
+            result = self.count_list_items(result)
+        return super().complete_list_value(return_type, field_nodes, info, path, result)
+
+    def count_list_items(self, items: Iterable[Any]) -> Iterator[Any]:
+        for item in items:
+            self.add_list_items(1)
+            yield item
+
+    def add_list_items(self, count: int) -> None:
+        self.list_items += count
+        self.result_nodes += count
+        self.result_bytes += count * VALUE_OVERHEAD
+        self.check_budget()
+
+    def complete_value(
+        self,
+        return_type: GraphQLOutputType,
+        field_nodes: List[FieldNode],
+        info: GraphQLResolveInfo,
+        path: Path,
+        result: Any,
+    ) -> AwaitableOrValue[Any]:
+        completed = super().complete_value(return_type, field_nodes, info, path, result)
+        if self.max_result_bytes is not None and is_leaf_type(return_type):
+            self.result_bytes += estimate_json_size(completed)
+            self.check_budget()
+        return completed
+
+
+def estimate_json_size(value: Any) -> int:
+    if value is None:
+        return 4
+    if isinstance(value, str):
+        return len(value) + 2
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_json_size(item) + VALUE_OVERHEAD for item in value) + 2
+    if isinstance(value, dict):
+        return (
+            sum(
+                len(str(key)) + KEY_OVERHEAD + estimate_json_size(item)
+                for key, item in value.items()
+            )
+            + 2
+        )
+    return len(str(value))
+
+
+def execution_budget(
+    *,
+    max_resolver_calls: Optional[int] = None,
+    max_list_items: Optional[int] = None,
+    max_result_nodes: Optional[int] = None,
+    max_result_bytes: Optional[int] = None,
+) -> Type[BudgetExecutionContext]:
+    class _BudgetExecutionContext(BudgetExecutionContext):
+        pass
+
+    _BudgetExecutionContext.max_resolver_calls = max_resolver_calls
+    _BudgetExecutionContext.max_list_items = max_list_items
+    _BudgetExecutionContext.max_result_nodes = max_result_nodes
+    _BudgetExecutionContext.max_result_bytes = max_result_bytes
+
+    return _BudgetExecutionContext
@@ -1,14 +1,26 @@
 from contextlib import contextmanager
-from typing import List, Optional
+from typing import Any, Callable, FrozenSet, List, Optional, Tuple
+from weakref import WeakKeyDictionary
 
-from graphql import GraphQLError
+from graphql import DocumentNode, GraphQLError, GraphQLObjectType, GraphQLSchema
 from graphql.execution import MiddlewareManager
 
-from .types import ContextValue, ExtensionList
+from .types import ContextValue, Extension, ExtensionList, ExtensionSync
+
+ExtensionFields = FrozenSet[Tuple[str, str]]
+
+# Fields that extensions created by given factory want to resolve, per schema
+extensions_fields: WeakKeyDictionary = WeakKeyDictionary()
 
 
 class ExtensionManager:
-    __slots__ = ("context", "extensions", "extensions_reversed")
+    __slots__ = (
+        "context",
+        "extensions",
+        "extensions_reversed",
+        "resolving_extensions",
+        "document_parsed_hooks",
+    )
 
     def __init__(
         self,
@@ -20,15 +32,38 @@ class ExtensionManager:
         if extensions:
             self.extensions = tuple(ext() for ext in extensions)
             self.extensions_reversed = tuple(reversed(self.extensions))
+            self.resolving_extensions = tuple(
+                (factory, ext)
+                for factory, ext in zip(extensions, self.extensions)
+                if is_hook_overridden(ext, "resolve")
+            )
+            # Extensions implementing protocol may not define hooks added later
+            self.document_parsed_hooks = tuple(
+                ext.document_parsed
+                for ext in self.extensions
+                if is_hook_overridden(ext, "document_parsed")
+            )
         else:
             self.extensions_reversed = self.extensions = tuple()
+            self.resolving_extensions = tuple()
+            self.document_parsed_hooks = tuple()
 
     def as_middleware_manager(
         self, manager: Optional[MiddlewareManager]
-    ) -> MiddlewareManager:
+    ) -> Optional[MiddlewareManager]:
+        # Called after request started, when extensions know if they will
+        # resolve fields in this request (eg. if it was sampled for tracing)
+        resolvers = tuple(
+            get_extension_resolver(factory, ext)
+            for factory, ext in self.resolving_extensions
+            if not is_hook_overridden(ext, "should_resolve")
+            or ext.should_resolve(self.context)
+        )
+        if not resolvers:
+            return manager
         if manager and manager.middlewares:
-            return MiddlewareManager(*manager.middlewares, *self.extensions)
-        return MiddlewareManager(*self.extensions)
+            return ExtensionsMiddlewareManager(manager, *resolvers)
+        return MiddlewareManager(*resolvers)
 
     @contextmanager
     def request(self):
@@ -40,6 +75,15 @@ class ExtensionManager:
             for ext in self.extensions_reversed:
                 ext.request_finished(self.context)
 
+    def document_parsed(
+        self,
+        document: DocumentNode,
+        operation_name: Optional[str],
+        variables: Optional[dict],
+    ):
+        for hook in self.document_parsed_hooks:
+            hook(document, operation_name, variables, self.context)
+
     def has_errors(self, errors: List[GraphQLError]):
         for ext in self.extensions:
             ext.has_errors(errors, self.context)
@@ -51,3 +95,72 @@ class ExtensionManager:
             if ext_data:
                 data.update(ext_data)
         return data
+
+
+class ExtensionsMiddlewareManager(MiddlewareManager):
+    """Wraps resolvers already wrapped by other manager with extensions
+
+    Resolvers wrapped by long-lived manager's middleware are cached by that manager
+    between requests, only extensions are added on top of them per request.
+    """
+
+    def __init__(self, manager: MiddlewareManager, *extensions: Any):
+        super().__init__(*extensions)
+        self.manager = manager
+        self.middlewares = manager.middlewares + extensions
+
+    def get_field_resolver(self, field_resolver: Callable) -> Callable:
+        return super().get_field_resolver(
+            self.manager.get_field_resolver(field_resolver)
+        )
+
+
+def is_hook_overridden(extension: Any, hook_name: str) -> bool:
+    hook = getattr(type(extension), hook_name, None)
+    return hook is not None and hook not in (
+        getattr(Extension, hook_name),
+        getattr(ExtensionSync, hook_name),
+    )
+
+
+def get_extension_resolver(factory: Any, extension: Extension) -> Any:
+    if not is_hook_overridden(extension, "should_resolve_field"):
+        return extension
+
+    fields: Optional[ExtensionFields] = None
+
+    def resolve_filtered(next_: Callable, obj: Any, info, **kwargs):
+        nonlocal fields
+        if fields is None:
+            fields = get_extension_fields(factory, extension, info.schema)
+        if (info.parent_type.name, info.field_name) in fields:
+            return extension.resolve(next_, obj, info, **kwargs)
+        return next_(obj, info, **kwargs)
+
+    return resolve_filtered
+
+
+def get_extension_fields(
+    factory: Any, extension: Extension, schema: GraphQLSchema
+) -> ExtensionFields:
+    try:
+        schemas_fields = extensions_fields.setdefault(factory, WeakKeyDictionary())
+    except TypeError:
+        # Factory can't be weak referenced, skip the cache
+        return find_extension_fields(extension, schema)
+
+    if schema not in schemas_fields:
+        schemas_fields[schema] = find_extension_fields(extension, schema)
+    return schemas_fields[schema]
+
+
+def find_extension_fields(
+    extension: Extension, schema: GraphQLSchema
+) -> ExtensionFields:
+    return frozenset(
+        (type_object.name, field_name)
+        for type_object in schema.type_map.values()
+        if isinstance(type_object, GraphQLObjectType)
+        for field_name in type_object.fields
+        if extension.should_resolve_field(type_object, field_name)
+    )
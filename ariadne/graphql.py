@@ -1,4 +1,4 @@
-from asyncio import ensure_future
+from asyncio import CancelledError, ensure_future
 from inspect import isawaitable
 from logging import Logger, LoggerAdapter
 from typing import (
@@ -30,9 +30,18 @@ from graphql.execution import MiddlewareManager
 from graphql.validation import specified_rules, validate
 from graphql.validation.rules import ASTValidationRule
 
+from .exceptions import ExecutionCancelledError
 from .extensions import ExtensionManager
 from .format_error import format_error
+from .introspection_cache import IntrospectionCache, is_introspection_query
 from .logger import log_error
+from .rate_limit import (
+    CostRateLimiter,
+    RateLimitResult,
+    add_rate_limit_to_response,
+    validate_rate_limit,
+)
+from .scheduling import OperationScheduler
 from .types import (
     ErrorFormatter,
     ExtensionList,
@@ -42,6 +51,8 @@ from .types import (
     ValidationRules,
 )
 from .validation.introspection_disabled import IntrospectionDisabledRule
+from .validation.query_cost import collect_query_costs
+from .validation.query_limits import QueryLimits
 
 
 async def graphql(
@@ -58,11 +69,16 @@ async def graphql(
     middleware: Optional[MiddlewareManager] = None,
     extensions: Optional[ExtensionList] = None,
     execution_context_class: Optional[Type[ExecutionContext]] = None,
+    query_limits: Optional[QueryLimits] = None,
+    introspection_cache: Optional[IntrospectionCache] = None,
+    rate_limiter: Optional[CostRateLimiter] = None,
+    scheduler: Optional[OperationScheduler] = None,
     **kwargs,
 ) -> GraphQLResult:
     extension_manager = ExtensionManager(extensions, context_value)
+    rate_limit: Optional[RateLimitResult] = None
 
-    with extension_manager.request():
+    with collect_query_costs(), extension_manager.request():
         try:
             validate_data(data)
             query, variables, operation_name = (
@@ -71,7 +87,30 @@ async def graphql(
                 data.get("operationName"),
             )
 
-            document = parse_query(query)
+            if not introspection or callable(validation_rules):
+                introspection_cache = None  # Cached results would skip these checks
+
+            if introspection_cache:
+                cached_result = introspection_cache.get_result(schema, data)
+                if cached_result is not None:
+                    introspection_cache.check_rate_limit(context_value)
+                    return handle_query_result(
+                        ExecutionResult(cached_result),
+                        logger=logger,
+                        error_formatter=error_formatter,
+                        debug=debug,
+                        extension_manager=extension_manager,
+                    )
+
+            if query_limits:
+                query_limits.validate_query_size(query)
+                document = parse_query(query, max_tokens=query_limits.max_tokens)
+                limits_errors = query_limits.validate_document(document)
+            else:
+                document = parse_query(query)
+                limits_errors = []
+
+            extension_manager.document_parsed(document, operation_name, variables)
 
             if callable(validation_rules):
                 validation_rules = cast(
@@ -79,7 +118,7 @@ async def graphql(
                     validation_rules(context_value, document, data),
                 )
 
-            validation_errors = validate_query(
+            validation_errors = limits_errors or validate_query(
                 schema, document, validation_rules, enable_introspection=introspection
             )
             if validation_errors:
@@ -91,25 +130,53 @@ async def graphql(
                     extension_manager=extension_manager,
                 )
 
+            if introspection_cache:
+                if is_introspection_query(document, operation_name):
+                    introspection_cache.check_rate_limit(context_value)
+                else:
+                    introspection_cache = None
+
+            if rate_limiter:
+                consumed = rate_limiter.consume(context_value, document, operation_name)
+                if isawaitable(consumed):
+                    rate_limit = await consumed
+                else:
+                    rate_limit = cast(Optional[RateLimitResult], consumed)
+                validate_rate_limit(rate_limit)
+
             if callable(root_value):
                 root_value = root_value(context_value, document)
                 if isawaitable(root_value):
                     root_value = await root_value
 
-            result = execute(
-                schema,
-                document,
-                root_value=root_value,
-                context_value=context_value,
-                variable_values=variables,
-                operation_name=operation_name,
-                execution_context_class=execution_context_class,
-                middleware=extension_manager.as_middleware_manager(middleware),
-                **kwargs,
-            )
+            if scheduler:
+                priority_class = scheduler.classify(document, operation_name)
+                await priority_class.acquire()
+
+            try:
+                result = execute(
+                    schema,
+                    document,
+                    root_value=root_value,
+                    context_value=context_value,
+                    variable_values=variables,
+                    operation_name=operation_name,
+                    execution_context_class=execution_context_class,
+                    middleware=extension_manager.as_middleware_manager(middleware),
+                    **kwargs,
+                )
 
-            if isawaitable(result):
-                result = await cast(Awaitable[ExecutionResult], result)
+                if isawaitable(result):
+                    result = await cast(Awaitable[ExecutionResult], result)
+            finally:
+                if scheduler:
+                    priority_class.release()
+
+            if introspection_cache and result.data is not None and not result.errors:
+                introspection_cache.set_result(schema, data, result.data)
+        except CancelledError:
+            extension_manager.has_errors([ExecutionCancelledError()])
+            raise
         except GraphQLError as error:
             return handle_graphql_errors(
                 [error],
@@ -118,14 +185,15 @@ async def graphql(
                 debug=debug,
                 extension_manager=extension_manager,
             )
-        else:
-            return handle_query_result(
-                result,
-                logger=logger,
-                error_formatter=error_formatter,
-                debug=debug,
-                extension_manager=extension_manager,
-            )
+        success, response = handle_query_result(
+            result,
+            logger=logger,
+            error_formatter=error_formatter,
+            debug=debug,
+            extension_manager=extension_manager,
+        )
+        add_rate_limit_to_response(rate_limit, response)
+        return success, response
 
 
 def graphql_sync(
@@ -142,11 +210,15 @@ def graphql_sync(
     middleware: Optional[MiddlewareManager] = None,
     extensions: Optional[ExtensionList] = None,
     execution_context_class: Optional[Type[ExecutionContext]] = None,
+    query_limits: Optional[QueryLimits] = None,
+    introspection_cache: Optional[IntrospectionCache] = None,
+    rate_limiter: Optional[CostRateLimiter] = None,
     **kwargs,
 ) -> GraphQLResult:
     extension_manager = ExtensionManager(extensions, context_value)
+    rate_limit: Optional[RateLimitResult] = None
 
-    with extension_manager.request():
+    with collect_query_costs(), extension_manager.request():
         try:
             validate_data(data)
             query, variables, operation_name = (
@@ -155,7 +227,30 @@ def graphql_sync(
                 data.get("operationName"),
             )
 
-            document = parse_query(query)
+            if not introspection or callable(validation_rules):
+                introspection_cache = None  # Cached results would skip these checks
+
+            if introspection_cache:
+                cached_result = introspection_cache.get_result(schema, data)
+                if cached_result is not None:
+                    introspection_cache.check_rate_limit(context_value)
+                    return handle_query_result(
+                        ExecutionResult(cached_result),
+                        logger=logger,
+                        error_formatter=error_formatter,
+                        debug=debug,
+                        extension_manager=extension_manager,
+                    )
+
+            if query_limits:
+                query_limits.validate_query_size(query)
+                document = parse_query(query, max_tokens=query_limits.max_tokens)
+                limits_errors = query_limits.validate_document(document)
+            else:
+                document = parse_query(query)
+                limits_errors = []
+
+            extension_manager.document_parsed(document, operation_name, variables)
 
             if callable(validation_rules):
                 validation_rules = cast(
@@ -163,7 +258,7 @@ def graphql_sync(
                     validation_rules(context_value, document, data),
                 )
 
-            validation_errors = validate_query(
+            validation_errors = limits_errors or validate_query(
                 schema, document, validation_rules, enable_introspection=introspection
             )
             if validation_errors:
@@ -175,6 +270,23 @@ def graphql_sync(
                     extension_manager=extension_manager,
                 )
 
+            if introspection_cache:
+                if is_introspection_query(document, operation_name):
+                    introspection_cache.check_rate_limit(context_value)
+                else:
+                    introspection_cache = None
+
+            if rate_limiter:
+                consumed = rate_limiter.consume(context_value, document, operation_name)
+                if isawaitable(consumed):
+                    ensure_future(consumed).cancel()
+                    raise RuntimeError(
+                        "Rate limit store can't be asynchronous "
+                        "in synchronous query executor."
+                    )
+                rate_limit = cast(Optional[RateLimitResult], consumed)
+                validate_rate_limit(rate_limit)
+
             if callable(root_value):
                 root_value = root_value(context_value, document)
                 if isawaitable(root_value):
@@ -201,6 +313,9 @@ def graphql_sync(
                 raise RuntimeError(
                     "GraphQL execution failed to complete synchronously."
                 )
+
+            if introspection_cache and result.data is not None and not result.errors:
+                introspection_cache.set_result(schema, data, result.data)
         except GraphQLError as error:
             return handle_graphql_errors(
                 [error],
@@ -209,14 +324,15 @@ def graphql_sync(
                 debug=debug,
                 extension_manager=extension_manager,
             )
-        else:
-            return handle_query_result(
-                result,
-                logger=logger,
-                error_formatter=error_formatter,
-                debug=debug,
-                extension_manager=extension_manager,
-            )
+        success, response = handle_query_result(
+            result,
+            logger=logger,
+            error_formatter=error_formatter,
+            debug=debug,
+            extension_manager=extension_manager,
+        )
+        add_rate_limit_to_response(rate_limit, response)
+        return success, response
 
 
 async def subscribe(
@@ -230,53 +346,69 @@ async def subscribe(
     logger: Union[None, str, Logger, LoggerAdapter] = None,
     validation_rules: Optional[ValidationRules] = None,
     error_formatter: ErrorFormatter = format_error,
+    query_limits: Optional[QueryLimits] = None,
+    rate_limiter: Optional[CostRateLimiter] = None,
     **kwargs,
 ) -> SubscriptionResult:
-    try:
-        validate_data(data)
-        query, variables, operation_name = (
-            data["query"],
-            data.get("variables"),
-            data.get("operationName"),
-        )
+    with collect_query_costs():
+        try:
+            validate_data(data)
+            query, variables, operation_name = (
+                data["query"],
+                data.get("variables"),
+                data.get("operationName"),
+            )
 
-        document = parse_query(query)
+            if query_limits:
+                query_limits.validate_query_size(query)
+                document = parse_query(query, max_tokens=query_limits.max_tokens)
+                limits_errors = query_limits.validate_document(document)
+            else:
+                document = parse_query(query)
+                limits_errors = []
 
-        if callable(validation_rules):
-            validation_rules = cast(
-                Optional[Collection[Type[ASTValidationRule]]],
-                validation_rules(context_value, document, data),
-            )
+            if callable(validation_rules):
+                validation_rules = cast(
+                    Optional[Collection[Type[ASTValidationRule]]],
+                    validation_rules(context_value, document, data),
+                )
 
-        validation_errors = validate_query(
-            schema, document, validation_rules, enable_introspection=introspection
-        )
-        if validation_errors:
-            for error_ in validation_errors:  # mypy issue #5080
-                log_error(error_, logger)
-            return (
-                False,
-                [error_formatter(error, debug) for error in validation_errors],
+            validation_errors = limits_errors or validate_query(
+                schema, document, validation_rules, enable_introspection=introspection
             )
+            if validation_errors:
+                for error_ in validation_errors:  # mypy issue #5080
+                    log_error(error_, logger)
+                return (
+                    False,
+                    [error_formatter(error, debug) for error in validation_errors],
+                )
 
-        if callable(root_value):
-            root_value = root_value(context_value, document)
-            if isawaitable(root_value):
-                root_value = await root_value
+            if rate_limiter:
+                consumed = rate_limiter.consume(context_value, document, operation_name)
+                if isawaitable(consumed):
+                    rate_limit = await consumed
+                else:
+                    rate_limit = cast(Optional[RateLimitResult], consumed)
+                validate_rate_limit(rate_limit)
 
-        result = await _subscribe(
-            schema,
-            document,
-            root_value=root_value,
-            context_value=context_value,
-            variable_values=variables,
-            operation_name=operation_name,
-            **kwargs,
-        )
-    except GraphQLError as error:
-        log_error(error, logger)
-        return False, [error_formatter(error, debug)]
-    else:
+            if callable(root_value):
+                root_value = root_value(context_value, document)
+                if isawaitable(root_value):
+                    root_value = await root_value
+
+            result = await _subscribe(
+                schema,
+                document,
+                root_value=root_value,
+                context_value=context_value,
+                variable_values=variables,
+                operation_name=operation_name,
+                **kwargs,
+            )
+        except GraphQLError as error:
+            log_error(error, logger)
+            return False, [error_formatter(error, debug)]
         if isinstance(result, ExecutionResult):
             errors = cast(List[GraphQLError], result.errors)
             for error_ in errors:  # mypy issue #5080
@@ -318,9 +450,12 @@ def handle_graphql_errors(
     return False, response
 
 
-def parse_query(query):
+def parse_query(query, max_tokens: Optional[int] = None):
     try:
-        return parse(query)
+        if max_tokens is None:
+            # graphql-core before 3.2.3 doesn't support max_tokens argument
+            return parse(query)
+        return parse(query, max_tokens=max_tokens)
     except GraphQLError as error:
         raise error
     except Exception as error:
@@ -0,0 +1,187 @@
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLSchema,
+    InlineFragmentNode,
+    OperationType,
+    SelectionSetNode,
+    execute_sync,
+    get_introspection_query,
+    get_operation_ast,
+    parse,
+)
+
+from .types import ContextValue
+from .utils import freeze_args
+
+DEFAULT_MAX_SIZE = 100
+DEFAULT_MAX_CLIENTS = 10000
+
+ClientKey = Callable[[ContextValue], Optional[Hashable]]
+
+
+class IntrospectionCache:
+    """Serves results of introspection queries from cache
+
+    Results are cached separately for every schema, so replacing schema
+    invalidates them. Queries are identified by their text, operation name and
+    variables, so every variant of introspection query sent by tools is cached.
+
+    If `client_key` is set, clients identified by its return value can run at
+    most `max_requests` introspection queries within `period` seconds.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int = DEFAULT_MAX_SIZE,
+        client_key: Optional[ClientKey] = None,
+        max_requests: int = 10,
+        period: float = 60,
+        max_clients: int = DEFAULT_MAX_CLIENTS,
+    ) -> None:
+        self.max_size = max_size
+        self.client_key = client_key
+        self.max_requests = max_requests
+        self.period = period
+        self.max_clients = max_clients
+        self.results: WeakKeyDictionary = WeakKeyDictionary()
+        self.results_lock = Lock()
+        self.clients: Dict[Hashable, Tuple[float, int]] = {}
+        self.lock = Lock()
+
+    def get_result(self, schema: GraphQLSchema, data: dict) -> Optional[dict]:
+        key = get_cache_key(data)
+        if key is None:
+            return None
+        return self.results.get(schema, {}).get(key)
+
+    def set_result(self, schema: GraphQLSchema, data: dict, result: dict) -> None:
+        key = get_cache_key(data)
+        if key is None:
+            return
+
+        # Oldest result is evicted and new one is inserted atomically, as threads
+        # could try to evict the same one
+        with self.results_lock:
+            schema_results = self.results.setdefault(schema, {})
+            if key not in schema_results and len(schema_results) >= self.max_size:
+                del schema_results[next(iter(schema_results))]
+            schema_results[key] = result
+
+    def warm_up(self, schema: GraphQLSchema, query: Optional[str] = None) -> None:
+        """Precomputes result of standard introspection query for schema
+
+        Result is cached for requests with and without name of query's operation,
+        which is sent by clients like GraphiQL.
+        """
+        query = query or get_introspection_query(descriptions=True)
+        document = parse(query)
+        result = execute_sync(schema, document)
+        if result.errors or result.data is None:
+            return
+
+        self.set_result(schema, {"query": query}, result.data)
+        operation = get_operation_ast(document)
+        if operation and operation.name:
+            self.set_result(
+                schema,
+                {"query": query, "operationName": operation.name.value},
+                result.data,
+            )
+
+    def clear(self, schema: Optional[GraphQLSchema] = None) -> None:
+        if schema is None:
+            self.results.clear()
+        else:
+            self.results.pop(schema, None)
+
+    def check_rate_limit(self, context_value: Any) -> None:
+        if not self.client_key:
+            return
+
+        client = self.client_key(context_value)
+        if client is None:
+            return
+
+        # Client is popped and re-inserted, which has to happen atomically for
+        # concurrent requests from threads
+        with self.lock:
+            now = monotonic()
+            window_start, requests = self.clients.pop(client, (now, 0))
+            if now - window_start >= self.period:
+                window_start, requests = now, 0
+
+            # Re-inserted clients go to the end, so least recently seen are dropped
+            if len(self.clients) >= self.max_clients:
+                del self.clients[next(iter(self.clients))]
+            self.clients[client] = (window_start, requests + 1)
+
+        if requests >= self.max_requests:
+            raise GraphQLError(
+                "Too many introspection queries. Try again in %d seconds."
+                % max(1, round(window_start + self.period - now))
+            )
+
+
+def get_cache_key(data: dict) -> Optional[Hashable]:
+    try:
+        key = (
+            data["query"],
+            data.get("operationName"),
+            freeze_args(data.get("variables") or {}),
+        )
+        hash(key)
+    except TypeError:
+        return None  # Unhashable variable value, skip cache
+    return key
+
+
+def is_introspection_query(
+    document: DocumentNode, operation_name: Optional[str] = None
+) -> bool:
+    """Checks if operation selects only introspection fields on its root type"""
+    operation = get_operation_ast(document, operation_name)
+    if not operation or operation.operation != OperationType.QUERY:
+        return False
+
+    fragments = {
+        definition.name.value: definition
+        for definition in document.definitions
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+    return selects_only_introspection(operation.selection_set, fragments, set())
+
+
+def selects_only_introspection(
+    selection_set: SelectionSetNode,
+    fragments: Dict[str, FragmentDefinitionNode],
+    visited_fragments: set,
+) -> bool:
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            if not selection.name.value.startswith("__"):
+                return False
+        elif isinstance(selection, InlineFragmentNode):
+            if not selects_only_introspection(
+                selection.selection_set, fragments, visited_fragments
+            ):
+                return False
+        elif isinstance(selection, FragmentSpreadNode):
+            name = selection.name.value
+            if name in visited_fragments:
+                continue
+            visited_fragments.add(name)
+            if name not in fragments or not selects_only_introspection(
+                fragments[name].selection_set, fragments, visited_fragments
+            ):
+                return False
+    return True
@@ -0,0 +1,98 @@
+from asyncio import ensure_future
+from functools import partial
+from inspect import isawaitable
+from typing import Any, Collection, Dict, Optional, Tuple
+
+from graphql import GraphQLObjectType, GraphQLResolveInfo
+
+from .types import ContextValue, Extension, Resolver
+from .utils import freeze_args
+
+
+def memoize_resolver(resolver: Resolver) -> Resolver:
+    """Mark resolver as safe to memoize by `MemoizationExtension`"""
+    # pylint: disable=protected-access
+    resolver._ariadne_memoize = True  # type: ignore
+    return resolver
+
+
+class MemoizationExtension(Extension):
+    """Memoizes results of marked resolvers for the duration of single request
+
+    Resolvers are called once for every distinct combination of parent object,
+    field and arguments. Resolvers can be marked for memoization individually
+    with `memoize_resolver` decorator or for whole types with `types` option.
+    """
+
+    _cache: Dict[Tuple, Tuple[Any, Any]]
+
+    def __init__(self, *, types: Optional[Collection[str]] = None) -> None:
+        self._types = frozenset(types or ())
+        self._cache = {}
+
+    def request_finished(self, context: ContextValue):
+        self._cache.clear()
+
+    def should_resolve_field(
+        self, parent_type: GraphQLObjectType, field_name: str
+    ) -> bool:
+        if parent_type.name in self._types:
+            return True
+        field = parent_type.fields.get(field_name)
+        return bool(field and getattr(field.resolve, "_ariadne_memoize", None) is True)
+
+    async def resolve(
+        self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs
+    ):
+        key = self.get_cache_key(obj, info, kwargs)
+        if key is None:
+            result = next_(obj, info, **kwargs)
+            if isawaitable(result):
+                result = await result
+            return result
+
+        if key not in self._cache:
+            result = next_(obj, info, **kwargs)
+            if isawaitable(result):
+                # Share single future between all callers awaiting this value
+                result = ensure_future(result)
+            # Parent is kept alive in cache so its id can't be reused by other object
+            self._cache[key] = (obj, result)
+
+        result = self._cache[key][1]
+        if isawaitable(result):
+            result = await result
+        return result
+
+    def get_cache_key(
+        self, obj: Any, info: GraphQLResolveInfo, kwargs: dict
+    ) -> Optional[Tuple]:
+        if not self.should_resolve_field(info.parent_type, info.field_name):
+            return None
+        try:
+            args_key = freeze_args(kwargs)
+            hash(args_key)
+        except TypeError:
+            return None  # Unhashable argument value, skip memoization
+        return (id(obj), info.parent_type.name, info.field_name, args_key)
+
+
+class MemoizationExtensionSync(MemoizationExtension):
+    def resolve(
+        self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs
+    ):  # pylint: disable=invalid-overridden-method
+        key = self.get_cache_key(obj, info, kwargs)
+        if key is None:
+            return next_(obj, info, **kwargs)
+
+        if key not in self._cache:
+            self._cache[key] = (obj, next_(obj, info, **kwargs))
+        return self._cache[key][1]
+
+
+def memoization_extension(*, types: Optional[Collection[str]] = None):
+    return partial(MemoizationExtension, types=types)
+
+
+def memoization_extension_sync(*, types: Optional[Collection[str]] = None):
+    return partial(MemoizationExtensionSync, types=types)
@@ -0,0 +1,170 @@
+from threading import Lock
+from time import monotonic
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from graphql import DocumentNode, GraphQLError, get_operation_ast
+from typing_extensions import Protocol
+
+from .types import ContextValue
+from .validation.query_cost import get_query_cost
+
+DEFAULT_MAX_KEYS = 10000
+
+ClientKey = Callable[[ContextValue], Optional[Hashable]]
+
+
+class RateLimitResult(NamedTuple):
+    """Outcome of charging operation's cost against client's budget"""
+
+    allowed: bool
+    cost: float
+    remaining: float
+    capacity: float
+    retry_after: float = 0
+
+    def as_dict(self) -> dict:
+        data = {
+            "cost": self.cost,
+            "remaining": self.remaining,
+            "capacity": self.capacity,
+        }
+        if not self.allowed:
+            data["retryAfter"] = self.retry_after
+        return data
+
+
+class RateLimitStore(Protocol):
+    """Storage of token buckets
+
+    Stores sharing buckets between processes (eg. in Redis) may return
+    awaitable from `consume`. Those can only be used in asynchronous servers.
+    """
+
+    def consume(
+        self, key: Hashable, cost: float, capacity: float, refill_rate: float
+    ) -> Union[RateLimitResult, Awaitable[RateLimitResult]]:
+        """Takes `cost` tokens from bucket if it has enough of them"""
+
+
+class InMemoryRateLimitStore:
+    """Keeps token buckets of least recently seen `max_keys` clients in memory"""
+
+    def __init__(self, *, max_keys: int = DEFAULT_MAX_KEYS) -> None:
+        self.max_keys = max_keys
+        self.buckets: Dict[Hashable, Tuple[float, float]] = {}
+        self.lock = Lock()
+
+    def consume(
+        self, key: Hashable, cost: float, capacity: float, refill_rate: float
+    ) -> RateLimitResult:
+        # Bucket is popped and re-inserted, which has to happen atomically for
+        # concurrent requests from threads
+        with self.lock:
+            now = monotonic()
+            tokens, timestamp = self.buckets.pop(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - timestamp) * refill_rate)
+
+            if cost <= tokens:
+                tokens -= cost
+                result = RateLimitResult(True, cost, tokens, capacity)
+            else:
+                if refill_rate and cost <= capacity:
+                    retry_after = (cost - tokens) / refill_rate
+                else:
+                    retry_after = -1  # Bucket will never hold enough tokens
+                result = RateLimitResult(False, cost, tokens, capacity, retry_after)
+
+            # Re-inserted keys go to the end, so least recently seen are dropped
+            if len(self.buckets) >= self.max_keys:
+                del self.buckets[next(iter(self.buckets))]
+            self.buckets[key] = (tokens, now)
+        return result
+
+
+def get_client_address(context: ContextValue) -> Optional[Hashable]:
+    """Returns address of client from request in context or None
+
+    Supports default context values of ASGI and WSGI `GraphQL` applications.
+    """
+    if not isinstance(context, dict):
+        return None
+
+    request = context.get("request")
+    if isinstance(request, dict):
+        return request.get("REMOTE_ADDR")
+
+    client = getattr(request, "client", None)
+    return client.host if client else None
+
+
+class CostRateLimiter:
+    """Charges costs of operations against per-client token buckets
+
+    Client's bucket holds up to `capacity` tokens and is refilled with
+    `refill_rate` tokens every second. Operations costing more than tokens left
+    in client's bucket are rejected before they are executed.
+
+    Costs are computed by `cost_validator` that has to be included in validation
+    rules. Operations without computed cost are charged `default_cost`. Clients
+    for whom `client_key` returns `None` are not limited.
+    """
+
+    def __init__(
+        self,
+        *,
+        capacity: float,
+        refill_rate: float,
+        client_key: ClientKey = get_client_address,
+        store: Optional[RateLimitStore] = None,
+        default_cost: float = 1,
+    ) -> None:
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.client_key = client_key
+        self.store = store or InMemoryRateLimitStore()
+        self.default_cost = default_cost
+
+    def get_operation_cost(
+        self, document: DocumentNode, operation_name: Optional[str] = None
+    ) -> float:
+        operation = get_operation_ast(document, operation_name)
+        cost = get_query_cost(operation) if operation else None
+        return self.default_cost if cost is None else cost
+
+    def consume(
+        self,
+        context_value: ContextValue,
+        document: DocumentNode,
+        operation_name: Optional[str] = None,
+    ) -> Union[None, RateLimitResult, Awaitable[RateLimitResult]]:
+        client = self.client_key(context_value)
+        if client is None:
+            return None
+
+        cost = self.get_operation_cost(document, operation_name)
+        return self.store.consume(client, cost, self.capacity, self.refill_rate)
+
+
+def validate_rate_limit(rate_limit: Optional[RateLimitResult]) -> None:
+    if rate_limit and not rate_limit.allowed:
+        raise GraphQLError(
+            "Rate limit exceeded: operation costs %g and %g is left of the budget."
+            % (rate_limit.cost, rate_limit.remaining),
+            extensions={"rateLimit": rate_limit.as_dict()},
+        )
+
+
+def add_rate_limit_to_response(
+    rate_limit: Optional[RateLimitResult], response: dict
+) -> None:
+    if rate_limit:
+        response.setdefault("extensions", {})["rateLimit"] = rate_limit.as_dict()
@@ -1,5 +1,6 @@
 from collections.abc import Mapping
-from typing import Any, Optional
+from operator import attrgetter, methodcaller
+from typing import Any, Callable, Dict, Optional
 
 from graphql import default_field_resolver
 from graphql.type import (
@@ -14,6 +15,9 @@ from .utils import convert_camel_case_to_snake
 
 
 class FallbackResolversSetter(SchemaBindable):
+    def __init__(self, *, adaptive: bool = False) -> None:
+        self.adaptive = adaptive
+
     def bind_to_schema(self, schema: GraphQLSchema) -> None:
         for type_object in schema.type_map.values():
             if isinstance(type_object, GraphQLObjectType):
@@ -23,9 +27,14 @@ class FallbackResolversSetter(SchemaBindable):
         for field_name, field_object in type_object.fields.items():
             self.add_resolver_to_field(field_name, field_object)
 
-    def add_resolver_to_field(self, _: str, field_object: GraphQLField) -> None:
+    def add_resolver_to_field(
+        self, field_name: str, field_object: GraphQLField
+    ) -> None:
         if field_object.resolve is None:
-            field_object.resolve = default_field_resolver
+            if self.adaptive:
+                field_object.resolve = resolve_to_adaptive(field_name)
+            else:
+                field_object.resolve = default_field_resolver
 
 
 class SnakeCaseFallbackResolversSetter(FallbackResolversSetter):
@@ -34,7 +43,10 @@ class SnakeCaseFallbackResolversSetter(FallbackResolversSetter):
     ) -> None:
         if field_object.resolve is None:
             field_name = convert_camel_case_to_snake(field_name)
-            field_object.resolve = resolve_to(field_name)
+            if self.adaptive:
+                field_object.resolve = resolve_to_adaptive(field_name)
+            else:
+                field_object.resolve = resolve_to(field_name)
 
 
 fallback_resolvers = FallbackResolversSetter()
@@ -56,11 +68,60 @@ def resolve_to(field_name: str) -> Resolver:
 
     # pylint: disable=protected-access
     resolver._ariadne_alias_resolver = True  # type: ignore
+    resolver._ariadne_alias_field_name = field_name  # type: ignore
     return resolver
 
 
+# Limit of parent types for which adaptive resolver keeps specialized getter
+MAX_ADAPTIVE_PARENT_TYPES = 8
+
+
+def resolve_to_adaptive(field_name: str) -> Resolver:
+    getters: Dict[type, Callable[[Any], Any]] = {}
+
+    def resolver(parent: Any, info: GraphQLResolveInfo, **kwargs) -> Any:
+        getter = getters.get(parent.__class__)
+        if getter is None:
+            getter = get_parent_field_getter(parent, field_name)
+            if len(getters) < MAX_ADAPTIVE_PARENT_TYPES:
+                getters[parent.__class__] = getter
+
+        try:
+            value = getter(parent)
+        except AttributeError:
+            value = None
+
+        if callable(value):
+            return value(info, **kwargs)
+        return value
+
+    # pylint: disable=protected-access
+    resolver._ariadne_alias_resolver = True  # type: ignore
+    resolver._ariadne_alias_field_name = field_name  # type: ignore
+    return resolver
+
+
+def get_parent_field_getter(parent: Any, field_name: str) -> Callable[[Any], Any]:
+    if isinstance(parent, Mapping):
+        return methodcaller("get", field_name)
+    return attrgetter(field_name)
+
+
 def is_default_resolver(resolver: Optional[Resolver]) -> bool:
     # pylint: disable=comparison-with-callable
     if not resolver or resolver == default_field_resolver:
         return True
     return hasattr(resolver, "_ariadne_alias_resolver")
+
+
+def get_default_resolver_field_name(
+    resolver: Optional[Resolver], field_name: str
+) -> Optional[str]:
+    """Returns name of parent's attribute or key that default resolver returns
+
+    Returns `None` if resolver is not a default resolver.
+    """
+    # pylint: disable=comparison-with-callable
+    if not resolver or resolver == default_field_resolver:
+        return field_name
+    return getattr(resolver, "_ariadne_alias_field_name", None)
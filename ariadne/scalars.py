@@ -1,19 +1,34 @@
-from typing import Optional, cast
+from math import isfinite
+from typing import Any, Callable, Dict, List, Optional, cast
 
 from graphql.type import (
+    GraphQLBoolean,
+    GraphQLFloat,
+    GraphQLID,
+    GraphQLInt,
     GraphQLNamedType,
     GraphQLScalarLiteralParser,
     GraphQLScalarSerializer,
     GraphQLScalarType,
     GraphQLScalarValueParser,
     GraphQLSchema,
+    GraphQLString,
 )
+from graphql.type.scalars import GRAPHQL_MAX_INT, GRAPHQL_MIN_INT
 
 from .types import SchemaBindable
 
+# Serializes list of values at once, returning None if any of them can't be
+# serialized this way, in which case values are serialized one by one
+BulkSerializer = Callable[[List[Any]], Optional[List[Any]]]
+
+# Key of scalar type's extensions under which its bulk serializer is stored
+BULK_SERIALIZER_EXTENSION = "bulk_serializer"
+
 
 class ScalarType(SchemaBindable):
     _serialize: Optional[GraphQLScalarSerializer]
+    _bulk_serialize: Optional[BulkSerializer]
     _parse_value: Optional[GraphQLScalarValueParser]
     _parse_literal: Optional[GraphQLScalarLiteralParser]
 
@@ -22,11 +37,13 @@ class ScalarType(SchemaBindable):
         name: str,
         *,
         serializer: Optional[GraphQLScalarSerializer] = None,
+        bulk_serializer: Optional[BulkSerializer] = None,
         value_parser: Optional[GraphQLScalarValueParser] = None,
         literal_parser: Optional[GraphQLScalarLiteralParser] = None,
     ) -> None:
         self.name = name
         self._serialize = serializer
+        self._bulk_serialize = bulk_serializer
         self._parse_value = value_parser
         self._parse_literal = literal_parser
 
@@ -34,6 +51,10 @@ class ScalarType(SchemaBindable):
         self._serialize = f
         return f
 
+    def set_bulk_serializer(self, f: BulkSerializer) -> BulkSerializer:
+        self._bulk_serialize = f
+        return f
+
     def set_value_parser(self, f: GraphQLScalarValueParser) -> GraphQLScalarValueParser:
         self._parse_value = f
         return f
@@ -46,6 +67,7 @@ class ScalarType(SchemaBindable):
 
     # Alias above setters for consistent decorator API
     serializer = set_serializer
+    bulk_serializer = set_bulk_serializer
     value_parser = set_value_parser
     literal_parser = set_literal_parser
 
@@ -57,6 +79,11 @@ class ScalarType(SchemaBindable):
         if self._serialize:
             # See mypy bug https://github.com/python/mypy/issues/2427
             graphql_type.serialize = self._serialize  # type: ignore
+        if self._bulk_serialize:
+            graphql_type.extensions = {
+                **(graphql_type.extensions or {}),
+                BULK_SERIALIZER_EXTENSION: self._bulk_serialize,
+            }
         if self._parse_value:
             graphql_type.parse_value = self._parse_value  # type: ignore
         if self._parse_literal:
@@ -70,3 +97,69 @@ class ScalarType(SchemaBindable):
                 "%s is defined in the schema, but it is instance of %s (expected %s)"
                 % (self.name, type(graphql_type).__name__, GraphQLScalarType.__name__)
             )
+
+
+def get_scalar_bulk_serializer(
+    graphql_type: GraphQLScalarType,
+) -> Optional[BulkSerializer]:
+    """Returns bulk serializer set on scalar or built-in one for its serializer
+
+    Built-in bulk serializers are used only if scalar's serializer was not
+    replaced, so custom serializers are never bypassed.
+    """
+    if graphql_type.extensions and BULK_SERIALIZER_EXTENSION in graphql_type.extensions:
+        return graphql_type.extensions[BULK_SERIALIZER_EXTENSION]
+    return BUILTIN_BULK_SERIALIZERS.get(graphql_type.serialize)
+
+
+def bulk_serialize_int(values: List[Any]) -> Optional[List[Any]]:
+    if not values:
+        return []
+    if {type(value) for value in values} != {int}:
+        return None
+    if min(values) < GRAPHQL_MIN_INT or max(values) > GRAPHQL_MAX_INT:
+        return None
+    return list(values)
+
+
+def bulk_serialize_float(values: List[Any]) -> Optional[List[Any]]:
+    types = {type(value) for value in values}
+    if types == {float}:
+        serialized = list(values)
+    elif types <= {float, int}:
+        serialized = [float(value) for value in values]
+    else:
+        return None
+    if not all(isfinite(value) for value in serialized):
+        return None
+    return serialized
+
+
+def bulk_serialize_string(values: List[Any]) -> Optional[List[Any]]:
+    if {type(value) for value in values} <= {str}:
+        return list(values)
+    return None
+
+
+def bulk_serialize_boolean(values: List[Any]) -> Optional[List[Any]]:
+    if {type(value) for value in values} <= {bool}:
+        return list(values)
+    return None
+
+
+def bulk_serialize_id(values: List[Any]) -> Optional[List[Any]]:
+    types = {type(value) for value in values}
+    if types <= {str}:
+        return list(values)
+    if types <= {str, int}:
+        return [str(value) for value in values]
+    return None
+
+
+BUILTIN_BULK_SERIALIZERS: Dict[GraphQLScalarSerializer, BulkSerializer] = {
+    GraphQLInt.serialize: bulk_serialize_int,
+    GraphQLFloat.serialize: bulk_serialize_float,
+    GraphQLString.serialize: bulk_serialize_string,
+    GraphQLBoolean.serialize: bulk_serialize_boolean,
+    GraphQLID.serialize: bulk_serialize_id,
+}
@@ -0,0 +1,104 @@
+from asyncio import CancelledError, Future, get_running_loop
+from collections import deque
+from typing import Collection, Deque, Optional, Sequence
+
+from graphql import DocumentNode, GraphQLError, get_operation_ast
+
+from .validation.query_cost import get_query_cost
+
+
+class PriorityClass:
+    """Group of operations executed with its own concurrency limit and queue
+
+    Operations are put in the class if their name is listed in
+    `operation_names`, or if their cost computed by `cost_validator` is not
+    greater than `max_cost`. Names take precedence over costs.
+
+    Operations that can't start immediately wait in the queue in order of
+    arrival. If `max_queue` is set, operations arriving to full queue are
+    rejected.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_concurrency: int,
+        max_queue: Optional[int] = None,
+        max_cost: Optional[int] = None,
+        operation_names: Optional[Collection[str]] = None,
+    ) -> None:
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.max_cost = max_cost
+        self.operation_names = frozenset(operation_names or ())
+        self.active = 0
+        self.waiters: Deque[Future] = deque()
+
+    async def acquire(self) -> None:
+        if self.active < self.max_concurrency and not self.waiters:
+            self.active += 1
+            return
+
+        if self.max_queue is not None and len(self.waiters) >= self.max_queue:
+            raise GraphQLError(
+                "Server is too busy to execute %s operation. Try again later."
+                % self.name
+            )
+
+        waiter = get_running_loop().create_future()
+        self.waiters.append(waiter)
+        try:
+            await waiter
+        except CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()  # Slot was handed over before cancellation
+            elif waiter in self.waiters:
+                self.waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        # Slot is handed over to next waiter, so active count doesn't change
+        while self.waiters:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+
+class OperationScheduler:
+    """Limits concurrency of operations separately for each priority class
+
+    Operation is assigned to the class listing its name, or to the first class
+    allowing its cost, or to the last class if none of them does.
+    """
+
+    def __init__(self, classes: Sequence[PriorityClass]) -> None:
+        if not classes:
+            raise ValueError("OperationScheduler requires at least one class.")
+        self.classes = classes
+
+    def classify(
+        self, document: DocumentNode, operation_name: Optional[str] = None
+    ) -> PriorityClass:
+        operation = get_operation_ast(document, operation_name)
+        if not operation:
+            return self.classes[-1]
+
+        if operation.name:
+            for priority_class in self.classes:
+                if operation.name.value in priority_class.operation_names:
+                    return priority_class
+
+        cost = get_query_cost(operation)
+        if cost is not None:
+            for priority_class in self.classes:
+                if (
+                    priority_class.max_cost is not None
+                    and cost <= priority_class.max_cost
+                ):
+                    return priority_class
+
+        return self.classes[-1]
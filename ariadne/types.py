@@ -18,6 +18,7 @@ from graphql import (
     DocumentNode,
     ExecutionResult,
     GraphQLError,
+    GraphQLObjectType,
     GraphQLResolveInfo,
     GraphQLSchema,
 )
@@ -94,6 +95,15 @@ class Extension(Protocol):
     def request_finished(self, context: ContextValue):
         pass  # pragma: no cover
 
+    def document_parsed(
+        self,
+        document: DocumentNode,
+        operation_name: Optional[str],
+        variables: Optional[dict],
+        context: ContextValue,
+    ):
+        pass  # pragma: no cover
+
     async def resolve(
         self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs
     ):
@@ -102,6 +112,14 @@ class Extension(Protocol):
             result = await result
         return result
 
+    def should_resolve(self, context: ContextValue) -> bool:
+        return True  # pragma: no cover
+
+    def should_resolve_field(
+        self, parent_type: GraphQLObjectType, field_name: str
+    ) -> bool:
+        return True  # pragma: no cover
+
     def has_errors(self, errors: List[GraphQLError], context: ContextValue):
         pass  # pragma: no cover
 
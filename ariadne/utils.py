@@ -1,10 +1,26 @@
 import asyncio
 from collections.abc import Mapping
-from functools import wraps
-from typing import Optional, Union, Callable, Dict, Any, cast
+from functools import lru_cache, wraps
+from typing import Optional, Union, Callable, Dict, Any, Hashable, cast
+from weakref import WeakKeyDictionary
 
 from graphql.language import DocumentNode, OperationDefinitionNode, OperationType
-from graphql import GraphQLError, GraphQLType, parse
+from graphql import (
+    GraphQLError,
+    GraphQLInputObjectType,
+    GraphQLInterfaceType,
+    GraphQLObjectType,
+    GraphQLResolveInfo,
+    GraphQLSchema,
+    GraphQLType,
+    parse,
+)
+
+# Snake case counterparts of field, argument and input field names, per schema
+# created with make_executable_schema
+schemas_snake_case_names: WeakKeyDictionary = WeakKeyDictionary()
+# Size of memo cache for names not defined in schema, eg. keys of custom scalars
+SNAKE_CASE_NAMES_CACHE_SIZE = 1024
 
 
 def convert_camel_case_to_snake(graphql_name: str) -> str:
@@ -37,6 +53,49 @@ def convert_camel_case_to_snake(graphql_name: str) -> str:
     return python_name
 
 
+convert_camel_case_to_snake_cached = lru_cache(maxsize=SNAKE_CASE_NAMES_CACHE_SIZE)(
+    convert_camel_case_to_snake
+)
+
+
+def get_snake_case_name(
+    graphql_name: str, schema_names: Optional[Dict[str, str]] = None
+) -> str:
+    if schema_names:
+        python_name = schema_names.get(graphql_name)
+        if python_name is not None:
+            return python_name
+    return convert_camel_case_to_snake_cached(graphql_name)
+
+
+def cache_schema_snake_case_names(schema: GraphQLSchema) -> None:
+    names: Dict[str, str] = {}
+    for type_object in schema.type_map.values():
+        if type_object.name.startswith("__"):
+            continue
+        if isinstance(type_object, GraphQLInputObjectType):
+            add_schema_snake_case_names(names, type_object.fields)
+        elif isinstance(type_object, (GraphQLObjectType, GraphQLInterfaceType)):
+            add_schema_snake_case_names(names, type_object.fields)
+            for field in type_object.fields.values():
+                add_schema_snake_case_names(names, field.args)
+    schemas_snake_case_names[schema] = names
+
+
+def add_schema_snake_case_names(names: Dict[str, str], graphql_names) -> None:
+    for graphql_name in graphql_names:
+        if graphql_name not in names:
+            names[graphql_name] = convert_camel_case_to_snake(graphql_name)
+
+
+def get_resolver_snake_case_names(args: tuple) -> Optional[Dict[str, str]]:
+    """Returns snake case names of schema that resolver was called for"""
+    for arg in args:
+        if isinstance(arg, GraphQLResolveInfo):
+            return schemas_snake_case_names.get(arg.schema)
+    return None
+
+
 def gql(value: str) -> str:
     parse(value)
     return value
@@ -51,29 +110,32 @@ def unwrap_graphql_error(
 
 
 def convert_kwargs_to_snake_case(func: Callable) -> Callable:
-    def convert_to_snake_case(m: Mapping) -> Dict:
+    def convert_to_snake_case(m: Mapping, names: Optional[Dict[str, str]]) -> Dict:
         converted: Dict = {}
         for k, v in m.items():
             if isinstance(v, Mapping):
-                v = convert_to_snake_case(v)
-            if isinstance(v, list):
+                v = convert_to_snake_case(v, names)
+            elif isinstance(v, list):
                 v = [
-                    convert_to_snake_case(i) if isinstance(i, Mapping) else i for i in v
+                    convert_to_snake_case(i, names) if isinstance(i, Mapping) else i
+                    for i in v
                 ]
-            converted[convert_camel_case_to_snake(k)] = v
+            converted[get_snake_case_name(k, names)] = v
         return converted
 
     if asyncio.iscoroutinefunction(func):
 
         @wraps(func)
         async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            return await func(*args, **convert_to_snake_case(kwargs))
+            names = get_resolver_snake_case_names(args)
+            return await func(*args, **convert_to_snake_case(kwargs, names))
 
         return async_wrapper
 
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        return func(*args, **convert_to_snake_case(kwargs))
+        names = get_resolver_snake_case_names(args)
+        return func(*args, **convert_to_snake_case(kwargs, names))
 
     return wrapper
 
@@ -100,3 +162,11 @@ def get_operation_type(
             if isinstance(definition, OperationDefinitionNode):
                 return definition.operation
     raise RuntimeError("Can't get GraphQL operation type")
+
+
+def freeze_args(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return frozenset((k, freeze_args(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_args(v) for v in value)
+    return value
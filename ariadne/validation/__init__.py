@@ -1,3 +1,15 @@
-from .query_cost import cost_directive, cost_validator
+from .query_cost import (
+    analyze_query_cost,
+    cost_directive,
+    cost_validator,
+    get_query_cost,
+)
+from .query_limits import QueryLimits
 
-__all__ = ["cost_directive", "cost_validator"]
+__all__ = [
+    "QueryLimits",
+    "analyze_query_cost",
+    "cost_directive",
+    "cost_validator",
+    "get_query_cost",
+]
@@ -1,6 +1,11 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import reduce
 from operator import add, mul
-from typing import Any, Dict, List, Optional, Type, Union, cast
+from sys import maxsize
+from threading import Lock
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple, Type, Union, cast
+from weakref import WeakKeyDictionary
 
 from graphql import (
     GraphQLError,
@@ -8,10 +13,13 @@ from graphql import (
     GraphQLObjectType,
     GraphQLSchema,
     get_named_type,
+    parse,
+    validate,
 )
 from graphql.execution.values import get_argument_values
 from graphql.language import (
     BooleanValueNode,
+    DocumentNode,
     FieldNode,
     FragmentDefinitionNode,
     FragmentSpreadNode,
@@ -22,11 +30,16 @@ from graphql.language import (
     OperationDefinitionNode,
     OperationType,
     StringValueNode,
+    VariableNode,
+    Visitor,
+    visit,
 )
-from graphql.type import GraphQLFieldMap
+from graphql.type import GraphQLField, GraphQLFieldMap
 from graphql.validation import ValidationContext
 from graphql.validation.rules import ASTValidationRule, ValidationRule
 
+from ..utils import freeze_args
+
 cost_directive = """
 directive @cost(complexity: Int, multipliers: [String!], useMultipliers: Boolean) on FIELD | FIELD_DEFINITION
 """
@@ -40,6 +53,101 @@ CostAwareNode = Union[
     OperationDefinitionNode,
 ]
 
+COST_CACHE_SIZE = 1024
+COST_PLANS_SIZE = 16
+
+# Cost plans per schema and frozen cost map
+cost_plans: WeakKeyDictionary = WeakKeyDictionary()
+# Oldest plan is evicted and new one is inserted atomically, as threads could
+# try to evict the same one
+cost_plans_lock = Lock()
+
+# Costs of operations computed by cost validator during current request, keyed
+# by ids of operations nodes. Costs depend on variables so they can't be kept on
+# nodes, which may be shared between requests.
+query_costs: ContextVar[Optional[Dict[int, int]]] = ContextVar(
+    "query_costs", default=None
+)
+
+
+@contextmanager
+def collect_query_costs():
+    """Collects costs of operations validated within this block
+
+    Costs are collected by `graphql`, `graphql_sync` and `subscribe` for
+    duration of the request.
+    """
+    token = query_costs.set({})
+    try:
+        yield
+    finally:
+        query_costs.reset(token)
+
+
+def get_query_cost(operation: OperationDefinitionNode) -> Optional[int]:
+    """Returns cost of operation computed by cost validator or None
+
+    Cost is available to later stages of current request's execution, eg.
+    through `info.operation` in resolvers and extensions.
+    """
+    costs = query_costs.get()
+    if costs is None:
+        return None
+    return costs.get(id(operation))
+
+
+class CostCacheEntry:
+    """Costs of single operation for values of variables used by multipliers"""
+
+    __slots__ = ("variables", "costs")
+
+    def __init__(self, variables: Tuple[str, ...]) -> None:
+        self.variables = variables
+        self.costs: Dict[Hashable, int] = {}
+
+    def get_key(self, variables: Optional[Dict]) -> Hashable:
+        variables = variables or {}
+        return tuple(
+            (name in variables, freeze_args(variables.get(name)))
+            for name in self.variables
+        )
+
+
+class CostPlan:
+    """Cost arguments of schema's fields, resolved once per schema
+
+    Fields cost arguments are taken from the cost map if its set, or from the
+    `@cost` directives otherwise. Multipliers are kept as names of arguments
+    because their values differ between queries.
+    """
+
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        cost_map: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> None:
+        self.error: Optional[GraphQLError] = None
+        self.fields: Dict[Tuple[str, str], Any] = {}
+        self.operations: Dict[Hashable, CostCacheEntry] = {}
+
+        if cost_map:
+            try:
+                validate_cost_map(cost_map, schema)
+            except GraphQLError as cost_map_error:
+                self.error = cost_map_error
+                return
+
+            for type_name, type_fields in cost_map.items():
+                for field_name, cost_args in type_fields.items():
+                    self.fields[(type_name, field_name)] = cost_args
+        else:
+            for type_def in schema.type_map.values():
+                if isinstance(type_def, (GraphQLObjectType, GraphQLInterfaceType)):
+                    for field_name, field in type_def.fields.items():
+                        cost_args = get_field_cost_directive_args(field)
+                        if cost_args is not None:
+                            self.fields[(type_def.name, field_name)] = cost_args
+
 
 class CostValidator(ValidationRule):
     context: ValidationContext
@@ -48,6 +156,8 @@ class CostValidator(ValidationRule):
     default_complexity: int = 1
     variables: Optional[Dict] = None
     cost_map: Optional[Dict[str, Dict[str, Any]]] = None
+    # Frozen copy of cost map, set once by cost_validator
+    cost_map_key: Optional[Hashable] = None
 
     def __init__(
         self,
@@ -68,6 +178,31 @@ class CostValidator(ValidationRule):
         self.default_complexity = default_complexity
         self.cost = 0
         self.operation_multipliers: List[Any] = []
+        self.plan = self.get_plan()
+        self.used_variables: Set[str] = set()
+        self.has_errors = False
+
+    def get_plan(self) -> CostPlan:
+        plan_key = self.cost_map_key
+        if plan_key is None and self.cost_map:
+            plan_key = freeze_args(self.cost_map)
+
+        schema_plans = cost_plans.get(self.context.schema)
+        plan = schema_plans.get(plan_key) if schema_plans else None
+        if plan is not None:
+            return plan
+
+        plan = CostPlan(self.context.schema, self.cost_map)
+        with cost_plans_lock:
+            schema_plans = cost_plans.setdefault(self.context.schema, {})
+            if plan_key not in schema_plans and len(schema_plans) >= COST_PLANS_SIZE:
+                del schema_plans[next(iter(schema_plans))]
+            schema_plans[plan_key] = plan
+        return plan
+
+    def report_error(self, error: Exception):
+        self.has_errors = True
+        report_error(self.context, error)
 
     def compute_node_cost(self, node: CostAwareNode, type_def, parent_multipliers=None):
         if parent_multipliers is None:
@@ -86,54 +221,13 @@ class CostValidator(ValidationRule):
                 if not field:
                     continue
                 field_type = get_named_type(field.type)
-                try:
-                    field_args: Dict[str, Any] = get_argument_values(
-                        field, child_node, self.variables
-                    )
-                except Exception as e:
-                    report_error(self.context, e)
-                    field_args = {}
-                if self.cost_map:
-                    cost_map_args = (
-                        self.get_args_from_cost_map(
-                            child_node, type_def.name, field_args
-                        )
-                        if type_def and type_def.name
-                        else None
-                    )
-                    if cost_map_args is not None:
-                        try:
-                            node_cost = self.compute_cost(**cost_map_args)
-                        except (TypeError, ValueError) as e:
-                            report_error(self.context, e)
-                else:
-                    cost_is_computed = False
-                    if field.ast_node and field.ast_node.directives:
-                        directives_args = self.get_args_from_directives(
-                            field.ast_node.directives, field_args
-                        )
-                        if directives_args is not None:
-                            try:
-                                node_cost = self.compute_cost(**directives_args)
-                            except (TypeError, ValueError) as e:
-                                report_error(self.context, e)
-                            cost_is_computed = True
-                    if (
-                        field_type
-                        and field_type.ast_node
-                        and field_type.ast_node.directives
-                    ):
-                        if not cost_is_computed and isinstance(
-                            field_type, GraphQLObjectType
-                        ):
-                            directives_args = self.get_args_from_directives(
-                                field_type.ast_node.directives, field_args
-                            )
-                            if directives_args is not None:
-                                try:
-                                    node_cost = self.compute_cost(**directives_args)
-                                except (TypeError, ValueError) as e:
-                                    report_error(self.context, e)
+                cost_args = self.plan.fields.get((type_def.name, child_node.name.value))
+                if cost_args:
+                    cost_args = self.get_field_cost_args(child_node, field, cost_args)
+                    try:
+                        node_cost = self.compute_cost(**cost_args)
+                    except (TypeError, ValueError) as e:
+                        self.report_error(e)
                 child_cost = self.compute_node_cost(
                     child_node, field_type, self.operation_multipliers
                 )
@@ -155,24 +249,86 @@ class CostValidator(ValidationRule):
             total += node_cost
         return total
 
-    def enter_operation_definition(
-        self, node, key, parent, path, ancestors
-    ):  # pylint: disable=unused-argument
-        if self.cost_map:
+    def get_field_cost_args(
+        self, node: FieldNode, field: GraphQLField, cost_args: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        cost_args = cost_args.copy()
+        if cost_args.get("multipliers"):
+            # Field arguments are only needed to resolve values of multipliers
+            self.used_variables.update(find_variables(node))
             try:
-                validate_cost_map(self.cost_map, self.context.schema)
-            except GraphQLError as cost_map_error:
-                self.context.report_error(cost_map_error)
-                return
+                field_args: Dict[str, Any] = get_argument_values(
+                    field, node, self.variables
+                )
+            except Exception as e:
+                self.report_error(e)
+                field_args = {}
+            cost_args["multipliers"] = self.get_multipliers_from_string(
+                cost_args["multipliers"], field_args
+            )
+        return cost_args
 
+    def compute_operation_cost(self, node: OperationDefinitionNode) -> int:
+        cache = self.get_operation_cache(node)
+        if cache:
+            cache_key = cache.get_key(self.variables)
+            if cache_key in cache.costs:
+                return cache.costs[cache_key]
+
+        self.used_variables = set()
+        self.has_errors = False
         if node.operation is OperationType.QUERY:
-            self.cost += self.compute_node_cost(node, self.context.schema.query_type)
-        if node.operation is OperationType.MUTATION:
-            self.cost += self.compute_node_cost(node, self.context.schema.mutation_type)
-        if node.operation is OperationType.SUBSCRIPTION:
-            self.cost += self.compute_node_cost(
-                node, self.context.schema.subscription_type
+            cost = self.compute_node_cost(node, self.context.schema.query_type)
+        elif node.operation is OperationType.MUTATION:
+            cost = self.compute_node_cost(node, self.context.schema.mutation_type)
+        else:
+            cost = self.compute_node_cost(node, self.context.schema.subscription_type)
+
+        if node.loc and not self.has_errors:
+            self.set_operation_cache(node, cost)
+        return cost
+
+    def get_operation_cache_key(self, node: OperationDefinitionNode) -> Hashable:
+        return (
+            self.default_cost,
+            self.default_complexity,
+            node.loc.source.body,  # type: ignore
+            node.name.value if node.name else None,
+        )
+
+    def get_operation_cache(
+        self, node: OperationDefinitionNode
+    ) -> Optional[CostCacheEntry]:
+        if not node.loc:
+            return None
+        return self.plan.operations.get(self.get_operation_cache_key(node))
+
+    def set_operation_cache(self, node: OperationDefinitionNode, cost: int):
+        operations = self.plan.operations
+        cache_key = self.get_operation_cache_key(node)
+        cache = operations.get(cache_key)
+        if cache is None:
+            if len(operations) >= COST_CACHE_SIZE:
+                del operations[next(iter(operations))]
+            cache = operations[cache_key] = CostCacheEntry(
+                tuple(sorted(self.used_variables))
             )
+        if len(cache.costs) >= COST_CACHE_SIZE:
+            cache.costs.clear()
+        cache.costs[cache.get_key(self.variables)] = cost
+
+    def enter_operation_definition(
+        self, node, key, parent, path, ancestors
+    ):  # pylint: disable=unused-argument
+        if self.plan.error:
+            self.context.report_error(self.plan.error)
+            return
+
+        operation_cost = self.compute_operation_cost(node)
+        costs = query_costs.get()
+        if costs is not None:
+            costs[id(node)] = operation_cost
+        self.cost += operation_cost
 
     def leave_operation_definition(
         self, node, key, parent, path, ancestors
@@ -190,91 +346,6 @@ class CostValidator(ValidationRule):
             return reduce(mul, self.operation_multipliers, complexity)
         return complexity
 
-    def get_args_from_cost_map(
-        self, node: FieldNode, parent_type: str, field_args: Dict
-    ):
-        cost_args = None
-        cost_map = cast(Dict[Any, Dict], self.cost_map)
-        if parent_type in cost_map:
-            cost_args = cost_map[parent_type].get(node.name.value)
-        if not cost_args:
-            return None
-        cost_args = cost_args.copy()
-        if "multipliers" in cost_args:
-            cost_args["multipliers"] = self.get_multipliers_from_string(
-                cost_args["multipliers"], field_args
-            )
-        return cost_args
-
-    def get_args_from_directives(self, directives, field_args):
-        cost_directive = next(
-            (directive for directive in directives if directive.name.value == "cost"),
-            None,
-        )
-        if cost_directive and cost_directive.arguments:
-            complexity_arg = next(
-                (
-                    argument
-                    for argument in cost_directive.arguments
-                    if argument.name.value == "complexity"
-                ),
-                None,
-            )
-            use_multipliers_arg = next(
-                (
-                    argument
-                    for argument in cost_directive.arguments
-                    if argument.name.value == "useMultipliers"
-                ),
-                None,
-            )
-            multipliers_arg = next(
-                (
-                    argument
-                    for argument in cost_directive.arguments
-                    if argument.name.value == "multipliers"
-                ),
-                None,
-            )
-            use_multipliers = (
-                use_multipliers_arg.value.value
-                if use_multipliers_arg
-                and use_multipliers_arg.value
-                and isinstance(use_multipliers_arg.value, BooleanValueNode)
-                else True
-            )
-            multipliers = (
-                self.get_multipliers_from_list_node(
-                    cast(List[Node], multipliers_arg.value.values), field_args
-                )
-                if multipliers_arg
-                and multipliers_arg.value
-                and isinstance(multipliers_arg.value, ListValueNode)
-                else []
-            )
-            complexity = (
-                int(complexity_arg.value.value)
-                if complexity_arg
-                and complexity_arg.value
-                and isinstance(complexity_arg.value, IntValueNode)
-                else None
-            )
-            return {
-                "complexity": complexity,
-                "multipliers": multipliers,
-                "use_multipliers": use_multipliers,
-            }
-
-        return None
-
-    def get_multipliers_from_list_node(self, multipliers: List[Node], field_args):
-        multipliers = [
-            node.value  # type: ignore
-            for node in multipliers
-            if isinstance(node, StringValueNode)
-        ]
-        return self.get_multipliers_from_string(multipliers, field_args)  # type: ignore
-
     def get_multipliers_from_string(self, multipliers: List[str], field_args):
         accessors = [s.split(".") for s in multipliers]
         multipliers = []
@@ -304,6 +375,73 @@ class CostValidator(ValidationRule):
         )
 
 
+def get_field_cost_directive_args(field: GraphQLField) -> Optional[Dict[str, Any]]:
+    if field.ast_node and field.ast_node.directives:
+        cost_args = get_cost_directive_args(field.ast_node.directives)
+        if cost_args is not None:
+            return cost_args
+
+    field_type = get_named_type(field.type)
+    if (
+        isinstance(field_type, GraphQLObjectType)
+        and field_type.ast_node
+        and field_type.ast_node.directives
+    ):
+        return get_cost_directive_args(field_type.ast_node.directives)
+
+    return None
+
+
+def get_cost_directive_args(directives) -> Optional[Dict[str, Any]]:
+    cost_directive = next(
+        (directive for directive in directives if directive.name.value == "cost"),
+        None,
+    )
+    if not cost_directive or not cost_directive.arguments:
+        return None
+
+    arguments = {
+        argument.name.value: argument.value for argument in cost_directive.arguments
+    }
+    complexity = arguments.get("complexity")
+    use_multipliers = arguments.get("useMultipliers")
+    multipliers = arguments.get("multipliers")
+    return {
+        "complexity": (
+            int(complexity.value) if isinstance(complexity, IntValueNode) else None
+        ),
+        "multipliers": (
+            [
+                node.value
+                for node in cast(List[Node], multipliers.values)
+                if isinstance(node, StringValueNode)
+            ]
+            if isinstance(multipliers, ListValueNode)
+            else []
+        ),
+        "use_multipliers": (
+            use_multipliers.value
+            if isinstance(use_multipliers, BooleanValueNode)
+            else True
+        ),
+    }
+
+
+def find_variables(node: Node) -> Set[str]:
+    visitor = VariablesVisitor()
+    visit(node, visitor)
+    return visitor.names
+
+
+class VariablesVisitor(Visitor):
+    def __init__(self) -> None:
+        super().__init__()
+        self.names: Set[str] = set()
+
+    def enter_variable(self, node: VariableNode, *_):
+        self.names.add(node.name.value)
+
+
 def validate_cost_map(cost_map: Dict[str, Dict[str, Any]], schema: GraphQLSchema):
     for type_name, type_fields in cost_map.items():
         if type_name not in schema.type_map:
@@ -347,6 +485,9 @@ def cost_validator(
     cost_map: Optional[Dict[str, Dict[str, Any]]] = None,
 ) -> Type[ASTValidationRule]:
     class _CostValidator(CostValidator):
+        # Cost map is frozen once instead of for every validated query
+        cost_map_key = freeze_args(cost_map) if cost_map else None
+
         def __init__(self, context: ValidationContext) -> None:
             super().__init__(
                 context,
@@ -358,3 +499,40 @@ def cost_validator(
             )
 
     return cast(Type[ASTValidationRule], _CostValidator)
+
+
+def analyze_query_cost(
+    schema: GraphQLSchema,
+    document: Union[str, DocumentNode],
+    *,
+    default_cost: int = 0,
+    default_complexity: int = 1,
+    variables: Optional[Dict] = None,
+    cost_map: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Dict[Optional[str], int]:
+    """Returns costs of document's operations without executing them
+
+    Costs are keyed by operations names, with `None` for anonymous operation.
+    """
+    if isinstance(document, str):
+        document = parse(document)
+
+    rule = cost_validator(
+        maxsize,
+        default_cost=default_cost,
+        default_complexity=default_complexity,
+        variables=variables,
+        cost_map=cost_map,
+    )
+    with collect_query_costs():
+        errors = validate(schema, document, [rule])
+        if errors:
+            raise errors[0]
+
+        return {
+            (definition.name.value if definition.name else None): cast(
+                int, get_query_cost(definition)
+            )
+            for definition in document.definitions
+            if isinstance(definition, OperationDefinitionNode)
+        }
@@ -0,0 +1,171 @@
+from typing import Dict, List, Optional, Set, Tuple
+
+from graphql import GraphQLError
+from graphql.language import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+)
+
+
+class QueryLimits:
+    """Limits checked before query is parsed and validated
+
+    Checks run in single pass over query's text or document, and reject it before
+    more expensive validation rules are ran.
+
+    `max_tokens` limit is checked by parser and requires graphql-core 3.2.3 or later.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_query_bytes: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        max_depth: Optional[int] = None,
+        max_aliases: Optional[int] = None,
+        max_root_fields: Optional[int] = None,
+    ) -> None:
+        self.max_query_bytes = max_query_bytes
+        self.max_tokens = max_tokens
+        self.max_depth = max_depth
+        self.max_aliases = max_aliases
+        self.max_root_fields = max_root_fields
+
+    def validate_query_size(self, query: str) -> None:
+        if self.max_query_bytes is None:
+            return
+
+        # Query can't be shorter in bytes than in characters
+        if len(query) <= self.max_query_bytes // 4:
+            return
+
+        query_bytes = len(query.encode("utf-8"))
+        if query_bytes > self.max_query_bytes:
+            raise GraphQLError(
+                "Query is too large: %d bytes exceeds the limit of %d bytes."
+                % (query_bytes, self.max_query_bytes)
+            )
+
+    def validate_document(self, document: DocumentNode) -> List[GraphQLError]:
+        if (
+            self.max_depth is None
+            and self.max_aliases is None
+            and self.max_root_fields is None
+        ):
+            return []
+
+        stats = DocumentStats(document)
+        errors = []
+        for operation in stats.operations:
+            depth, root_fields = stats.get_operation_stats(operation)
+            if self.max_depth is not None and depth > self.max_depth:
+                errors.append(
+                    GraphQLError(
+                        "%s is too deep: depth %d exceeds the limit of %d."
+                        % (get_operation_label(operation), depth, self.max_depth),
+                        operation,
+                    )
+                )
+            if self.max_root_fields is not None and root_fields > self.max_root_fields:
+                errors.append(
+                    GraphQLError(
+                        "%s has too many root fields: %d exceeds the limit of %d."
+                        % (
+                            get_operation_label(operation),
+                            root_fields,
+                            self.max_root_fields,
+                        ),
+                        operation,
+                    )
+                )
+
+        # Aliases are counted when operations are walked
+        if self.max_aliases is not None and stats.aliases > self.max_aliases:
+            errors.append(
+                GraphQLError(
+                    "Query has too many aliases: %d exceeds the limit of %d."
+                    % (stats.aliases, self.max_aliases)
+                )
+            )
+        return errors
+
+
+class DocumentStats:
+    """Depth, aliases and root fields counts of document's operations
+
+    Fragments stats are computed once and reused for every spread of fragment,
+    aliases in fragment are counted for each of its spreads.
+    """
+
+    def __init__(self, document: DocumentNode) -> None:
+        self.operations: List[OperationDefinitionNode] = []
+        self.fragments: Dict[str, FragmentDefinitionNode] = {}
+        for definition in document.definitions:
+            if isinstance(definition, OperationDefinitionNode):
+                self.operations.append(definition)
+            elif isinstance(definition, FragmentDefinitionNode):
+                self.fragments[definition.name.value] = definition
+
+        self.aliases = 0
+        # Depth, number of fields on first level and number of aliases
+        self.fragments_stats: Dict[str, Tuple[int, int, int]] = {}
+        self.visited_fragments: Set[str] = set()
+
+    def get_operation_stats(
+        self, operation: OperationDefinitionNode
+    ) -> Tuple[int, int]:
+        return self.get_selection_set_stats(operation.selection_set)
+
+    def get_selection_set_stats(
+        self, selection_set: Optional[SelectionSetNode]
+    ) -> Tuple[int, int]:
+        """Returns depth and number of fields on first level of selection set"""
+        if not selection_set:
+            return 0, 0
+
+        depth = 0
+        fields = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                fields += 1
+                if selection.alias:
+                    self.aliases += 1
+                child_depth, _ = self.get_selection_set_stats(selection.selection_set)
+                depth = max(depth, child_depth + 1)
+            elif isinstance(selection, InlineFragmentNode):
+                fragment_depth, fragment_fields = self.get_selection_set_stats(
+                    selection.selection_set
+                )
+                depth = max(depth, fragment_depth)
+                fields += fragment_fields
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment_depth, fragment_fields = self.get_fragment_stats(selection)
+                depth = max(depth, fragment_depth)
+                fields += fragment_fields
+        return depth, fields
+
+    def get_fragment_stats(self, spread: FragmentSpreadNode) -> Tuple[int, int]:
+        name = spread.name.value
+        if name in self.fragments_stats:
+            depth, fields, aliases = self.fragments_stats[name]
+            self.aliases += aliases  # Aliases are counted for every spread
+            return depth, fields
+        if name in self.visited_fragments or name not in self.fragments:
+            return 0, 0  # Cycles and unknown fragments are reported by validation
+
+        self.visited_fragments.add(name)
+        aliases = self.aliases
+        depth, fields = self.get_selection_set_stats(self.fragments[name].selection_set)
+        self.fragments_stats[name] = (depth, fields, self.aliases - aliases)
+        return depth, fields
+
+
+def get_operation_label(operation: OperationDefinitionNode) -> str:
+    if operation.name:
+        return "Operation '%s'" % operation.name.value
+    return "Operation"
@@ -20,6 +20,8 @@ from .exceptions import HttpBadRequestError, HttpError
 from .explorer import Explorer, ExplorerGraphiQL
 from .file_uploads import combine_multipart_data
 from .format_error import format_error
+from .introspection_cache import IntrospectionCache
+from .rate_limit import CostRateLimiter
 from .graphql import graphql_sync
 from .types import (
     ContextValue,
@@ -29,6 +31,7 @@ from .types import (
     RootValue,
     ValidationRules,
 )
+from .validation.query_limits import QueryLimits
 
 Extensions = Union[
     Callable[[Any, Optional[ContextValue]], ExtensionList], ExtensionList
@@ -54,16 +57,27 @@ class GraphQL:
         error_formatter: ErrorFormatter = format_error,
         extensions: Optional[Extensions] = None,
         middleware: Optional[Middlewares] = None,
+        query_limits: Optional[QueryLimits] = None,
+        introspection_cache: Optional[IntrospectionCache] = None,
+        rate_limiter: Optional[CostRateLimiter] = None,
     ) -> None:
         self.context_value = context_value
         self.root_value = root_value
         self.validation_rules = validation_rules
+        self.query_limits = query_limits
+        self.introspection_cache = introspection_cache
+        self.rate_limiter = rate_limiter
         self.debug = debug
         self.introspection = introspection
         self.logger = logger
         self.error_formatter = error_formatter
         self.extensions = extensions
         self.middleware = middleware
+        self.middleware_manager: Optional[MiddlewareManager] = None
+        if middleware and not callable(middleware):
+            # Static middleware list shares single manager between requests, so
+            # resolvers wrapped with middleware are cached
+            self.middleware_manager = MiddlewareManager(*middleware)
         self.schema = schema
 
         if explorer:
@@ -197,6 +211,9 @@ class GraphQL:
             context_value=context_value,
             root_value=self.root_value,
             validation_rules=self.validation_rules,
+            query_limits=self.query_limits,
+            introspection_cache=self.introspection_cache,
+            rate_limiter=self.rate_limiter,
             debug=self.debug,
             introspection=self.introspection,
             logger=self.logger,
@@ -221,8 +238,10 @@ class GraphQL:
         self, environ: dict, context: Optional[ContextValue]
     ) -> Optional[MiddlewareManager]:
         middleware = self.middleware
-        if callable(middleware):
-            middleware = middleware(environ, context)
+        if not callable(middleware):
+            return self.middleware_manager
+
+        middleware = middleware(environ, context)
         if middleware:
             return MiddlewareManager(*middleware)
         return None
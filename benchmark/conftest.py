@@ -5,7 +5,11 @@ from typing import List
 
 import pytest
 
-from ariadne import load_schema_from_path, make_executable_schema
+from ariadne import (
+    FallbackResolversSetter,
+    load_schema_from_path,
+    make_executable_schema,
+)
 
 BENCHMARK_DIR = os.path.dirname(__file__)
 
@@ -71,3 +75,8 @@ def type_defs():
 @pytest.fixture
 def schema(type_defs):
     return make_executable_schema(type_defs)
+
+
+@pytest.fixture
+def schema_with_adaptive_resolvers(type_defs):
+    return make_executable_schema(type_defs, FallbackResolversSetter(adaptive=True))
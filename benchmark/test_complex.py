@@ -68,3 +68,29 @@ def test_benchmark_complex_query_resolved_to_500_objects(
 
     result = benchmark(api_call)
     assert result.status_code == 200
+
+
+def test_benchmark_complex_query_resolved_to_500_dicts_by_adaptive_resolvers(
+    benchmark, schema_with_adaptive_resolvers, raw_data
+):
+    app = GraphQL(schema_with_adaptive_resolvers, root_value=raw_data)
+    client = TestClient(app)
+
+    def api_call():
+        return client.post("/", json={"query": COMPLEX_QUERY})
+
+    result = benchmark(api_call)
+    assert result.status_code == 200
+
+
+def test_benchmark_complex_query_resolved_to_500_objects_by_adaptive_resolvers(
+    benchmark, schema_with_adaptive_resolvers, hydrated_data
+):
+    app = GraphQL(schema_with_adaptive_resolvers, root_value={"users": hydrated_data})
+    client = TestClient(app)
+
+    def api_call():
+        return client.post("/", json={"query": COMPLEX_QUERY})
+
+    result = benchmark(api_call)
+    assert result.status_code == 200
@@ -0,0 +1,47 @@
+from unittest.mock import Mock
+
+from graphql import GraphQLResolveInfo
+
+from ariadne import convert_kwargs_to_snake_case, make_executable_schema
+
+BULK_MUTATION_TYPE_DEFS = """
+    type Query {
+        status: Boolean
+    }
+
+    type Mutation {
+        createOrders(orderItems: [OrderItemInput!]!): Boolean
+    }
+
+    input OrderItemInput {
+        productId: ID!
+        quantityOrdered: Int!
+        shippingAddress: AddressInput!
+    }
+
+    input AddressInput {
+        streetName: String!
+        postalCode: String!
+    }
+"""
+
+
+def test_benchmark_kwargs_conversion_for_10000_nested_input_items(benchmark):
+    schema = make_executable_schema(BULK_MUTATION_TYPE_DEFS)
+    info = Mock(spec=GraphQLResolveInfo, schema=schema)
+
+    @convert_kwargs_to_snake_case
+    def resolve_create_orders(*_, **kwargs):
+        return kwargs
+
+    order_items = [
+        {
+            "productId": i,
+            "quantityOrdered": 1,
+            "shippingAddress": {"streetName": "Main Street", "postalCode": "00-001"},
+        }
+        for i in range(10000)
+    ]
+
+    result = benchmark(resolve_create_orders, None, info, orderItems=order_items)
+    assert result["order_items"][0]["shipping_address"]["postal_code"] == "00-001"
@@ -0,0 +1,35 @@
+from starlette.testclient import TestClient
+
+from ariadne.asgi import GraphQL
+from ariadne.asgi.handlers import GraphQLHTTPHandler
+
+from .test_complex import COMPLEX_QUERY
+
+
+def middleware(next_, obj, info, **kwargs):
+    return next_(obj, info, **kwargs)
+
+
+def test_benchmark_complex_query_with_static_middleware(benchmark, schema, raw_data):
+    http_handler = GraphQLHTTPHandler(middleware=[middleware])
+    app = GraphQL(schema, root_value=raw_data, http_handler=http_handler)
+    client = TestClient(app)
+
+    def api_call():
+        return client.post("/", json={"query": COMPLEX_QUERY})
+
+    result = benchmark(api_call)
+    assert result.status_code == 200
+
+
+def test_benchmark_complex_query_with_middleware_function(benchmark, schema, raw_data):
+    # Middleware function result is wrapped in new manager for every request
+    http_handler = GraphQLHTTPHandler(middleware=lambda *_: [middleware])
+    app = GraphQL(schema, root_value=raw_data, http_handler=http_handler)
+    client = TestClient(app)
+
+    def api_call():
+        return client.post("/", json={"query": COMPLEX_QUERY})
+
+    result = benchmark(api_call)
+    assert result.status_code == 200
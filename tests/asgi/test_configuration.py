@@ -14,6 +14,7 @@ from ariadne.asgi.handlers import (
     GraphQLWSHandler,
 )
 from ariadne.types import Extension
+from ariadne.validation import QueryLimits
 
 
 def test_custom_context_value_is_passed_to_resolvers(schema):
@@ -201,6 +202,15 @@ def test_custom_validation_rules_function_is_called_with_context_value(
     get_validation_rules.assert_called_once_with({"test": "TEST-CONTEXT"}, ANY, ANY)
 
 
+def test_query_limits_are_checked_on_query_execution(schema):
+    app = GraphQL(schema, query_limits=QueryLimits(max_aliases=1))
+    client = TestClient(app)
+    response = client.post("/", json={"query": "{ a: status b: status }"})
+    assert response.json() == {
+        "errors": [{"message": "Query has too many aliases: 2 exceeds the limit of 1."}]
+    }
+
+
 def execute_failing_query(app):
     client = TestClient(app)
     client.post("/", json={"query": "{ error }"})
@@ -523,6 +533,17 @@ def test_middlewares_are_passed_to_query_executor(schema):
     assert response.json() == {"data": {"hello": "**Hello, BOB!**"}}
 
 
+def test_middleware_manager_is_reused_between_requests(schema):
+    http_handler = GraphQLHTTPHandler(middleware=[middleware])
+    app = GraphQL(schema, http_handler=http_handler)
+    client = TestClient(app)
+    for _ in range(2):
+        response = client.post("/", json={"query": '{ hello(name: "BOB") }'})
+        assert response.json() == {"data": {"hello": "**Hello, BOB!**"}}
+    # pylint: disable=protected-access
+    assert len(http_handler.middleware_manager._cached_resolvers) == 1
+
+
 def test_middleware_function_result_is_passed_to_query_executor(schema):
     def get_middleware(*_):
         return [middleware]
@@ -1,14 +1,17 @@
+import asyncio
 import json
 
 import pytest
 from starlette.testclient import TestClient
 
+from ariadne import QueryType, make_executable_schema
 from ariadne.asgi import GraphQL
 from ariadne.asgi.handlers import (
     GraphQLHTTPHandler,
     GraphQLTransportWSHandler,
     GraphQLWSHandler,
 )
+from ariadne.exceptions import ExecutionCancelledError
 from ariadne.types import Extension
 
 operation_name = "SayHello"
@@ -220,3 +223,73 @@ def test_schema_not_set(client, snapshot):
         )
         assert response.status_code == 200
         snapshot.assert_match(response.json())
+
+
+def create_disconnecting_receive(body, disconnect):
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        await disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    return receive
+
+
+@pytest.mark.asyncio
+async def test_execution_is_cancelled_when_client_disconnects():
+    resolver_started = asyncio.Event()
+    disconnect = asyncio.Event()
+    cancelled = []
+    finished = []
+
+    async def resolve_slow(*_):
+        resolver_started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    class TrackingExtension(Extension):
+        def has_errors(self, errors, context):
+            finished.extend(errors)
+
+    query = QueryType()
+    query.set_field("slow", resolve_slow)
+    schema = make_executable_schema("type Query { slow: Int }", query)
+    app = GraphQL(
+        schema,
+        http_handler=GraphQLHTTPHandler([TrackingExtension], cancel_on_disconnect=True),
+    )
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/",
+        "query_string": b"",
+        "headers": [(b"content-type", b"application/json")],
+    }
+    receive = create_disconnecting_receive(b'{"query": "{ slow }"}', disconnect)
+    request = asyncio.ensure_future(app(scope, receive, send))
+    await resolver_started.wait()
+    disconnect.set()
+    await request
+
+    assert cancelled == [True]
+    assert isinstance(finished[0], ExecutionCancelledError)
+    assert sent[0]["status"] == 499
+
+
+def test_cancel_on_disconnect_is_disabled_by_default(schema):
+    http_handler = GraphQLHTTPHandler()
+    assert not http_handler.cancel_on_disconnect
+    client = TestClient(GraphQL(schema, http_handler=http_handler))
+    response = client.post("/", json={"query": "{ status }"})
+    assert response.json() == {"data": {"status": True}}
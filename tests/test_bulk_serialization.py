@@ -0,0 +1,170 @@
+from array import array
+from enum import Enum
+
+import pytest
+from graphql import GraphQLEnumType, GraphQLEnumValue
+
+from ariadne import (
+    EnumType,
+    QueryType,
+    ScalarType,
+    graphql_sync,
+    make_executable_schema,
+)
+from ariadne.enums import get_enum_bulk_serializer
+from ariadne.execution import CompiledExecutionContext
+from ariadne.scalars import (
+    bulk_serialize_float,
+    bulk_serialize_id,
+    bulk_serialize_int,
+)
+
+type_defs = """
+    scalar Money
+    scalar Date
+
+    type Query {
+        ints: [Int!]!
+        floats: [Float!]!
+        ids: [ID!]!
+        roles: [Role!]!
+        prices: [Money!]!
+        dates: [Date!]!
+        matrix: [[Float!]!]!
+    }
+
+    enum Role {
+        ADMIN
+        USER
+    }
+"""
+
+
+class Role(Enum):
+    ADMIN = "admin"
+    USER = "user"
+
+
+@pytest.fixture
+def values():
+    return {}
+
+
+@pytest.fixture
+def serialized():
+    return []
+
+
+@pytest.fixture
+def bulk_schema(values, serialized):
+    query = QueryType()
+    for field_name in ("ints", "floats", "ids", "roles", "prices", "dates", "matrix"):
+        query.set_field(field_name, lambda *_, name=field_name: values[name])
+
+    money = ScalarType("Money", serializer=lambda value: "%.2f" % value)
+
+    @money.bulk_serializer
+    def bulk_serialize_money(items):
+        serialized.append(len(items))
+        return ["%.2f" % value for value in items]
+
+    date = ScalarType("Date", serializer=str)
+
+    return make_executable_schema(type_defs, query, money, date, EnumType("Role", Role))
+
+
+def execute(schema, query):
+    _, result = graphql_sync(
+        schema, {"query": query}, execution_context_class=CompiledExecutionContext
+    )
+    return result
+
+
+def test_list_of_ints_is_serialized_in_bulk(bulk_schema, values):
+    values["ints"] = [1, 2, 3]
+    assert execute(bulk_schema, "{ ints }") == {"data": {"ints": [1, 2, 3]}}
+
+
+def test_array_of_floats_is_serialized_in_bulk(bulk_schema, values):
+    values["floats"] = array("d", [0.5, 1.5])
+    assert execute(bulk_schema, "{ floats }") == {"data": {"floats": [0.5, 1.5]}}
+
+
+def test_object_supporting_buffer_protocol_is_serialized_in_bulk(bulk_schema, values):
+    values["ints"] = memoryview(array("l", [4, 5]))
+    assert execute(bulk_schema, "{ ints }") == {"data": {"ints": [4, 5]}}
+
+
+def test_nested_lists_are_serialized_in_bulk(bulk_schema, values):
+    values["matrix"] = (array("f", [1, 2]), [3.0])
+    assert execute(bulk_schema, "{ matrix }") == {
+        "data": {"matrix": [[1.0, 2.0], [3.0]]}
+    }
+
+
+def test_ints_are_serialized_to_strings_for_ids(bulk_schema, values):
+    values["ids"] = ["a", 1]
+    assert execute(bulk_schema, "{ ids }") == {"data": {"ids": ["a", "1"]}}
+
+
+def test_enum_values_are_serialized_in_bulk(bulk_schema, values):
+    values["roles"] = [Role.USER, Role.ADMIN]
+    assert execute(bulk_schema, "{ roles }") == {"data": {"roles": ["USER", "ADMIN"]}}
+
+
+def test_scalar_bulk_serializer_is_used(bulk_schema, values, serialized):
+    values["prices"] = [1, 2.5]
+    assert execute(bulk_schema, "{ prices }") == {"data": {"prices": ["1.00", "2.50"]}}
+    assert serialized == [2]
+
+
+def test_scalar_without_bulk_serializer_is_serialized_item_by_item(bulk_schema, values):
+    values["dates"] = [1, 2]
+    assert execute(bulk_schema, "{ dates }") == {"data": {"dates": ["1", "2"]}}
+
+
+def test_list_with_invalid_item_is_completed_item_by_item(bulk_schema, values):
+    values["ints"] = [1, "invalid"]
+    result = execute(bulk_schema, "{ ints }")
+    assert result["data"] is None
+    assert result["errors"][0]["path"] == ["ints", 1]
+
+
+def test_enum_list_with_invalid_item_is_completed_item_by_item(bulk_schema, values):
+    values["roles"] = [Role.USER, "invalid"]
+    result = execute(bulk_schema, "{ roles }")
+    assert result["errors"][0]["message"] == (
+        "Enum 'Role' cannot represent value: 'invalid'"
+    )
+    assert result["errors"][0]["path"] == ["roles", 1]
+
+
+def test_int_bulk_serializer_rejects_values_out_of_range():
+    assert bulk_serialize_int([1, 2**31]) is None
+    assert bulk_serialize_int([True]) is None
+
+
+def test_float_bulk_serializer_rejects_non_finite_values():
+    assert bulk_serialize_float([1, 2.5]) == [1.0, 2.5]
+    assert bulk_serialize_float([float("nan")]) is None
+
+
+def test_id_bulk_serializer_rejects_other_values():
+    assert bulk_serialize_id([1.5]) is None
+
+
+def test_enum_bulk_serializer_serializes_values_like_enum_type():
+    enum_type = GraphQLEnumType(
+        "Level",
+        {
+            "LOW": GraphQLEnumValue(1),
+            "MINIMAL": GraphQLEnumValue(1),
+            "HIGH": GraphQLEnumValue(2),
+            "UNSET": GraphQLEnumValue(None),
+        },
+    )
+    bulk_serialize_enum = get_enum_bulk_serializer(enum_type)
+    values = [1, 2, "UNSET"]
+    assert bulk_serialize_enum(values) == [enum_type.serialize(v) for v in values]
+    assert bulk_serialize_enum([3]) is None
+    assert bulk_serialize_enum([[1]]) is None
@@ -0,0 +1,264 @@
+import asyncio
+
+import pytest
+from graphql import ExecutionContext
+
+from ariadne import (
+    ObjectType,
+    QueryType,
+    graphql,
+    graphql_sync,
+    make_executable_schema,
+    UnionType,
+    snake_case_fallback_resolvers,
+)
+from ariadne.execution import CompiledExecutionContext
+
+type_defs = """
+    type Query {
+        users: [User!]
+        user: User
+        search: [Result]
+    }
+
+    type User {
+        id: ID!
+        name: String
+        fullName: String
+        role: Role
+        score: Int
+        tags: [String!]
+        friends: [User!]
+        group: Group!
+        greeting(prefix: String!): String
+        custom: String
+    }
+
+    type Group {
+        name: String!
+    }
+
+    enum Role {
+        ADMIN
+        USER
+    }
+
+    union Result = User | Group
+"""
+
+
+class User:
+    def __init__(self, name, **kwargs):
+        self.name = name
+        self.__dict__.update(kwargs)
+
+    def greeting(self, info, prefix):  # pylint: disable=unused-argument
+        return f"{prefix} {self.name}"
+
+
+async def get_value(value):
+    return value
+
+
+def create_schema(users):
+    query = QueryType()
+    query.set_field("users", lambda *_: users)
+    query.set_field("user", lambda *_: users[0])
+    query.set_field("search", lambda *_: users)
+
+    user = ObjectType("User")
+    user.set_field("custom", lambda obj, *_: f"custom {obj['id']}")
+
+    result = UnionType("Result", lambda *_: "User")
+
+    return make_executable_schema(
+        type_defs, query, user, result, snake_case_fallback_resolvers
+    )
+
+
+def execute(schema, query, execution_context_class=CompiledExecutionContext):
+    return graphql_sync(
+        schema, {"query": query}, execution_context_class=execution_context_class
+    )
+
+
+def assert_same_result(schema, query):
+    result = execute(schema, query)
+    assert result == execute(schema, query, ExecutionContext)
+    return result
+
+
+@pytest.fixture
+def users():
+    return [
+        {
+            "id": i,
+            "name": f"User {i}",
+            "full_name": f"Full name {i}",
+            "role": "ADMIN" if i % 2 else "USER",
+            "score": i * 10,
+            "tags": ["a", "b"],
+            "friends": [{"id": 100 + i, "group": {"name": "Friends"}}],
+            "group": {"name": "Group"},
+        }
+        for i in range(3)
+    ]
+
+
+def test_graphql_uses_execution_context_by_default(users, mocker):
+    compile_fields = mocker.spy(CompiledExecutionContext, "compile_fields")
+    graphql_sync(create_schema(users), {"query": "{ users { id name } }"})
+    compile_fields.assert_not_called()
+
+
+def test_resolver_set_after_first_execution_is_used(users):
+    schema = create_schema(users)
+    execute(schema, "{ users { name } }")
+    schema.type_map["User"].fields["name"].resolve = lambda *_: "Rebound"
+    _, result = execute(schema, "{ users { name } }")
+    assert result["data"]["users"][0] == {"name": "Rebound"}
+
+
+def test_compiled_execution_returns_same_result_as_execution_context(users):
+    success, result = assert_same_result(
+        create_schema(users),
+        """
+        {
+            users {
+                __typename
+                id
+                name
+                fullName
+                role
+                score
+                tags
+                custom
+                friends { id group { name } }
+                group { name }
+            }
+        }
+        """,
+    )
+    assert success
+    assert result["data"]["users"][1] == {
+        "__typename": "User",
+        "id": "1",
+        "name": "User 1",
+        "fullName": "Full name 1",
+        "role": "ADMIN",
+        "score": 10,
+        "tags": ["a", "b"],
+        "custom": "custom 1",
+        "friends": [{"id": "101", "group": {"name": "Friends"}}],
+        "group": {"name": "Group"},
+    }
+
+
+def test_compiled_execution_calls_methods_with_arguments():
+    schema = create_schema([User(id=1, name="Bob")])
+    _, result = assert_same_result(schema, '{ users { greeting(prefix: "Hi") } }')
+    assert result == {"data": {"users": [{"greeting": "Hi Bob"}]}}
+
+
+def test_compiled_execution_propagates_errors_like_execution_context(users):
+    users[0]["score"] = "invalid"
+    users[0]["tags"] = ["a", None]
+    users[1]["group"] = None
+    _, result = assert_same_result(
+        create_schema(users), "{ users { id score tags group { name } } }"
+    )
+    assert result["data"] == {"users": None}
+    assert len(result["errors"]) == 3
+
+
+def test_compiled_execution_reports_exceptions_returned_as_values(users):
+    users[0]["name"] = ValueError("Invalid name")
+    _, result = assert_same_result(create_schema(users), "{ user { id name } }")
+    assert result["errors"][0]["message"] == "Invalid name"
+    assert result["errors"][0]["path"] == ["user", "name"]
+
+
+def test_compiled_execution_completes_abstract_types_with_execution_context(users):
+    _, result = assert_same_result(
+        create_schema(users), "{ search { ... on User { id } } }"
+    )
+    assert result["data"]["search"][0] == {"id": "0"}
+
+
+@pytest.mark.asyncio
+async def test_compiled_execution_awaits_awaitable_values(users):
+    users[0]["name"] = get_value("Async")
+    users[1]["tags"] = [get_value("a"), "b"]
+    users[2]["group"] = get_value(None)
+    _, result = await graphql(
+        create_schema(users),
+        {"query": "{ users { name tags group { name } } }"},
+        execution_context_class=CompiledExecutionContext,
+    )
+    assert result["data"] == {"users": None}
+    assert result["errors"][0]["message"] == (
+        "Cannot return null for non-nullable field User.group."
+    )
+    assert result["errors"][0]["path"] == ["users", 2, "group"]
+
+
+@pytest.mark.asyncio
+async def test_compiled_execution_awaits_values_in_order(users):
+    users[0]["name"] = get_value("Async")
+    users[1]["tags"] = [get_value("a"), "b"]
+    _, result = await graphql(
+        create_schema(users),
+        {"query": "{ users { name tags } }"},
+        execution_context_class=CompiledExecutionContext,
+    )
+    assert result["data"]["users"][0]["name"] == "Async"
+    assert result["data"]["users"][1]["tags"] == ["a", "b"]
+
+
+def test_compiled_execution_is_not_used_with_middleware(users):
+    def middleware(next_, *args, **kwargs):
+        value = next_(*args, **kwargs)
+        return f"*{value}*" if isinstance(value, str) else value
+
+    _, result = graphql_sync(
+        create_schema(users),
+        {"query": "{ user { name } }"},
+        middleware=[middleware],
+        execution_context_class=CompiledExecutionContext,
+    )
+    assert result == {"data": {"user": {"name": "*User 0*"}}}
+
+
+def test_compiled_execution_is_disabled_for_overridden_completion(users):
+    class CustomExecutionContext(CompiledExecutionContext):
+        @staticmethod
+        def complete_leaf_value(return_type, result):
+            return f"={result}="
+
+    _, result = execute(
+        create_schema(users), "{ user { name } }", CustomExecutionContext
+    )
+    assert result == {"data": {"user": {"name": "=User 0="}}}
+
+
+def test_compiled_execution_is_used_by_default(users):
+    schema = create_schema(users)
+    assert graphql_sync(schema, {"query": "{ users { id } }"}) == execute(
+        schema, "{ users { id } }"
+    )
+
+
+@pytest.mark.asyncio
+async def test_compiled_execution_completes_async_iterables(users):
+    async def iterate_tags():
+        for tag in ("a", "b"):
+            await asyncio.sleep(0)
+            yield tag
+
+    users[0]["tags"] = iterate_tags()
+    _, result = await graphql(
+        create_schema(users),
+        {"query": "{ user { tags } }"},
+        execution_context_class=CompiledExecutionContext,
+    )
+    assert result == {"data": {"user": {"tags": ["a", "b"]}}}
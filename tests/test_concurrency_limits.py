@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+
+from ariadne import ObjectType, QueryType, graphql, make_executable_schema
+from ariadne.execution import (
+    CompiledExecutionContext,
+    concurrency_directive,
+    concurrency_limit,
+    get_concurrency_limits,
+)
+
+type_defs = """
+    type Query {
+        users(count: Int!): [User!]!
+        limitedUsers(count: Int!): [User!]! @concurrency(limit: 2)
+    }
+
+    type User {
+        id: Int!
+        name: String!
+        avatar: String @concurrency(limit: 3)
+        friend: User @concurrency(limit: 1)
+    }
+"""
+
+
+class ConcurrencyTracker:
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+
+    async def run(self, value, delay):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(delay)
+        self.running -= 1
+        return value
+
+
+@pytest.fixture
+def tracker():
+    return ConcurrencyTracker()
+
+
+@pytest.fixture
+def schema(tracker):
+    query = QueryType()
+
+    @query.field("users")
+    @query.field("limitedUsers")
+    def resolve_users(*_, count):
+        return [{"id": i} for i in range(count)]
+
+    user = ObjectType("User")
+
+    @user.field("name")
+    async def resolve_name(obj, *_):
+        # Later items finish first, results have to be kept in order anyway
+        return await tracker.run(f"User {obj['id']}", 0.01 / (obj["id"] + 1))
+
+    @user.field("avatar")
+    async def resolve_avatar(obj, *_):
+        return await tracker.run(f"{obj['id']}.png", 0)
+
+    @user.field("friend")
+    async def resolve_friend(obj, *_):
+        return {"id": obj["id"] + 100}
+
+    return make_executable_schema([concurrency_directive, type_defs], query, user)
+
+
+def test_concurrency_limits_are_found_once_per_schema(schema):
+    limits = get_concurrency_limits(schema)
+    assert limits is get_concurrency_limits(schema)
+    lists_limits, fields_limits = limits
+    assert lists_limits == {("Query", "limitedUsers"): 2}
+    assert fields_limits == {("User", "avatar"): 3, ("User", "friend"): 1}
+
+
+@pytest.mark.asyncio
+async def test_list_items_are_completed_with_limited_concurrency(schema, tracker):
+    _, result = await graphql(
+        schema,
+        {"query": "{ users(count: 10) { name } }"},
+        execution_context_class=concurrency_limit(max_list_concurrency=4),
+    )
+    assert tracker.max_running == 4
+    assert result["data"]["users"] == [{"name": f"User {i}"} for i in range(10)]
+
+
+@pytest.mark.asyncio
+async def test_list_items_concurrency_is_not_limited_by_default(schema, tracker):
+    await graphql(schema, {"query": "{ users(count: 10) { name } }"})
+    assert tracker.max_running == 10
+
+
+@pytest.mark.asyncio
+async def test_list_items_concurrency_is_limited_by_directive(schema, tracker):
+    _, result = await graphql(
+        schema,
+        {"query": "{ limitedUsers(count: 10) { id name } }"},
+        execution_context_class=CompiledExecutionContext,
+    )
+    assert tracker.max_running == 2
+    assert [user["id"] for user in result["data"]["limitedUsers"]] == list(range(10))
+
+
+@pytest.mark.asyncio
+async def test_field_resolvers_concurrency_is_limited_by_directive(schema, tracker):
+    _, result = await graphql(
+        schema,
+        {"query": "{ users(count: 10) { avatar } }"},
+        execution_context_class=CompiledExecutionContext,
+    )
+    assert tracker.max_running == 3
+    assert result["data"]["users"][9] == {"avatar": "9.png"}
+
+
+@pytest.mark.asyncio
+async def test_nested_fields_with_limited_concurrency_dont_block_each_other(schema):
+    _, result = await graphql(
+        schema,
+        {"query": "{ users(count: 3) { friend { friend { id } } } }"},
+        execution_context_class=CompiledExecutionContext,
+    )
+    assert result["data"]["users"][2] == {"friend": {"friend": {"id": 202}}}
+
+
+@pytest.mark.asyncio
+async def test_list_items_concurrency_is_limited_with_middleware(schema, tracker):
+    def middleware(next_, *args, **kwargs):
+        return next_(*args, **kwargs)
+
+    _, result = await graphql(
+        schema,
+        {"query": "{ limitedUsers(count: 5) { name } }"},
+        middleware=[middleware],
+        execution_context_class=CompiledExecutionContext,
+    )
+    assert tracker.max_running == 2
+    assert result["data"]["limitedUsers"][4] == {"name": "User 4"}
@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from ariadne import QueryType, graphql, make_executable_schema
+from ariadne.execution import eager_execution, step_coroutine
+
+type_defs = """
+    type Query {
+        cached: Int!
+        slow: Int!
+        items(count: Int!): [Int!]!
+        shared: Int!
+        error: Int
+    }
+"""
+
+
+@pytest.fixture
+def eager_schema():
+    query = QueryType()
+
+    @query.field("cached")
+    async def resolve_cached(*_):
+        return 42
+
+    @query.field("slow")
+    async def resolve_slow(*_):
+        await asyncio.sleep(0)
+        return 21
+
+    @query.field("items")
+    def resolve_items(*_, count):
+        async def resolve_item(i):
+            return i
+
+        return [resolve_item(i) for i in range(count)]
+
+    @query.field("shared")
+    async def resolve_shared(_, info):
+        return await info.context["future"]
+
+    @query.field("error")
+    async def resolve_error(*_):
+        raise ValueError("Test error")
+
+    return make_executable_schema(type_defs, query)
+
+
+async def execute(schema, query, context_value=None):
+    return await graphql(
+        schema,
+        {"query": query},
+        context_value=context_value,
+        execution_context_class=eager_execution(),
+    )
+
+
+def test_coroutine_that_returns_without_suspending_is_stepped_to_result():
+    async def coroutine():
+        return 42
+
+    assert step_coroutine(coroutine()) == (True, 42)
+
+
+@pytest.mark.asyncio
+async def test_coroutine_that_suspends_is_resumed_when_awaited():
+    async def coroutine():
+        await asyncio.sleep(0)
+        return 42
+
+    returned, result = step_coroutine(coroutine())
+    assert not returned
+    assert await result == 42
+
+
+@pytest.mark.asyncio
+async def test_async_resolvers_are_completed_eagerly(eager_schema):
+    success, result = await execute(eager_schema, "{ cached slow }")
+    assert success
+    assert result == {"data": {"cached": 42, "slow": 21}}
+
+
+@pytest.mark.asyncio
+async def test_awaitable_list_items_are_completed(eager_schema):
+    _, result = await execute(eager_schema, "{ items(count: 3) }")
+    assert result == {"data": {"items": [0, 1, 2]}}
+
+
+@pytest.mark.asyncio
+async def test_future_awaited_by_many_suspended_coroutines_is_resolved(
+    eager_schema,
+):
+    future = asyncio.get_running_loop().create_future()
+    asyncio.get_running_loop().call_soon(future.set_result, 7)
+    _, result = await execute(
+        eager_schema, "{ a: shared b: shared }", {"future": future}
+    )
+    assert result == {"data": {"a": 7, "b": 7}}
+
+
+@pytest.mark.asyncio
+async def test_error_raised_by_eager_resolver_is_handled(eager_schema):
+    _, result = await execute(eager_schema, "{ cached error }")
+    assert result["data"] == {"cached": 42, "error": None}
+    assert result["errors"][0]["message"] == "Test error"
+    assert result["errors"][0]["path"] == ["error"]
@@ -0,0 +1,217 @@
+import pytest
+
+from ariadne import QueryType, graphql, graphql_sync, make_executable_schema
+from ariadne.execution import (
+    CompiledExecutionContext,
+    concurrency_directive,
+    eager_execution,
+)
+from ariadne.execution_budget import execution_budget
+
+type_defs = """
+    type Query {
+        items(count: Int!): [Item!]
+        generated(count: Int!): [Int!]
+        asyncItems(count: Int!): [Item!]
+        text(length: Int!): String
+    }
+
+    type Item {
+        id: Int!
+        name: String
+    }
+"""
+
+
+@pytest.fixture
+def resolved_ids():
+    return []
+
+
+@pytest.fixture
+def budget_schema(resolved_ids):
+    query = QueryType()
+
+    @query.field("items")
+    def resolve_items(*_, count):
+        return [{"id": i, "name": "item"} for i in range(count)]
+
+    @query.field("generated")
+    def resolve_generated(*_, count):
+        for i in range(count):
+            resolved_ids.append(i)
+            yield i
+
+    @query.field("asyncItems")
+    async def resolve_async_items(*_, count):
+        return [{"id": i, "name": "item"} for i in range(count)]
+
+    @query.field("text")
+    def resolve_text(*_, length):
+        return "x" * length
+
+    return make_executable_schema(type_defs, query)
+
+
+def execute(schema, query, **budget):
+    return graphql_sync(
+        schema,
+        {"query": query},
+        execution_context_class=execution_budget(**budget),
+    )
+
+
+def test_execution_within_budget_returns_result(budget_schema):
+    success, result = execute(
+        budget_schema,
+        "{ items(count: 2) { id } }",
+        max_resolver_calls=3,
+        max_list_items=2,
+        max_result_nodes=5,
+        max_result_bytes=100,
+    )
+    assert success
+    assert result == {"data": {"items": [{"id": 0}, {"id": 1}]}}
+
+
+def test_execution_exceeding_resolver_calls_is_aborted(budget_schema):
+    _, result = execute(
+        budget_schema, "{ items(count: 10) { id name } }", max_resolver_calls=10
+    )
+    assert result == {
+        "data": None,
+        "errors": [
+            {
+                "message": (
+                    "Execution was aborted because it exceeded "
+                    "the limit of 10 resolver calls."
+                ),
+                "locations": [{"line": 1, "column": 3}],
+                "path": ["items", 4],
+            }
+        ],
+    }
+
+
+def test_execution_exceeding_list_items_is_aborted_before_items_are_completed(
+    budget_schema,
+):
+    _, result = execute(
+        budget_schema, "{ items(count: 100) { id } }", max_list_items=50
+    )
+    assert result["data"] is None
+    assert result["errors"][0]["message"] == (
+        "Execution was aborted because it exceeded the limit of 50 list items."
+    )
+
+
+def test_generated_list_is_consumed_only_until_limit_is_crossed(
+    budget_schema, resolved_ids
+):
+    _, result = execute(budget_schema, "{ generated(count: 1000) }", max_list_items=10)
+    assert result["data"] is None
+    assert len(resolved_ids) == 11
+
+
+def test_execution_exceeding_result_nodes_is_aborted(budget_schema):
+    _, result = execute(
+        budget_schema, "{ items(count: 3) { id name } }", max_result_nodes=8
+    )
+    assert result["errors"][0]["message"] == (
+        "Execution was aborted because it exceeded the limit of 8 result nodes."
+    )
+
+
+def test_execution_exceeding_result_bytes_is_aborted(budget_schema):
+    success, _ = execute(budget_schema, "{ text(length: 90) }", max_result_bytes=100)
+    assert success
+
+    _, result = execute(budget_schema, "{ text(length: 100) }", max_result_bytes=100)
+    assert result["errors"][0]["message"] == (
+        "Execution was aborted because it exceeded the limit of 100 result bytes."
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_execution_exceeding_budget_is_aborted(budget_schema):
+    _, result = await graphql(
+        budget_schema,
+        {"query": "{ a: asyncItems(count: 5) { id } b: asyncItems(count: 5) { id } }"},
+        execution_context_class=execution_budget(max_list_items=8),
+    )
+    assert result["data"] is None
+    assert [error["message"] for error in result["errors"]] == [
+        "Execution was aborted because it exceeded the limit of 8 list items."
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_execution_exceeding_budget_doesnt_call_sibling_resolvers():
+    query = QueryType()
+    resolved_fields = []
+
+    @query.field("asyncItems")
+    async def resolve_async_items(_, info, count):
+        resolved_fields.append(info.path.key)
+        return [{"id": i} for i in range(count)]
+
+    schema = make_executable_schema(type_defs, query)
+    _, result = await graphql(
+        schema,
+        {
+            "query": (
+                "{ a: asyncItems(count: 5) { id } b: asyncItems(count: 5) { id } "
+                "c: asyncItems(count: 5) { id } }"
+            )
+        },
+        execution_context_class=execution_budget(max_list_items=8),
+    )
+    assert result["data"] is None
+    assert resolved_fields == ["a", "b"]
+
+
+def test_budget_execution_context_is_compiled_execution_context():
+    assert issubclass(execution_budget(max_list_items=1), CompiledExecutionContext)
+
+
+@pytest.mark.asyncio
+async def test_budget_is_checked_with_eager_resolvers_and_concurrency_limits():
+    query = QueryType()
+
+    @query.field("items")
+    async def resolve_items(*_, count):
+        return [{"id": i} for i in range(count)]
+
+    schema = make_executable_schema(
+        [
+            concurrency_directive,
+            """
+            type Query {
+                items(count: Int!): [Item!] @concurrency(limit: 2)
+            }
+
+            type Item {
+                id: Int!
+            }
+            """,
+        ],
+        query,
+    )
+    execution_context_class = eager_execution(execution_budget(max_list_items=3))
+
+    _, result = await graphql(
+        schema,
+        {"query": "{ items(count: 3) { id } }"},
+        execution_context_class=execution_context_class,
+    )
+    assert result == {"data": {"items": [{"id": 0}, {"id": 1}, {"id": 2}]}}
+
+    _, result = await graphql(
+        schema,
+        {"query": "{ items(count: 4) { id } }"},
+        execution_context_class=execution_context_class,
+    )
+    assert result["data"] is None
+    assert result["errors"][0]["message"] == (
+        "Execution was aborted because it exceeded the limit of 3 list items."
+    )
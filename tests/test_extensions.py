@@ -2,8 +2,10 @@ from unittest.mock import Mock
 
 import pytest
 
+from graphql import MiddlewareManager, parse
+
 from ariadne import ExtensionManager, graphql
-from ariadne.types import Extension
+from ariadne.types import Extension, ExtensionSync
 
 
 context = {}
@@ -55,9 +57,139 @@ class BaseExtension(Extension):
     pass
 
 
+class ParsingExtension(Extension):
+    def __init__(self):
+        self.parsed = []
+
+    def document_parsed(self, document, operation_name, variables, context):
+        self.parsed.append((document, operation_name, variables, context))
+
+
+def test_document_parsed_hook_is_called_by_extension_manager():
+    extension = ParsingExtension()
+    manager = ExtensionManager([lambda: extension], context)
+    document = parse("{ status }")
+    manager.document_parsed(document, "Status", {"a": 1})
+    assert extension.parsed == [(document, "Status", {"a": 1}, context)]
+
+
+class ProtocolExtension:
+    def request_started(self, context):
+        pass
+
+    def request_finished(self, context):
+        pass
+
+    def has_errors(self, errors, context):
+        pass
+
+    def format(self, context):
+        return {"protocol": True}
+
+
+@pytest.mark.asyncio
+async def test_extension_implementing_protocol_without_new_hooks_is_supported(schema):
+    _, response = await graphql(
+        schema, {"query": "{ status }"}, extensions=[ProtocolExtension]
+    )
+    assert response == {"data": {"status": True}, "extensions": {"protocol": True}}
+
+
 @pytest.mark.asyncio
 async def test_default_extension_hooks_dont_interrupt_query_execution(schema):
     _, response = await graphql(
         schema, {"query": "{ status }"}, extensions=[BaseExtension]
     )
     assert response["data"] == {"status": True}
+
+
+def test_extension_not_overriding_resolve_is_excluded_from_middleware():
+    manager = ExtensionManager([BaseExtension], context)
+    assert manager.as_middleware_manager(None) is None
+
+
+def test_middleware_manager_is_reused_if_extensions_dont_resolve():
+    middleware_manager = MiddlewareManager(Mock())
+    manager = ExtensionManager([BaseExtension], context)
+    assert manager.as_middleware_manager(middleware_manager) is middleware_manager
+
+
+class ResolvingExtension(Extension):
+    def __init__(self):
+        self.resolved_fields = []
+
+    async def resolve(self, next_, obj, info, **kwargs):
+        self.resolved_fields.append(info.field_name)
+        return next_(obj, info, **kwargs)
+
+
+def test_extension_overriding_resolve_is_included_in_middleware():
+    manager = ExtensionManager([ResolvingExtension], context)
+    middleware_manager = manager.as_middleware_manager(None)
+    assert middleware_manager.middlewares == manager.extensions
+
+
+class SkippedResolvingExtension(ResolvingExtension):
+    def should_resolve(self, context):
+        return False
+
+
+def test_extension_not_resolving_in_request_is_excluded_from_middleware():
+    manager = ExtensionManager([SkippedResolvingExtension], context)
+    with manager.request():
+        assert manager.as_middleware_manager(None) is None
+
+
+def test_extensions_wrap_resolvers_cached_by_reused_middleware_manager():
+    def middleware(next_, *args, **kwargs):
+        return "middleware(%s)" % next_(*args, **kwargs)
+
+    class WrappingExtension(ExtensionSync):
+        def resolve(self, next_, obj, info, **kwargs):
+            return "extension(%s)" % next_(obj, info, **kwargs)
+
+    def resolver(*_):
+        return "resolver"
+
+    middleware_manager = MiddlewareManager(middleware)
+    for _ in range(2):
+        manager = ExtensionManager([WrappingExtension], context)
+        wrapped_resolver = manager.as_middleware_manager(
+            middleware_manager
+        ).get_field_resolver(resolver)
+        assert wrapped_resolver(None, None) == "extension(middleware(resolver))"
+
+    # pylint: disable=protected-access
+    assert list(middleware_manager._cached_resolvers) == [resolver]
+
+
+class FilteredExtension(ResolvingExtension):
+    filter_calls = 0
+
+    def should_resolve_field(self, parent_type, field_name):
+        FilteredExtension.filter_calls += 1
+        return parent_type.name == "Query" and field_name == "status"
+
+
+@pytest.mark.asyncio
+async def test_extension_resolve_is_only_called_for_filtered_fields(schema):
+    extension = FilteredExtension()
+    _, response = await graphql(
+        schema,
+        {"query": '{ status hello(name: "Bob") }'},
+        extensions=[lambda: extension],
+    )
+    assert response["data"] == {"status": True, "hello": "Hello, Bob!"}
+    assert extension.resolved_fields == ["status"]
+
+
+@pytest.mark.asyncio
+async def test_extension_fields_filter_is_computed_once_per_schema(schema):
+    FilteredExtension.filter_calls = 0
+    for _ in range(3):
+        await graphql(schema, {"query": "{ status }"}, extensions=[FilteredExtension])
+    filter_calls = FilteredExtension.filter_calls
+    assert filter_calls
+
+    await graphql(schema, {"query": "{ status }"}, extensions=[FilteredExtension])
+    assert FilteredExtension.filter_calls == filter_calls
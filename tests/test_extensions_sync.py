@@ -54,3 +54,26 @@ def test_default_extension_hooks_dont_interrupt_query_execution(schema):
         schema, {"query": "{ status }"}, extensions=[ExtensionSync]
     )
     assert response["data"] == {"status": True}
+
+
+class FilteredExtension(ExtensionSync):
+    def __init__(self):
+        self.resolved_fields = []
+
+    def resolve(self, next_, obj, info, **kwargs):
+        self.resolved_fields.append(info.field_name)
+        return next_(obj, info, **kwargs)
+
+    def should_resolve_field(self, parent_type, field_name):
+        return field_name == "hello"
+
+
+def test_extension_resolve_is_only_called_for_filtered_fields(schema):
+    extension = FilteredExtension()
+    _, response = graphql_sync(
+        schema,
+        {"query": '{ status hello(name: "Bob") }'},
+        extensions=[lambda: extension],
+    )
+    assert response["data"] == {"status": True, "hello": "Hello, Bob!"}
+    assert extension.resolved_fields == ["hello"]
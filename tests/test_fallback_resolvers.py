@@ -1,7 +1,15 @@
 import pytest
 from graphql import graphql_sync, build_schema
 
-from ariadne import ObjectType, fallback_resolvers, snake_case_fallback_resolvers
+from ariadne import (
+    FallbackResolversSetter,
+    ObjectType,
+    SnakeCaseFallbackResolversSetter,
+    fallback_resolvers,
+    is_default_resolver,
+    snake_case_fallback_resolvers,
+)
+from ariadne.resolvers import MAX_ADAPTIVE_PARENT_TYPES, resolve_to_adaptive
 
 
 @pytest.fixture
@@ -94,3 +102,79 @@ def test_snake_case_fallback_is_not_replacing_already_set_resolvers(schema):
         "Camel": False,
         "camelCase": True,
     }
+
+
+adaptive_fallback_resolvers = FallbackResolversSetter(adaptive=True)
+adaptive_snake_case_fallback_resolvers = SnakeCaseFallbackResolversSetter(adaptive=True)
+
+
+def test_adaptive_fallback_resolves_fields_by_exact_names(schema):
+    adaptive_fallback_resolvers.bind_to_schema(schema)
+    query_root = {"hello": True, "snake_case": True, "Camel": True, "camelCase": True}
+    result = graphql_sync(schema, query, root_value=query_root)
+    assert result.data == query_root
+
+
+def test_adaptive_snake_case_fallback_resolves_fields_to_snake_case_counterparts(
+    schema,
+):
+    adaptive_snake_case_fallback_resolvers.bind_to_schema(schema)
+    query_root = {"hello": True, "snake_case": True, "camel": True, "camel_case": True}
+    result = graphql_sync(schema, query, root_value=query_root)
+    assert result.data == {
+        "hello": True,
+        "snake_case": True,
+        "Camel": True,
+        "camelCase": True,
+    }
+
+
+def test_adaptive_fallback_is_not_replacing_already_set_resolvers(schema):
+    resolvers_map = ObjectType("Query")
+    resolvers_map.set_field("hello", lambda *_: False)
+    resolvers_map.bind_to_schema(schema)
+    adaptive_fallback_resolvers.bind_to_schema(schema)
+    query_root = {"hello": True, "snake_case": True}
+    result = graphql_sync(schema, "{ hello snake_case }", root_value=query_root)
+    assert result.data == {"hello": False, "snake_case": True}
+
+
+def test_adaptive_fallback_handles_parent_shape_changes(schema):
+    class QueryRoot:
+        hello = False
+        snake_case = False
+
+    adaptive_fallback_resolvers.bind_to_schema(schema)
+    query = "{ hello snake_case }"
+    dict_root = {"hello": True, "snake_case": True}
+    for root_value, expected_value in ((dict_root, True), (QueryRoot(), False)) * 2:
+        result = graphql_sync(schema, query, root_value=root_value)
+        assert result.data == {"hello": expected_value, "snake_case": expected_value}
+
+
+def test_adaptive_fallback_resolves_missing_attrs_and_keys_to_none(schema):
+    adaptive_fallback_resolvers.bind_to_schema(schema)
+    for root_value in ({}, object(), None):
+        result = graphql_sync(schema, "{ hello }", root_value=root_value)
+        assert result.data == {"hello": None}
+
+
+def test_adaptive_fallback_calls_callable_values(schema):
+    adaptive_fallback_resolvers.bind_to_schema(schema)
+    query_root = {"hello": lambda info: info.field_name == "hello"}
+    result = graphql_sync(schema, "{ hello }", root_value=query_root)
+    assert result.data == {"hello": True}
+
+
+def test_adaptive_fallback_resolves_fields_after_parent_types_limit_is_reached(
+    schema,
+):
+    adaptive_fallback_resolvers.bind_to_schema(schema)
+    for i in range(MAX_ADAPTIVE_PARENT_TYPES + 2):
+        root_type = type("Root%s" % i, (), {"hello": bool(i % 2)})
+        result = graphql_sync(schema, "{ hello }", root_value=root_type())
+        assert result.data == {"hello": bool(i % 2)}
+
+
+def test_adaptive_fallback_resolver_is_default_resolver():
+    assert is_default_resolver(resolve_to_adaptive("hello"))
@@ -0,0 +1,199 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from unittest.mock import Mock
+
+import pytest
+from graphql import GraphQLError, get_introspection_query, parse
+
+from ariadne import graphql, graphql_sync, make_executable_schema
+from ariadne.introspection_cache import IntrospectionCache, is_introspection_query
+
+TYPE_QUERY = "query Type($name: String!) { __type(name: $name) { name } }"
+
+
+def test_introspection_query_result_is_cached(schema, mocker):
+    cache = IntrospectionCache()
+    execute = mocker.spy(cache, "set_result")
+    data = {"query": "{ __schema { queryType { name } } }"}
+    for _ in range(3):
+        success, result = graphql_sync(schema, data, introspection_cache=cache)
+        assert success
+        assert result == {"data": {"__schema": {"queryType": {"name": "Query"}}}}
+    execute.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_introspection_query_result_is_cached_by_async_executor(schema):
+    cache = IntrospectionCache()
+    data = {"query": "{ __typename }"}
+    await graphql(schema, data, introspection_cache=cache)
+    assert cache.get_result(schema, data) == {"__typename": "Query"}
+
+
+def test_introspection_results_are_cached_per_variables(schema):
+    cache = IntrospectionCache()
+    for name in ("Query", "Mutation"):
+        graphql_sync(
+            schema,
+            {"query": TYPE_QUERY, "variables": {"name": name}},
+            introspection_cache=cache,
+        )
+    assert cache.get_result(
+        schema, {"query": TYPE_QUERY, "variables": {"name": "Mutation"}}
+    ) == {"__type": {"name": "Mutation"}}
+
+
+def test_queries_selecting_other_fields_are_not_cached(schema):
+    cache = IntrospectionCache()
+    data = {"query": "{ __typename status }"}
+    graphql_sync(schema, data, introspection_cache=cache)
+    assert cache.get_result(schema, data) is None
+
+
+def test_cache_is_not_used_when_introspection_is_disabled(schema):
+    cache = IntrospectionCache()
+    data = {"query": "{ __schema { __typename } }"}
+    cache.set_result(schema, data, {"__schema": {"__typename": "__Schema"}})
+    success, _ = graphql_sync(
+        schema, data, introspection=False, introspection_cache=cache
+    )
+    assert not success
+
+
+def test_cache_is_not_used_with_validation_rules_depending_on_context(
+    schema, validation_rule
+):
+    cache = IntrospectionCache()
+    data = {"query": "{ __typename }"}
+    cache.set_result(schema, data, {"__typename": "Cached"})
+    get_validation_rules = Mock(return_value=[validation_rule])
+    _, result = graphql_sync(
+        schema, data, validation_rules=get_validation_rules, introspection_cache=cache
+    )
+    assert result == {"data": {"__typename": "Query"}}
+    get_validation_rules.assert_called_once()
+
+
+def test_cache_is_invalidated_by_schema_change(schema):
+    cache = IntrospectionCache()
+    data = {"query": '{ __type(name: "Query") { fields { name } } }'}
+    graphql_sync(schema, data, introspection_cache=cache)
+
+    new_schema = make_executable_schema("type Query { other: String }")
+    _, result = graphql_sync(new_schema, data, introspection_cache=cache)
+    assert result == {"data": {"__type": {"fields": [{"name": "other"}]}}}
+
+
+def test_cache_is_warmed_up_with_standard_introspection_query(schema):
+    cache = IntrospectionCache()
+    cache.warm_up(schema)
+    data = {"query": get_introspection_query(descriptions=True)}
+    result = cache.get_result(schema, data)
+    assert result["__schema"]["queryType"]["name"] == "Query"
+
+    cache.clear(schema)
+    assert cache.get_result(schema, data) is None
+
+
+def test_warmed_up_result_is_used_for_query_sent_with_operation_name(schema):
+    cache = IntrospectionCache()
+    cache.warm_up(schema)
+    data = {
+        "query": get_introspection_query(descriptions=True),
+        "operationName": "IntrospectionQuery",
+    }
+    result = cache.get_result(schema, data)
+    assert result["__schema"]["queryType"]["name"] == "Query"
+
+
+def test_concurrent_threads_evict_results():
+    cache = IntrospectionCache(max_size=5)
+    schema = make_executable_schema("type Query { a: Int }")
+    barrier = Barrier(20)
+
+    def set_result(i):
+        barrier.wait()
+        cache.set_result(schema, {"query": "{ a%d: __typename }" % i}, {})
+
+    with ThreadPoolExecutor(max_workers=20) as executor:
+        list(executor.map(set_result, range(20)))
+    assert len(cache.results[schema]) == 5
+
+
+def test_cache_keeps_limited_number_of_results(schema):
+    cache = IntrospectionCache(max_size=1)
+    cache.set_result(schema, {"query": "{ __typename }"}, {})
+    cache.set_result(schema, {"query": "{ __schema { __typename } }"}, {})
+    assert cache.get_result(schema, {"query": "{ __typename }"}) is None
+
+
+def test_introspection_queries_are_rate_limited_per_client(schema):
+    cache = IntrospectionCache(
+        client_key=lambda context: context["client"], max_requests=2
+    )
+    data = {"query": "{ __typename }"}
+    for _ in range(2):
+        success, _ = graphql_sync(
+            schema, data, context_value={"client": "a"}, introspection_cache=cache
+        )
+        assert success
+
+    success, result = graphql_sync(
+        schema, data, context_value={"client": "a"}, introspection_cache=cache
+    )
+    assert not success
+    assert result["errors"][0]["message"] == (
+        "Too many introspection queries. Try again in 60 seconds."
+    )
+
+    success, _ = graphql_sync(
+        schema, data, context_value={"client": "b"}, introspection_cache=cache
+    )
+    assert success
+
+
+def test_rate_limit_window_is_reset_after_period(mocker):
+    monotonic = mocker.patch("ariadne.introspection_cache.monotonic", return_value=0)
+    cache = IntrospectionCache(client_key=lambda _: "client", max_requests=1)
+    cache.check_rate_limit(None)
+    monotonic.return_value = 60
+    cache.check_rate_limit(None)
+
+
+def test_rate_limit_counts_concurrent_requests_from_threads():
+    cache = IntrospectionCache(client_key=lambda _: "client", max_requests=10)
+    barrier = Barrier(20)
+
+    def check_rate_limit():
+        barrier.wait()
+        try:
+            cache.check_rate_limit(None)
+        except GraphQLError:
+            return False
+        return True
+
+    with ThreadPoolExecutor(max_workers=20) as executor:
+        results = list(executor.map(lambda _: check_rate_limit(), range(20)))
+    assert results.count(True) == 10
+
+
+def test_other_queries_are_not_rate_limited(schema):
+    cache = IntrospectionCache(client_key=lambda _: "client", max_requests=0)
+    success, _ = graphql_sync(
+        schema, {"query": "{ status }"}, introspection_cache=cache
+    )
+    assert success
+
+
+def test_query_with_fragments_selecting_introspection_is_detected():
+    document = parse(
+        """
+        query { ...Schema ... on Query { __typename } }
+        fragment Schema on Query { __schema { types { name } } ...Schema }
+        """
+    )
+    assert is_introspection_query(document)
+
+
+def test_mutation_is_not_introspection_query():
+    assert not is_introspection_query(parse("mutation { __typename }"))
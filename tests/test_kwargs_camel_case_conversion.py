@@ -1,6 +1,20 @@
-import pytest
+from unittest.mock import Mock
 
-from ariadne import convert_kwargs_to_snake_case
+import pytest
+from graphql import GraphQLResolveInfo
+
+from ariadne import (
+    QueryType,
+    convert_kwargs_to_snake_case,
+    graphql_sync,
+    make_executable_schema,
+)
+from ariadne.utils import (
+    SNAKE_CASE_NAMES_CACHE_SIZE,
+    convert_camel_case_to_snake_cached,
+    get_snake_case_name,
+    schemas_snake_case_names,
+)
 
 
 def test_decorator_converts_kwargs_to_camel_case():
@@ -129,3 +143,80 @@ async def test_decorator_leaves_snake_case_kwargs_unchanged_for_async_resolver()
         second_parameter="value",
         nested_parameter={"first_sub_entry": 1, "second_sub_entry": 2},
     )
+
+
+SEARCH_TYPE_DEFS = """
+    type Query {
+        search(searchQuery: SearchInput): [String!]!
+    }
+
+    input SearchInput {
+        textValue: String
+        maxResults: Int
+    }
+"""
+
+
+def test_make_executable_schema_caches_snake_case_names_of_args_and_input_fields():
+    schema = make_executable_schema(SEARCH_TYPE_DEFS)
+    names = schemas_snake_case_names[schema]
+    assert names["searchQuery"] == "search_query"
+    assert names["textValue"] == "text_value"
+    assert names["maxResults"] == "max_results"
+
+
+def test_schema_names_are_not_evicted_by_names_not_defined_in_schema(mocker):
+    schema = make_executable_schema(SEARCH_TYPE_DEFS)
+    for i in range(SNAKE_CASE_NAMES_CACHE_SIZE + 10):
+        get_snake_case_name(f"customKey{i}")
+
+    @convert_kwargs_to_snake_case
+    def resolve_search(*_, **kwargs):
+        return kwargs
+
+    convert = mocker.patch("ariadne.utils.convert_camel_case_to_snake_cached")
+    info = Mock(spec=GraphQLResolveInfo, schema=schema)
+    assert resolve_search(None, info, searchQuery={"textValue": "test"}) == {
+        "search_query": {"text_value": "test"}
+    }
+    convert.assert_not_called()
+
+
+def test_snake_case_names_cache_is_bounded():
+    convert_camel_case_to_snake_cached.cache_clear()
+    for i in range(SNAKE_CASE_NAMES_CACHE_SIZE + 10):
+        get_snake_case_name(f"customKey{i}")
+    assert (
+        convert_camel_case_to_snake_cached.cache_info().currsize
+        == SNAKE_CASE_NAMES_CACHE_SIZE
+    )
+
+
+def test_decorator_converts_args_and_input_fields_defined_in_schema():
+    query = QueryType()
+
+    @query.field("search")
+    @convert_kwargs_to_snake_case
+    def resolve_search(*_, **kwargs):
+        assert kwargs == {"search_query": {"text_value": "test", "max_results": 1}}
+        return ["result"]
+
+    schema = make_executable_schema(
+        """
+            type Query {
+                search(searchQuery: SearchInput): [String!]!
+            }
+
+            input SearchInput {
+                textValue: String
+                maxResults: Int
+            }
+        """,
+        query,
+    )
+
+    _, result = graphql_sync(
+        schema,
+        {"query": '{ search(searchQuery: { textValue: "test", maxResults: 1 }) }'},
+    )
+    assert result == {"data": {"search": ["result"]}}
@@ -0,0 +1,195 @@
+from unittest.mock import Mock
+
+import pytest
+
+from ariadne import ObjectType, QueryType, graphql, graphql_sync, make_executable_schema
+from ariadne.memoization import (
+    MemoizationExtension,
+    MemoizationExtensionSync,
+    memoization_extension,
+    memoization_extension_sync,
+    memoize_resolver,
+)
+
+type_defs = """
+    type Query {
+        product: Product!
+        products: [Product!]!
+    }
+
+    type Product {
+        name: String!
+        price(currency: String!): Float!
+        tags(filter: TagsFilter): [String!]!
+    }
+
+    input TagsFilter {
+        prefixes: [String!]
+    }
+"""
+
+REPEATED_PRICE_QUERY = """
+    {
+        product {
+            a: price(currency: "EUR")
+            b: price(currency: "EUR")
+        }
+    }
+"""
+
+
+@pytest.fixture
+def price_resolver():
+    return Mock(return_value=9.99)
+
+
+@pytest.fixture
+def memoized_schema(price_resolver):
+    query = QueryType()
+    products = [{"name": "First"}, {"name": "Second"}]
+
+    @query.field("product")
+    def resolve_product(*_):
+        return products[0]
+
+    @query.field("products")
+    def resolve_products(*_):
+        return products
+
+    product = ObjectType("Product")
+
+    @product.field("price")
+    @memoize_resolver
+    def resolve_price(obj, info, **kwargs):
+        return price_resolver(obj, info, **kwargs)
+
+    @product.field("tags")
+    @memoize_resolver
+    def resolve_tags(*_, **__):
+        price_resolver()
+        return []
+
+    return make_executable_schema(type_defs, [query, product])
+
+
+def test_resolver_is_called_once_for_repeated_field_with_same_args(
+    memoized_schema, price_resolver
+):
+    _, result = graphql_sync(
+        memoized_schema,
+        {"query": REPEATED_PRICE_QUERY},
+        extensions=[MemoizationExtensionSync],
+    )
+    assert result["data"] == {"product": {"a": 9.99, "b": 9.99}}
+    assert price_resolver.call_count == 1
+
+
+def test_resolver_is_called_for_every_distinct_set_of_args(
+    memoized_schema, price_resolver
+):
+    graphql_sync(
+        memoized_schema,
+        {
+            "query": (
+                '{ product { a: price(currency: "EUR") b: price(currency: "USD") } }'
+            )
+        },
+        extensions=[MemoizationExtensionSync],
+    )
+    assert price_resolver.call_count == 2
+
+
+def test_resolver_is_called_for_every_distinct_parent(memoized_schema, price_resolver):
+    graphql_sync(
+        memoized_schema,
+        {"query": REPEATED_PRICE_QUERY.replace("product", "products")},
+        extensions=[MemoizationExtensionSync],
+    )
+    assert price_resolver.call_count == 2
+
+
+def test_resolver_is_memoized_for_input_object_args(memoized_schema, price_resolver):
+    graphql_sync(
+        memoized_schema,
+        {
+            "query": (
+                '{ product { a: tags(filter: { prefixes: ["a"] }) '
+                'b: tags(filter: { prefixes: ["a"] }) } }'
+            )
+        },
+        extensions=[MemoizationExtensionSync],
+    )
+    assert price_resolver.call_count == 1
+
+
+def test_memoized_results_are_not_shared_between_requests(
+    memoized_schema, price_resolver
+):
+    data = {"query": '{ product { price(currency: "EUR") } }'}
+    graphql_sync(memoized_schema, data, extensions=[MemoizationExtensionSync])
+    graphql_sync(memoized_schema, data, extensions=[MemoizationExtensionSync])
+    assert price_resolver.call_count == 2
+
+
+def test_unmarked_resolver_is_not_memoized(price_resolver):
+    query = QueryType()
+    query.set_field("product", lambda *_: {"name": "Product"})
+    product = ObjectType("Product")
+    product.set_field("price", price_resolver)
+    schema = make_executable_schema(type_defs, [query, product])
+
+    graphql_sync(
+        schema,
+        {"query": REPEATED_PRICE_QUERY},
+        extensions=[MemoizationExtensionSync],
+    )
+    assert price_resolver.call_count == 2
+
+
+def test_all_resolvers_of_type_are_memoized_when_type_is_configured(price_resolver):
+    query = QueryType()
+    query.set_field("product", lambda *_: {"name": "Product"})
+    product = ObjectType("Product")
+    product.set_field("price", price_resolver)
+    schema = make_executable_schema(type_defs, [query, product])
+
+    graphql_sync(
+        schema,
+        {"query": REPEATED_PRICE_QUERY},
+        extensions=[memoization_extension_sync(types=["Product"])],
+    )
+    assert price_resolver.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_async_resolver_result_is_shared_between_callers():
+    calls = []
+
+    async def resolve_price(*_, currency):
+        calls.append(currency)
+        return 9.99
+
+    query = QueryType()
+    query.set_field("product", lambda *_: {"name": "Product"})
+    product = ObjectType("Product")
+    product.set_field("price", memoize_resolver(resolve_price))
+    schema = make_executable_schema(type_defs, [query, product])
+
+    _, result = await graphql(
+        schema,
+        {"query": REPEATED_PRICE_QUERY},
+        extensions=[MemoizationExtension],
+    )
+    assert result["data"] == {"product": {"a": 9.99, "b": 9.99}}
+    assert calls == ["EUR"]
+
+
+@pytest.mark.asyncio
+async def test_async_extension_memoizes_sync_resolver(memoized_schema, price_resolver):
+    _, result = await graphql(
+        memoized_schema,
+        {"query": REPEATED_PRICE_QUERY},
+        extensions=[memoization_extension()],
+    )
+    assert result["data"] == {"product": {"a": 9.99, "b": 9.99}}
+    assert price_resolver.call_count == 1
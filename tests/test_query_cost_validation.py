@@ -1,3 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
 import pytest
 
 from graphql import GraphQLError
@@ -5,7 +8,13 @@ from graphql.language import parse
 from graphql.validation import validate
 
 from ariadne import make_executable_schema
-from ariadne.validation import cost_validator
+from ariadne.validation import analyze_query_cost, cost_validator, get_query_cost
+from ariadne.validation.query_cost import (
+    COST_PLANS_SIZE,
+    CostValidator,
+    collect_query_costs,
+    cost_plans,
+)
 
 cost_directive = """
 directive @cost(complexity: Int, multipliers: [String!], useMultipliers: Boolean) on FIELD | FIELD_DEFINITION
@@ -458,3 +467,144 @@ def test_child_field_cost_defined_in_directive_is_multiplied_by_values_from_lite
             extensions={"cost": {"requestedQueryCost": 20, "maximumAvailable": 3}},
         )
     ]
+
+
+def test_query_cost_is_collected_for_validated_operation(schema_with_costs):
+    ast = parse("{ constant }")
+    rule = cost_validator(maximum_cost=5)
+    with collect_query_costs():
+        assert validate(schema_with_costs, ast, [rule]) == []
+        assert get_query_cost(ast.definitions[0]) == 3
+    assert get_query_cost(ast.definitions[0]) is None
+
+
+def test_query_cost_of_shared_document_is_not_shared_between_requests(
+    schema_with_costs,
+):
+    ast = parse("query testQuery($value: Int!) { simple(value: $value) }")
+    with collect_query_costs():
+        rule = cost_validator(maximum_cost=100, variables={"value": 5})
+        assert validate(schema_with_costs, ast, [rule]) == []
+        with collect_query_costs():
+            rule = cost_validator(maximum_cost=100, variables={"value": 9})
+            assert validate(schema_with_costs, ast, [rule]) == []
+            assert get_query_cost(ast.definitions[0]) == 9
+        assert get_query_cost(ast.definitions[0]) == 5
+
+
+def test_query_cost_is_not_set_for_operation_that_was_not_validated():
+    assert get_query_cost(parse("{ constant }").definitions[0]) is None
+
+
+def test_cost_plan_is_created_once_per_schema(schema_with_costs, mocker):
+    rule = cost_validator(maximum_cost=5)
+    validate(schema_with_costs, parse("{ constant }"), [rule])
+    plan = next(iter(cost_plans[schema_with_costs].values()))
+    assert plan.fields[("Query", "constant")]["complexity"] == 3
+
+    directive_args = mocker.patch(
+        "ariadne.validation.query_cost.get_field_cost_directive_args"
+    )
+    validate(schema_with_costs, parse("{ constant }"), [rule])
+    directive_args.assert_not_called()
+
+
+def test_cost_plan_is_recreated_when_cost_map_is_mutated(schema):
+    mutable_cost_map = {"Query": {"constant": {"complexity": 3}}}
+    assert analyze_query_cost(schema, "{ constant }", cost_map=mutable_cost_map) == {
+        None: 3
+    }
+    mutable_cost_map["Query"]["constant"]["complexity"] = 5
+    assert analyze_query_cost(schema, "{ constant }", cost_map=mutable_cost_map) == {
+        None: 5
+    }
+
+
+def test_number_of_cost_plans_per_schema_is_limited(schema):
+    for complexity in range(COST_PLANS_SIZE + 5):
+        analyze_query_cost(
+            schema,
+            "{ constant }",
+            cost_map={"Query": {"constant": {"complexity": complexity}}},
+        )
+    assert len(cost_plans[schema]) == COST_PLANS_SIZE
+
+
+def test_cost_map_is_frozen_once_per_cost_validator(schema, mocker):
+    cost_map = {"Query": {"constant": {"complexity": 3}}}
+    rule = cost_validator(maximum_cost=10, cost_map=cost_map)
+    freeze_args = mocker.patch("ariadne.validation.query_cost.freeze_args")
+    for _ in range(3):
+        assert validate(schema, parse("{ constant }"), [rule]) == []
+    freeze_args.assert_not_called()
+
+
+def test_cost_plans_are_evicted_by_concurrent_threads(schema):
+    rules = [
+        cost_validator(
+            maximum_cost=100,
+            cost_map={"Query": {"constant": {"complexity": complexity}}},
+        )
+        for complexity in range(COST_PLANS_SIZE + 20)
+    ]
+    barrier = Barrier(len(rules))
+
+    def validate_query(rule):
+        barrier.wait()
+        return validate(schema, parse("{ constant }"), [rule])
+
+    with ThreadPoolExecutor(max_workers=len(rules)) as executor:
+        results = list(executor.map(validate_query, rules))
+    assert results == [[]] * len(rules)
+    assert len(cost_plans[schema]) == COST_PLANS_SIZE
+
+
+def test_query_cost_is_cached_for_values_of_variables_used_by_multipliers(
+    schema_with_costs, mocker
+):
+    query = """
+        query testQuery($value: Int!, $other: Int!) {
+            simple(value: $value)
+            constant
+        }
+    """
+    compute_node_cost = mocker.spy(CostValidator, "compute_node_cost")
+
+    def validate_query(variables):
+        rule = cost_validator(maximum_cost=100, variables=variables)
+        ast = parse(query)
+        with collect_query_costs():
+            assert validate(schema_with_costs, ast, [rule]) == []
+            return get_query_cost(ast.definitions[0])
+
+    assert validate_query({"value": 5, "other": 1}) == 8
+    calls = compute_node_cost.call_count
+    assert validate_query({"value": 5, "other": 2}) == 8
+    assert compute_node_cost.call_count == calls
+    assert validate_query({"value": 6, "other": 1}) == 9
+    assert compute_node_cost.call_count > calls
+
+
+def test_analyze_query_cost_returns_costs_of_operations(schema_with_costs):
+    query = """
+        query simple($value: Int!) { simple(value: $value) }
+        query { constant }
+    """
+    assert analyze_query_cost(schema_with_costs, query, variables={"value": 4}) == {
+        "simple": 4,
+        None: 3,
+    }
+
+
+def test_analyze_query_cost_uses_cost_map(schema_with_costs):
+    document = parse("{ child(value: 2) { name } }")
+    assert analyze_query_cost(schema_with_costs, document, cost_map=cost_map) == {
+        None: 2
+    }
+
+
+def test_analyze_query_cost_raises_error_for_invalid_cost_map(schema_with_costs):
+    with pytest.raises(GraphQLError):
+        analyze_query_cost(
+            schema_with_costs, "{ constant }", cost_map={"Undefined": {"a": 1}}
+        )
@@ -0,0 +1,180 @@
+import sys
+
+import pytest
+from graphql import GraphQLError, parse
+
+from ariadne import QueryType, graphql, graphql_sync, make_executable_schema, subscribe
+from ariadne.validation import QueryLimits
+
+type_defs = """
+    type Query {
+        node: Node
+        hello: String
+    }
+
+    type Node {
+        id: ID!
+        child: Node
+    }
+"""
+
+
+@pytest.fixture
+def nodes_schema():
+    query = QueryType()
+    query.set_field("node", lambda *_: {"id": "1", "child": {"id": "2"}})
+    query.set_field("hello", lambda *_: "world")
+    return make_executable_schema(type_defs, query)
+
+
+def test_query_within_limits_is_executed(nodes_schema):
+    limits = QueryLimits(max_query_bytes=100, max_tokens=20, max_depth=2)
+    success, result = graphql_sync(
+        nodes_schema, {"query": "{ node { id } }"}, query_limits=limits
+    )
+    assert success
+    assert result == {"data": {"node": {"id": "1"}}}
+
+
+def test_query_exceeding_bytes_limit_is_rejected_before_parsing(nodes_schema):
+    limits = QueryLimits(max_query_bytes=10)
+    success, result = graphql_sync(
+        nodes_schema, {"query": "{ node { id } }"}, query_limits=limits
+    )
+    assert not success
+    assert result["errors"][0]["message"] == (
+        "Query is too large: 15 bytes exceeds the limit of 10 bytes."
+    )
+
+
+def test_query_bytes_limit_counts_encoded_characters():
+    limits = QueryLimits(max_query_bytes=12)
+    limits.validate_query_size("wwwwwwww")
+    with pytest.raises(GraphQLError):
+        limits.validate_query_size("żółwżółw")
+
+
+def test_query_exceeding_tokens_limit_stops_parsing(nodes_schema):
+    limits = QueryLimits(max_tokens=5)
+    success, result = graphql_sync(
+        nodes_schema, {"query": "{ node { id child { id } } }"}, query_limits=limits
+    )
+    assert not success
+    assert result["errors"][0]["message"] == (
+        "Syntax Error: Document contains more than 5 tokens. Parsing aborted."
+    )
+
+
+def test_query_is_parsed_without_tokens_limit_if_its_not_set(nodes_schema, monkeypatch):
+    def parse_without_max_tokens(source):
+        # graphql-core before 3.2.3 doesn't support max_tokens argument
+        return parse(source)
+
+    monkeypatch.setattr(
+        sys.modules["ariadne.graphql"], "parse", parse_without_max_tokens
+    )
+    success, result = graphql_sync(
+        nodes_schema, {"query": "{ hello }"}, query_limits=QueryLimits(max_depth=2)
+    )
+    assert success
+    assert result == {"data": {"hello": "world"}}
+
+
+def test_query_exceeding_depth_limit_is_rejected(nodes_schema):
+    limits = QueryLimits(max_depth=2)
+    success, result = graphql_sync(
+        nodes_schema,
+        {"query": "query Nested { node { child { child { id } } } }"},
+        query_limits=limits,
+    )
+    assert not success
+    assert result["errors"][0]["message"] == (
+        "Operation 'Nested' is too deep: depth 4 exceeds the limit of 2."
+    )
+
+
+def test_depth_limit_includes_fields_from_fragments():
+    document = parse(
+        """
+        { node { ...Child } }
+        fragment Child on Node { child { ... on Node { child { id } } } }
+        """
+    )
+    assert QueryLimits(max_depth=4).validate_document(document) == []
+    errors = QueryLimits(max_depth=3).validate_document(document)
+    assert [error.message for error in errors] == [
+        "Operation is too deep: depth 4 exceeds the limit of 3."
+    ]
+
+
+def test_fragments_cycles_and_unknown_fragments_are_left_to_validation():
+    document = parse(
+        """
+        { node { ...A ...Unknown } }
+        fragment A on Node { child { ...A } }
+        """
+    )
+    assert QueryLimits(max_depth=2).validate_document(document) == []
+
+
+def test_query_exceeding_aliases_limit_is_rejected(nodes_schema):
+    limits = QueryLimits(max_aliases=2)
+    success, result = graphql_sync(
+        nodes_schema,
+        {"query": "{ a: hello b: hello node { c: id } }"},
+        query_limits=limits,
+    )
+    assert not success
+    assert result["errors"][0]["message"] == (
+        "Query has too many aliases: 3 exceeds the limit of 2."
+    )
+
+
+def test_aliases_in_fragment_are_counted_for_every_spread():
+    document = parse(
+        """
+        { node { ...Ids } other: node { ...Ids } last: node { ...Nested } }
+        fragment Ids on Node { a: id b: id }
+        fragment Nested on Node { ...Ids }
+        """
+    )
+    assert QueryLimits(max_aliases=8).validate_document(document) == []
+    (error,) = QueryLimits(max_aliases=7).validate_document(document)
+    assert error.message == "Query has too many aliases: 8 exceeds the limit of 7."
+
+
+def test_query_exceeding_root_fields_limit_is_rejected(nodes_schema):
+    limits = QueryLimits(max_root_fields=2)
+    success, result = graphql_sync(
+        nodes_schema,
+        {"query": "{ hello node { id } ... on Query { hello } }"},
+        query_limits=limits,
+    )
+    assert not success
+    assert result["errors"][0]["message"] == (
+        "Operation has too many root fields: 3 exceeds the limit of 2."
+    )
+
+
+@pytest.mark.asyncio
+async def test_query_limits_are_checked_by_async_executor(nodes_schema):
+    limits = QueryLimits(max_depth=1)
+    success, result = await graphql(
+        nodes_schema, {"query": "{ node { id } }"}, query_limits=limits
+    )
+    assert not success
+    assert result["errors"][0]["message"] == (
+        "Operation is too deep: depth 2 exceeds the limit of 1."
+    )
+
+
+@pytest.mark.asyncio
+async def test_query_limits_are_checked_by_subscribe(schema):
+    limits = QueryLimits(max_aliases=0)
+    success, result = await subscribe(
+        schema, {"query": "subscription { p: ping }"}, query_limits=limits
+    )
+    assert not success
+    assert result[0]["message"] == (
+        "Query has too many aliases: 1 exceeds the limit of 0."
+    )
@@ -0,0 +1,183 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+import pytest
+
+from ariadne import QueryType, graphql, graphql_sync, make_executable_schema, subscribe
+from ariadne.rate_limit import (
+    CostRateLimiter,
+    InMemoryRateLimitStore,
+    RateLimitResult,
+    get_client_address,
+)
+from ariadne.validation import cost_directive, cost_validator
+
+type_defs = """
+    type Query {
+        cheap: Int
+        expensive: Int @cost(complexity: 5)
+    }
+"""
+
+
+@pytest.fixture
+def cost_schema():
+    query = QueryType()
+    query.set_field("cheap", lambda *_: 1)
+    query.set_field("expensive", lambda *_: 5)
+    return make_executable_schema([cost_directive, type_defs], query)
+
+
+@pytest.fixture
+def rate_limiter():
+    return CostRateLimiter(
+        capacity=10, refill_rate=0, client_key=lambda context: context["client"]
+    )
+
+
+def execute_query(schema, query, rate_limiter, client="a"):
+    return graphql_sync(
+        schema,
+        {"query": query},
+        context_value={"client": client},
+        validation_rules=[cost_validator(maximum_cost=100)],
+        rate_limiter=rate_limiter,
+    )
+
+
+def test_operation_cost_is_charged_and_remaining_budget_is_returned(
+    cost_schema, rate_limiter
+):
+    success, result = execute_query(cost_schema, "{ expensive }", rate_limiter)
+    assert success
+    assert result == {
+        "data": {"expensive": 5},
+        "extensions": {"rateLimit": {"cost": 5, "remaining": 5, "capacity": 10}},
+    }
+
+
+def test_operation_exceeding_remaining_budget_is_rejected_before_execution(
+    cost_schema, rate_limiter, mocker
+):
+    resolve_expensive = mocker.patch.object(
+        cost_schema.query_type.fields["expensive"], "resolve"
+    )
+    execute_query(cost_schema, "{ expensive }", rate_limiter)
+    resolve_expensive.reset_mock()
+
+    success, result = execute_query(
+        cost_schema, "{ expensive other: expensive }", rate_limiter
+    )
+    assert not success
+    assert result["errors"] == [
+        {
+            "message": (
+                "Rate limit exceeded: operation costs 10 and 5 is left of the budget."
+            ),
+            "extensions": {
+                "rateLimit": {
+                    "cost": 10,
+                    "remaining": 5,
+                    "capacity": 10,
+                    "retryAfter": -1,
+                }
+            },
+        }
+    ]
+    resolve_expensive.assert_not_called()
+
+
+def test_clients_have_separate_budgets(cost_schema, rate_limiter):
+    execute_query(cost_schema, "{ expensive other: expensive }", rate_limiter)
+    success, _ = execute_query(cost_schema, "{ expensive }", rate_limiter, "b")
+    assert success
+
+
+def test_client_without_key_is_not_limited(cost_schema):
+    rate_limiter = CostRateLimiter(capacity=1, refill_rate=0, client_key=lambda _: None)
+    success, result = execute_query(cost_schema, "{ expensive }", rate_limiter)
+    assert success
+    assert "extensions" not in result
+
+
+def test_operation_without_computed_cost_is_charged_default_cost(cost_schema):
+    rate_limiter = CostRateLimiter(
+        capacity=10, refill_rate=0, client_key=lambda _: "a", default_cost=3
+    )
+    _, result = graphql_sync(
+        cost_schema, {"query": "{ expensive }"}, rate_limiter=rate_limiter
+    )
+    assert result["extensions"]["rateLimit"]["cost"] == 3
+
+
+def test_bucket_is_refilled_over_time(mocker):
+    monotonic = mocker.patch("ariadne.rate_limit.monotonic", return_value=100)
+    store = InMemoryRateLimitStore()
+    assert store.consume("a", 10, 10, 2).remaining == 0
+
+    result = store.consume("a", 5, 10, 2)
+    assert not result.allowed
+    assert result.retry_after == 2.5
+
+    monotonic.return_value = 103
+    assert store.consume("a", 5, 10, 2) == RateLimitResult(True, 5, 1, 10)
+
+
+def test_in_memory_store_keeps_limited_number_of_buckets():
+    store = InMemoryRateLimitStore(max_keys=1)
+    store.consume("a", 1, 10, 0)
+    store.consume("b", 1, 10, 0)
+    assert list(store.buckets) == ["b"]
+
+
+def test_in_memory_store_charges_concurrent_requests_from_threads():
+    store = InMemoryRateLimitStore()
+    barrier = Barrier(20)
+
+    def consume():
+        barrier.wait()
+        return store.consume("a", 1, 10, 0).allowed
+
+    with ThreadPoolExecutor(max_workers=20) as executor:
+        results = list(executor.map(lambda _: consume(), range(20)))
+    assert results.count(True) == 10
+
+
+class AsyncStore:
+    def __init__(self):
+        self.store = InMemoryRateLimitStore()
+
+    async def consume(self, *args):
+        return self.store.consume(*args)
+
+
+@pytest.mark.asyncio
+async def test_async_store_is_awaited_by_async_executor(cost_schema):
+    rate_limiter = CostRateLimiter(
+        capacity=1, refill_rate=0, client_key=lambda _: "a", store=AsyncStore()
+    )
+    success, _ = await graphql(
+        cost_schema, {"query": "{ cheap }"}, rate_limiter=rate_limiter
+    )
+    assert success
+    success, _ = await graphql(
+        cost_schema, {"query": "{ cheap }"}, rate_limiter=rate_limiter
+    )
+    assert not success
+
+
+@pytest.mark.asyncio
+async def test_subscription_is_rejected_when_budget_is_exhausted(schema):
+    rate_limiter = CostRateLimiter(capacity=0, refill_rate=0, client_key=lambda _: "a")
+    success, errors = await subscribe(
+        schema, {"query": "subscription { ping }"}, rate_limiter=rate_limiter
+    )
+    assert not success
+    assert errors[0]["extensions"]["rateLimit"]["remaining"] == 0
+
+
+def test_client_address_is_read_from_wsgi_environ():
+    assert get_client_address({"request": {"REMOTE_ADDR": "127.0.0.1"}}) == (
+        "127.0.0.1"
+    )
+    assert get_client_address(None) is None
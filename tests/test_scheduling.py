@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+from graphql import GraphQLError, parse, validate
+
+from ariadne import QueryType, graphql, make_executable_schema
+from ariadne.scheduling import OperationScheduler, PriorityClass
+from ariadne.validation import cost_directive, cost_validator
+from ariadne.validation.query_cost import collect_query_costs
+
+type_defs = """
+    type Query {
+        cheap: Int
+        report: Int @cost(complexity: 50)
+    }
+"""
+
+
+@pytest.fixture
+def classes():
+    return [
+        PriorityClass("interactive", max_concurrency=10, max_cost=10),
+        PriorityClass("reports", max_concurrency=1, operation_names=["Export"]),
+    ]
+
+
+def classify(classes, query):
+    schema = make_executable_schema([cost_directive, type_defs])
+    document = parse(query)
+    with collect_query_costs():
+        validate(schema, document, [cost_validator(maximum_cost=100)])
+        return OperationScheduler(classes).classify(document)
+
+
+def test_operation_is_classified_by_cost(classes):
+    assert classify(classes, "{ cheap }").name == "interactive"
+    assert classify(classes, "{ report }").name == "reports"
+
+
+def test_operation_name_rule_takes_precedence_over_cost(classes):
+    assert classify(classes, "query Export { cheap }").name == "reports"
+
+
+def test_operation_without_cost_is_put_in_last_class(classes):
+    document = parse("{ cheap }")
+    assert OperationScheduler(classes).classify(document).name == "reports"
+
+
+def test_scheduler_requires_classes():
+    with pytest.raises(ValueError):
+        OperationScheduler([])
+
+
+@pytest.mark.asyncio
+async def test_operations_exceeding_concurrency_limit_wait_in_order():
+    priority_class = PriorityClass("test", max_concurrency=1)
+    started = []
+
+    async def run(name, duration):
+        await priority_class.acquire()
+        started.append(name)
+        await asyncio.sleep(duration)
+        priority_class.release()
+
+    await asyncio.gather(run("a", 0.01), run("b", 0), run("c", 0))
+    assert started == ["a", "b", "c"]
+    assert priority_class.active == 0
+
+
+@pytest.mark.asyncio
+async def test_operation_arriving_to_full_queue_is_rejected():
+    priority_class = PriorityClass("test", max_concurrency=1, max_queue=1)
+    await priority_class.acquire()
+    waiting = asyncio.ensure_future(priority_class.acquire())
+    await asyncio.sleep(0)
+
+    with pytest.raises(GraphQLError):
+        await priority_class.acquire()
+
+    priority_class.release()
+    await waiting
+    priority_class.release()
+    assert priority_class.active == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_is_removed_from_queue():
+    priority_class = PriorityClass("test", max_concurrency=1)
+    await priority_class.acquire()
+    waiting = asyncio.ensure_future(priority_class.acquire())
+    await asyncio.sleep(0)
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+    assert not priority_class.waiters
+    priority_class.release()
+    assert priority_class.active == 0
+
+
+@pytest.mark.asyncio
+async def test_expensive_operations_dont_block_cheap_ones():
+    report_started = asyncio.Event()
+    finish_report = asyncio.Event()
+
+    async def resolve_report(*_):
+        report_started.set()
+        await finish_report.wait()
+        return 1
+
+    query = QueryType()
+    query.set_field("cheap", lambda *_: 1)
+    query.set_field("report", resolve_report)
+    schema = make_executable_schema([cost_directive, type_defs], query)
+    scheduler = OperationScheduler(
+        [
+            PriorityClass("interactive", max_concurrency=10, max_cost=10),
+            PriorityClass("reports", max_concurrency=1, max_queue=0),
+        ]
+    )
+
+    async def execute(query_str):
+        return await graphql(
+            schema,
+            {"query": query_str},
+            validation_rules=[cost_validator(maximum_cost=100)],
+            scheduler=scheduler,
+        )
+
+    report = asyncio.ensure_future(execute("{ report }"))
+    await report_started.wait()
+
+    assert await execute("{ cheap }") == (True, {"data": {"cheap": 1}})
+    success, result = await execute("{ report }")
+    assert not success
+    assert result["errors"][0]["message"] == (
+        "Server is too busy to execute reports operation. Try again later."
+    )
+
+    finish_report.set()
+    assert await report == (True, {"data": {"report": 1}})
+    assert scheduler.classes[1].active == 0
@@ -0,0 +1,148 @@
+import pytest
+from graphql import get_introspection_query
+
+from ariadne import ObjectType, QueryType, graphql, graphql_sync, make_executable_schema
+from ariadne.contrib.tracing.aggregatedtracing import (
+    AggregatedTracingExtension,
+    FieldStats,
+    aggregated_tracing_extension,
+)
+
+
+@pytest.fixture
+def freeze_microtime(mocker):
+    mocker.patch(
+        "ariadne.contrib.tracing.aggregatedtracing.perf_counter_ns", return_value=2
+    )
+
+
+@pytest.mark.asyncio
+async def test_aggregated_tracing_extension_adds_fields_stats_to_result_extensions(
+    schema, freeze_microtime  # pylint: disable=unused-argument
+):
+    _, result = await graphql(
+        schema,
+        {"query": "{ a: status b: status testError }"},
+        extensions=[AggregatedTracingExtension],
+    )
+    assert result["extensions"] == {
+        "fieldStats": {
+            "version": 1,
+            "duration": 0,
+            "fields": {
+                "Query.status": {
+                    "count": 2,
+                    "errors": 0,
+                    "totalDuration": 0,
+                    "minDuration": 0,
+                    "maxDuration": 0,
+                    "p50Duration": 0,
+                    "p95Duration": 0,
+                    "p99Duration": 0,
+                },
+                "Query.testError": {
+                    "count": 1,
+                    "errors": 1,
+                    "totalDuration": 0,
+                    "minDuration": 0,
+                    "maxDuration": 0,
+                    "p50Duration": 0,
+                    "p95Duration": 0,
+                    "p99Duration": 0,
+                },
+            },
+        }
+    }
+
+
+@pytest.fixture
+def list_schema():
+    query = QueryType()
+    query.set_field("users", lambda *_: [{"name": "Bob"}] * 100)
+    user = ObjectType("User")
+    user.set_field("name", lambda obj, *_: obj["name"].upper())
+    return make_executable_schema(
+        """
+            type Query {
+                users: [User!]!
+            }
+
+            type User {
+                name: String!
+                email: String
+            }
+        """,
+        [query, user],
+    )
+
+
+def test_aggregated_tracing_extension_size_doesnt_depend_on_list_size(list_schema):
+    _, result = graphql_sync(
+        list_schema,
+        {"query": "{ users { name email } }"},
+        extensions=[AggregatedTracingExtension],
+    )
+    fields = result["extensions"]["fieldStats"]["fields"]
+    assert list(fields) == ["Query.users", "User.name"]
+    assert fields["User.name"]["count"] == 100
+
+
+def test_aggregated_tracing_extension_traces_default_resolvers_when_set(list_schema):
+    _, result = graphql_sync(
+        list_schema,
+        {"query": "{ users { email } }"},
+        extensions=[aggregated_tracing_extension(trace_default_resolver=True)],
+    )
+    fields = result["extensions"]["fieldStats"]["fields"]
+    assert fields["User.email"]["count"] == 100
+
+
+def test_aggregated_tracing_extension_limits_number_of_traced_fields(list_schema):
+    _, result = graphql_sync(
+        list_schema,
+        {"query": "{ users { name } }"},
+        extensions=[aggregated_tracing_extension(max_fields=1)],
+    )
+    summary = result["extensions"]["fieldStats"]
+    assert list(summary["fields"]) == ["Query.users"]
+    assert summary["skippedCalls"] == 100
+
+
+@pytest.mark.asyncio
+async def test_aggregated_tracing_extension_records_async_resolvers():
+    query = QueryType()
+
+    @query.field("hello")
+    async def resolve_hello(*_):
+        raise ValueError("Test error")
+
+    schema = make_executable_schema("type Query { hello: String }", query)
+    _, result = await graphql(
+        schema, {"query": "{ hello }"}, extensions=[AggregatedTracingExtension]
+    )
+    assert result["extensions"]["fieldStats"]["fields"]["Query.hello"]["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_aggregated_tracing_extension_skips_introspection(schema):
+    _, result = await graphql(
+        schema,
+        {"query": get_introspection_query(descriptions=True)},
+        extensions=[AggregatedTracingExtension],
+    )
+    assert "errors" not in result
+    assert result["extensions"]["fieldStats"]["fields"] == {}
+
+
+def test_field_stats_percentiles_are_upper_bounds_of_durations_buckets():
+    stats = FieldStats()
+    for _ in range(90):
+        stats.record(1500)
+    for _ in range(10):
+        stats.record(100000)
+
+    assert stats.percentile(50) == 2000
+    assert stats.percentile(90) == 2000
+    assert stats.percentile(95) == 100000
+    assert stats.min == 1500
+    assert stats.max == 100000
@@ -1,9 +1,14 @@
+import asyncio
+
 import pytest
 from freezegun import freeze_time
 from graphql import get_introspection_query
 
-from ariadne import graphql
-from ariadne.contrib.tracing.apollotracing import ApolloTracingExtension
+from ariadne import ExtensionManager, QueryType, graphql, make_executable_schema
+from ariadne.contrib.tracing.apollotracing import (
+    ApolloTracingExtension,
+    apollo_tracing_extension,
+)
 
 
 @pytest.mark.asyncio
@@ -50,3 +55,75 @@ async def test_apollotracing_extension_doesnt_break_introspection(schema):
         schema, {"query": introspection_query}, extensions=[ApolloTracingExtension]
     )
     assert "errors" not in result
+
+
+@pytest.mark.asyncio
+async def test_apollotracing_extension_skips_requests_not_sampled(schema):
+    _, result = await graphql(
+        schema,
+        {"query": "{ status }"},
+        extensions=[apollo_tracing_extension(sample_rate=0)],
+    )
+    assert result == {"data": {"status": True}}
+
+
+def test_apollotracing_extension_doesnt_resolve_fields_of_requests_not_sampled():
+    manager = ExtensionManager([apollo_tracing_extension(sample_rate=0)])
+    with manager.request():
+        assert manager.as_middleware_manager(None) is None
+
+
+@pytest.mark.asyncio
+async def test_apollotracing_extension_uses_sampler_to_decide_if_request_is_traced(
+    schema,
+):
+    def sampler(context):
+        return context["headers"].get("x-trace") == "1"
+
+    extension = apollo_tracing_extension(sampler=sampler)
+    _, result = await graphql(
+        schema,
+        {"query": "{ status }"},
+        context_value={"headers": {"x-trace": "1"}},
+        extensions=[extension],
+    )
+    assert result["extensions"]["tracing"]["execution"]["resolvers"]
+
+    _, result = await graphql(
+        schema,
+        {"query": "{ status }"},
+        context_value={"headers": {}},
+        extensions=[extension],
+    )
+    assert "extensions" not in result
+
+
+@pytest.mark.asyncio
+async def test_apollotracing_extension_records_limited_number_of_resolvers(schema):
+    _, result = await graphql(
+        schema,
+        {"query": '{ status hello(name: "Bob") testContext }'},
+        context_value={"test": "context"},
+        extensions=[apollo_tracing_extension(max_resolvers=2)],
+    )
+    resolvers = result["extensions"]["tracing"]["execution"]["resolvers"]
+    assert [resolver["fieldName"] for resolver in resolvers] == ["status", "hello"]
+
+
+@pytest.mark.asyncio
+async def test_apollotracing_extension_records_async_resolvers():
+    query = QueryType()
+
+    @query.field("hello")
+    async def resolve_hello(*_):
+        await asyncio.sleep(0.001)
+        return "world"
+
+    schema = make_executable_schema("type Query { hello: String }", query)
+    _, result = await graphql(
+        schema, {"query": "{ hello }"}, extensions=[ApolloTracingExtension]
+    )
+    assert result["data"] == {"hello": "world"}
+    resolvers = result["extensions"]["tracing"]["execution"]["resolvers"]
+    assert resolvers[0]["path"] == ["hello"]
+    assert resolvers[0]["duration"] >= 1000000
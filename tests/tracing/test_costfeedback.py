@@ -0,0 +1,145 @@
+import pytest
+
+from ariadne import QueryType, graphql, graphql_sync, make_executable_schema
+from ariadne.contrib.tracing.costfeedback import (
+    CostFeedbackRecorder,
+    FieldCostStats,
+    cost_feedback_extension,
+)
+from ariadne.validation import cost_directive, cost_validator
+
+type_defs = """
+    type Query {
+        users(first: Int = 10, offset: Int): [User!]! @cost(complexity: 1, multipliers: ["first"])
+        slow: Int
+        error: Int
+    }
+
+    type User {
+        id: ID!
+    }
+"""
+
+
+@pytest.fixture
+def feedback_schema():
+    query = QueryType()
+
+    @query.field("users")
+    def resolve_users(*_, first, offset=0):  # pylint: disable=unused-argument
+        return [{"id": i} for i in range(min(first, 3))]
+
+    @query.field("slow")
+    async def resolve_slow(*_):
+        return 1
+
+    @query.field("error")
+    def resolve_error(*_):
+        raise ValueError("Test error")
+
+    return make_executable_schema([cost_directive, type_defs], query)
+
+
+@pytest.fixture
+def recorder():
+    return CostFeedbackRecorder()
+
+
+def execute(schema, recorder, query):
+    return graphql_sync(
+        schema,
+        {"query": query},
+        validation_rules=[cost_validator(maximum_cost=100)],
+        extensions=[cost_feedback_extension(recorder)],
+    )
+
+
+def test_estimated_cost_is_recorded_next_to_resolvers_calls(feedback_schema, recorder):
+    query = "query Users($first: Int) { users(first: $first) { id } }"
+    for first in (2, 5):
+        graphql_sync(
+            feedback_schema,
+            {"query": query, "variables": {"first": first}},
+            validation_rules=[
+                cost_validator(maximum_cost=100, variables={"first": first})
+            ],
+            extensions=[cost_feedback_extension(recorder)],
+        )
+
+    report = recorder.get_report()
+    assert len(report["operations"]) == 1
+    operation = report["operations"][0]
+    assert operation["name"] == "Users"
+    assert operation["count"] == 2
+    assert operation["averageEstimatedCost"] == 3.5
+    assert operation["maxEstimatedCost"] == 5
+    assert operation["averageResolverCalls"] == 3.5
+    assert operation["maxResolverCalls"] == 4
+    assert operation["averageListItems"] == 2.5
+
+
+def test_fields_list_sizes_are_recorded(feedback_schema, recorder):
+    execute(feedback_schema, recorder, "{ users(first: 2) { id } }")
+    execute(feedback_schema, recorder, "{ users(first: 10) { id } }")
+
+    fields = {field["field"]: field for field in recorder.get_report()["fields"]}
+    assert fields["Query.users"]["calls"] == 2
+    assert fields["Query.users"]["averageListSize"] == 2.5
+    assert fields["Query.users"]["maxListSize"] == 3
+    assert fields["User.id"]["calls"] == 5
+    assert fields["User.id"]["maxListSize"] is None
+
+
+@pytest.mark.asyncio
+async def test_async_resolvers_are_recorded(feedback_schema, recorder):
+    await graphql(
+        feedback_schema,
+        {"query": "{ slow }"},
+        extensions=[cost_feedback_extension(recorder)],
+    )
+    report = recorder.get_report()
+    assert report["fields"][0]["field"] == "Query.slow"
+    assert report["operations"][0]["averageEstimatedCost"] is None
+    assert report["operations"][0]["maxEstimatedCost"] is None
+
+
+def test_resolvers_raising_errors_are_recorded(feedback_schema, recorder):
+    execute(feedback_schema, recorder, "{ error }")
+    fields = {field["field"]: field for field in recorder.get_report()["fields"]}
+    assert fields["Query.error"]["calls"] == 1
+    assert fields["Query.error"]["errors"] == 1
+    assert recorder.get_report()["operations"][0]["averageResolverCalls"] == 1
+
+
+def test_argument_bounding_every_list_is_suggested_as_multiplier(
+    feedback_schema, recorder
+):
+    execute(feedback_schema, recorder, "{ users(first: 2, offset: 5) { id } }")
+    execute(feedback_schema, recorder, "{ users(first: 3, offset: 1) { id } }")
+
+    suggestion = recorder.suggest_cost_map()
+    assert suggestion["Query"]["users"]["multipliers"] == ["first"]
+
+
+def test_complexity_is_suggested_relative_to_median_field_duration(recorder):
+    for coordinate, duration in (
+        (("Query", "a"), 100),
+        (("Query", "b"), 100),
+        (("Query", "c"), 500),
+    ):
+        recorder.get_field_stats(*coordinate).record(duration, None, {})
+
+    assert recorder.suggest_cost_map() == {"Query": {"c": {"complexity": 5}}}
+
+
+def test_field_stats_ignore_boolean_arguments():
+    stats = FieldCostStats()
+    stats.record(1, [1], {"flag": True, "ids": [1, 2]})
+    assert stats.bounds == {"ids": 2}
+
+
+def test_recorder_limits_number_of_operations(feedback_schema):
+    recorder = CostFeedbackRecorder(max_operations=1)
+    execute(feedback_schema, recorder, "query A { users(first: 1) { id } }")
+    execute(feedback_schema, recorder, "query B { users { id } }")
+    assert [op["name"] for op in recorder.get_report()["operations"]] == ["A"]
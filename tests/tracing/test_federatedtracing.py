@@ -0,0 +1,160 @@
+from base64 import b64decode
+
+import pytest
+from starlette.datastructures import Headers
+
+from ariadne import (
+    ExtensionManager,
+    QueryType,
+    graphql,
+    graphql_sync,
+    make_executable_schema,
+)
+from ariadne.contrib.tracing.federatedtracing import (
+    TRACE_HEADER,
+    FederatedTracingExtension,
+    encode_varint,
+    federated_tracing_extension,
+    is_trace_requested,
+)
+
+trace_requested_extension = federated_tracing_extension(trace_requested=lambda _: True)
+
+
+def read_varint(data, position):
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            return value, position
+
+
+def decode_message(data):
+    fields = {}
+    position = 0
+    while position < len(data):
+        tag, position = read_varint(data, position)
+        if tag & 7 == 2:
+            length, position = read_varint(data, position)
+            value = data[position : position + length]
+            position += length
+        else:
+            value, position = read_varint(data, position)
+        fields.setdefault(tag >> 3, []).append(value)
+    return fields
+
+
+def decode_trace(result):
+    return decode_message(b64decode(result["extensions"]["ftv1"]))
+
+
+def get_children(node):
+    children = [decode_message(data) for data in node.get(12, [])]
+    return {child.get(1, [b""])[0].decode() or child[2][0]: child for child in children}
+
+
+def test_varint_is_encoded_in_groups_of_seven_bits():
+    assert encode_varint(1) == b"\x01"
+    assert encode_varint(300) == b"\xac\x02"
+
+
+def test_trace_is_requested_by_asgi_request_header():
+    request = type("Request", (), {"headers": Headers({TRACE_HEADER: "ftv1"})})
+    assert is_trace_requested({"request": request})
+
+
+def test_trace_is_requested_by_wsgi_environ_header():
+    assert is_trace_requested(
+        {"request": {"HTTP_APOLLO_FEDERATION_INCLUDE_TRACE": "ftv1"}}
+    )
+
+
+def test_trace_is_not_requested_without_header():
+    assert not is_trace_requested({"request": {}})
+    assert not is_trace_requested(None)
+
+
+@pytest.mark.asyncio
+async def test_federated_tracing_extension_is_disabled_without_trace_header(schema):
+    _, result = await graphql(
+        schema,
+        {"query": "{ status }"},
+        context_value={"request": {}},
+        extensions=[FederatedTracingExtension],
+    )
+    assert result == {"data": {"status": True}}
+
+
+def test_federated_tracing_extension_doesnt_resolve_fields_without_trace_header():
+    manager = ExtensionManager([FederatedTracingExtension], {"request": {}})
+    with manager.request():
+        assert manager.as_middleware_manager(None) is None
+
+
+@pytest.mark.asyncio
+async def test_federated_tracing_extension_adds_trace_to_result_extensions(schema):
+    _, result = await graphql(
+        schema,
+        {"query": '{ status greeting: hello(name: "Bob") testError }'},
+        extensions=[trace_requested_extension],
+    )
+    trace = decode_trace(result)
+    assert trace[11][0] > 0  # duration
+    assert 3 in trace and 4 in trace  # end and start timestamps
+
+    root = decode_message(trace[14][0])
+    fields = get_children(root)
+    assert set(fields) == {"status", "greeting", "testError"}
+
+    greeting = fields["greeting"]
+    assert greeting[3] == [b"String"]
+    assert greeting[13] == [b"Query"]
+    assert greeting[14] == [b"hello"]
+    assert greeting[9][0] >= greeting[8][0]
+
+    error = decode_message(fields["testError"][11][0])
+    assert error[1] == [b"Test exception"]
+    assert decode_message(error[2][0]) == {1: [1], 2: [39]}
+
+
+def test_federated_tracing_extension_sync_adds_list_items_to_trace():
+    query = QueryType()
+    query.set_field("users", lambda *_: [{"name": "Bob"}, {"name": "Alice"}])
+    schema = make_executable_schema(
+        """
+            type Query {
+                users: [User!]!
+            }
+
+            type User {
+                name: String!
+            }
+        """,
+        query,
+    )
+
+    _, result = graphql_sync(
+        schema,
+        {"query": "{ users { name } }"},
+        extensions=[
+            federated_tracing_extension(
+                trace_requested=lambda _: True, trace_default_resolver=True
+            )
+        ],
+    )
+    root = decode_message(decode_trace(result)[14][0])
+    users = get_children(root)["users"]
+    items = get_children(users)
+    assert set(items) == {0, 1}
+    assert set(get_children(items[1])) == {"name"}
+
+    _, result = graphql_sync(
+        schema,
+        {"query": "{ users { name } }"},
+        extensions=[trace_requested_extension],
+    )
+    root = decode_message(decode_trace(result)[14][0])
+    assert not get_children(get_children(root)["users"])
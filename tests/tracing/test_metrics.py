@@ -0,0 +1,167 @@
+import asyncio
+
+import pytest
+from starlette.testclient import TestClient
+from werkzeug.test import Client
+
+from ariadne import QueryType, graphql, graphql_sync, make_executable_schema
+from ariadne.contrib.tracing.metrics import (
+    Histogram,
+    MetricsASGIApp,
+    MetricsRegistry,
+    MetricsWSGIApp,
+    metrics_extension,
+)
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+@pytest.mark.asyncio
+async def test_metrics_extension_records_operation_duration_and_size(schema, registry):
+    query = "query Status { status }"
+    _, result = await graphql(
+        schema, {"query": query}, extensions=[metrics_extension(registry)]
+    )
+    assert result == {"data": {"status": True}}
+    assert registry.operations.histograms["Status"].count == 1
+    assert registry.sizes.histograms["Status"].sum == len(query)
+
+
+def test_metrics_extension_records_operation_resolving_only_default_fields(
+    registry,
+):
+    schema = make_executable_schema("type Query { a: Int }")
+    query = "query Named { a }"
+    graphql_sync(
+        schema,
+        {"query": query},
+        root_value={"a": 1},
+        extensions=[metrics_extension(registry)],
+    )
+    assert registry.operations.histograms["Named"].count == 1
+    assert registry.sizes.histograms["Named"].sum == len(query)
+
+
+def test_metrics_extension_records_document_size_in_bytes(schema, registry):
+    query = "query Status { status } # żółw"
+    graphql_sync(schema, {"query": query}, extensions=[metrics_extension(registry)])
+    assert registry.sizes.histograms["Status"].sum == len(query) + 3
+
+
+@pytest.mark.asyncio
+async def test_metrics_extension_records_fields_durations_and_errors(schema, registry):
+    await graphql(
+        schema,
+        {"query": "{ a: status b: status testError }"},
+        extensions=[metrics_extension(registry)],
+    )
+    assert registry.fields.histograms[("Query", "status")].count == 2
+    assert registry.fields.histograms[("Query", "testError")].count == 1
+    assert registry.fields.errors == {("Query", "testError"): 1}
+    assert registry.operations.errors == {"anonymous": 1}
+
+
+@pytest.mark.asyncio
+async def test_metrics_extension_records_async_resolver_error(registry):
+    query = QueryType()
+
+    @query.field("hello")
+    async def resolve_hello(*_):
+        raise ValueError("Test error")
+
+    schema = make_executable_schema("type Query { hello: String }", query)
+    await graphql(
+        schema, {"query": "{ hello }"}, extensions=[metrics_extension(registry)]
+    )
+    assert registry.fields.errors == {("Query", "hello"): 1}
+
+
+def test_metrics_extension_sync_limits_number_of_recorded_operations():
+    registry = MetricsRegistry(max_operations=1)
+    query = QueryType()
+    query.set_field("status", lambda *_: True)
+    schema = make_executable_schema("type Query { status: Boolean }", query)
+
+    for name in ("A", "B", "C"):
+        graphql_sync(
+            schema,
+            {"query": "query %s { status }" % name},
+            extensions=[metrics_extension(registry)],
+        )
+
+    assert set(registry.operations.histograms) == {"A", "__other__"}
+    assert registry.operations.histograms["__other__"].count == 2
+
+
+def test_histogram_counts_values_in_buckets():
+    histogram = Histogram((1, 10))
+    for value in (1, 5, 50):
+        histogram.observe(value)
+    assert histogram.counts == [1, 1, 1]
+    assert histogram.cumulative_counts() == [1, 2, 3]
+    assert histogram.sum == 56
+
+
+def test_registry_renders_metrics_in_prometheus_text_format():
+    registry = MetricsRegistry(operation_buckets=(0.5, 1))
+    registry.operations.get_histogram('Say "hi"').observe(250000000)
+    registry.operations.add_error('Say "hi"')
+
+    rendered = registry.render()
+    assert (
+        "# TYPE graphql_operation_duration_seconds histogram\n"
+        'graphql_operation_duration_seconds_bucket{operation="Say \\"hi\\"",le="0.5"} 1\n'
+        'graphql_operation_duration_seconds_bucket{operation="Say \\"hi\\"",le="1.0"} 1\n'
+        'graphql_operation_duration_seconds_bucket{operation="Say \\"hi\\"",le="+Inf"} 1\n'
+        'graphql_operation_duration_seconds_sum{operation="Say \\"hi\\""} 0.25\n'
+        'graphql_operation_duration_seconds_count{operation="Say \\"hi\\""} 1\n'
+    ) in rendered
+    assert 'graphql_operation_errors_total{operation="Say \\"hi\\""} 1\n' in rendered
+
+
+def test_metrics_asgi_app_returns_rendered_metrics(registry):
+    registry.operations.get_histogram("Test").observe(1)
+    client = TestClient(MetricsASGIApp(registry))
+    response = client.get("/")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert response.text == registry.render()
+
+
+def test_metrics_wsgi_app_returns_rendered_metrics(registry):
+    registry.operations.get_histogram("Test").observe(1)
+    client = Client(MetricsWSGIApp(registry))
+    response = client.get("/")
+    assert response.status_code == 200
+    assert response.get_data(as_text=True) == registry.render()
+
+
+@pytest.mark.asyncio
+async def test_metrics_extension_records_cancelled_operation(registry):
+    resolver_started = asyncio.Event()
+
+    async def resolve_slow(*_):
+        resolver_started.set()
+        await asyncio.sleep(10)
+
+    query = QueryType()
+    query.set_field("slow", resolve_slow)
+    schema = make_executable_schema("type Query { slow: Int }", query)
+    execution = asyncio.ensure_future(
+        graphql(
+            schema,
+            {"query": "query Slow { slow }"},
+            extensions=[metrics_extension(registry)],
+        )
+    )
+    await resolver_started.wait()
+    execution.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await execution
+
+    assert registry.operations.cancellations == {"Slow": 1}
+    assert not registry.operations.errors
+    assert 'graphql_operations_cancelled_total{operation="Slow"} 1' in registry.render()
@@ -0,0 +1,276 @@
+from io import BytesIO
+from unittest.mock import ANY
+
+import pytest
+from graphql import get_introspection_query
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.sdk.trace.sampling import (
+    ALWAYS_OFF,
+    Decision,
+    Sampler,
+    SamplingResult,
+)
+from opentelemetry.trace import StatusCode
+from starlette.datastructures import UploadFile
+
+from ariadne import (
+    ExtensionManager,
+    ObjectType,
+    QueryType,
+    graphql,
+    graphql_sync,
+    make_executable_schema,
+)
+from ariadne.contrib.tracing.opentelemetry import (
+    OpenTelemetryExtension,
+    copy_args_for_tracing,
+    get_file_size,
+    opentelemetry_extension,
+)
+
+
+@pytest.fixture
+def span_exporter():
+    return InMemorySpanExporter()
+
+
+@pytest.fixture
+def tracer(span_exporter):
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(span_exporter))
+    return provider.get_tracer("test")
+
+
+def get_spans(span_exporter):
+    return {span.name: span for span in span_exporter.get_finished_spans()}
+
+
+@pytest.mark.asyncio
+async def test_opentelemetry_extension_causes_no_errors_in_query_execution(schema):
+    _, result = await graphql(
+        schema,
+        {"query": '{ status hello(name: "Bob") }'},
+        extensions=[OpenTelemetryExtension],
+    )
+    assert result == {"data": {"hello": "Hello, Bob!", "status": True}}
+
+
+@pytest.mark.asyncio
+async def test_opentelemetry_extension_creates_spans_for_query_and_fields(
+    schema, tracer, span_exporter
+):
+    await graphql(
+        schema,
+        {"query": '{ status hello(name: "Bob") }'},
+        extensions=[opentelemetry_extension(tracer=tracer)],
+    )
+    spans = get_spans(span_exporter)
+    assert set(spans) == {"GraphQL Operation", "status", "hello"}
+
+    root_span = spans["GraphQL Operation"]
+    assert root_span.attributes["component"] == "graphql"
+
+    field_span = spans["hello"]
+    assert field_span.parent.span_id == root_span.context.span_id
+    assert field_span.attributes == {
+        "component": "graphql",
+        "graphql.parentType": "Query",
+        "graphql.path": "hello",
+        "graphql.param.name": "Bob",
+    }
+
+
+def test_opentelemetry_extension_sync_creates_spans_for_fields(
+    schema, tracer, span_exporter
+):
+    _, result = graphql_sync(
+        schema,
+        {"query": "{ status }"},
+        extensions=[opentelemetry_extension(tracer=tracer)],
+    )
+    assert result == {"data": {"status": True}}
+    assert set(get_spans(span_exporter)) == {"GraphQL Operation", "status"}
+
+
+@pytest.mark.asyncio
+async def test_opentelemetry_extension_records_resolver_error(
+    schema, tracer, span_exporter
+):
+    await graphql(
+        schema,
+        {"query": "{ testError }"},
+        extensions=[opentelemetry_extension(tracer=tracer)],
+    )
+    span = get_spans(span_exporter)["testError"]
+    assert span.status.status_code == StatusCode.ERROR
+    assert span.events[0].name == "exception"
+
+
+@pytest.mark.asyncio
+async def test_opentelemetry_extension_skips_fields_of_unsampled_request(
+    schema, span_exporter, mocker
+):
+    provider = TracerProvider(sampler=ALWAYS_OFF)
+    provider.add_span_processor(SimpleSpanProcessor(span_exporter))
+    arg_filter = mocker.Mock(return_value={})
+
+    _, result = await graphql(
+        schema,
+        {"query": '{ hello(name: "Bob") }'},
+        extensions=[
+            opentelemetry_extension(
+                tracer=provider.get_tracer("test"), arg_filter=arg_filter
+            )
+        ],
+    )
+    assert result == {"data": {"hello": "Hello, Bob!"}}
+    assert not span_exporter.get_finished_spans()
+    arg_filter.assert_not_called()
+
+
+def test_opentelemetry_extension_doesnt_resolve_fields_of_unsampled_request():
+    provider = TracerProvider(sampler=ALWAYS_OFF)
+    manager = ExtensionManager(
+        [opentelemetry_extension(tracer=provider.get_tracer("test"))]
+    )
+    with manager.request():
+        assert manager.as_middleware_manager(None) is None
+
+
+@pytest.mark.asyncio
+async def test_opentelemetry_extension_nests_fields_spans(tracer, span_exporter):
+    query = QueryType()
+    query.set_field("users", lambda *_: [{"id": 1}, {"id": 2}])
+    user = ObjectType("User")
+    user.set_field("name", lambda obj, *_: "User %s" % obj["id"])
+    schema = make_executable_schema(
+        """
+        type Query { users: [User!]! }
+        type User { id: ID! name: String! }
+        """,
+        query,
+        user,
+    )
+
+    await graphql(
+        schema,
+        {"query": "{ users { id name } }"},
+        extensions=[opentelemetry_extension(tracer=tracer)],
+    )
+    spans = span_exporter.get_finished_spans()
+    root_span = next(span for span in spans if span.name == "GraphQL Operation")
+    users_span = next(span for span in spans if span.name == "users")
+    names_spans = [span for span in spans if span.name == "name"]
+    assert users_span.parent.span_id == root_span.context.span_id
+    assert len(names_spans) == 2
+    for span in names_spans:
+        assert span.parent.span_id == users_span.context.span_id
+
+
+class FieldsDroppingSampler(Sampler):
+    def should_sample(self, _parent_context, _trace_id, name, *_):
+        if name == "GraphQL Operation":
+            return SamplingResult(Decision.RECORD_AND_SAMPLE)
+        return SamplingResult(Decision.DROP)
+
+    def get_description(self):
+        return "FieldsDroppingSampler"
+
+
+@pytest.mark.asyncio
+async def test_opentelemetry_extension_skips_args_of_not_recording_span(
+    schema, span_exporter, mocker
+):
+    provider = TracerProvider(sampler=FieldsDroppingSampler())
+    provider.add_span_processor(SimpleSpanProcessor(span_exporter))
+    arg_filter = mocker.Mock(return_value={})
+
+    await graphql(
+        schema,
+        {"query": '{ hello(name: "Bob") }'},
+        extensions=[
+            opentelemetry_extension(
+                tracer=provider.get_tracer("test"), arg_filter=arg_filter
+            )
+        ],
+    )
+    assert set(get_spans(span_exporter)) == {"GraphQL Operation"}
+    arg_filter.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_opentelemetry_extension_skips_introspection_fields(
+    schema, tracer, span_exporter
+):
+    _, result = await graphql(
+        schema,
+        {"query": get_introspection_query(descriptions=True)},
+        extensions=[opentelemetry_extension(tracer=tracer)],
+    )
+    assert "errors" not in result
+    assert set(get_spans(span_exporter)) == {"GraphQL Operation"}
+
+
+@pytest.mark.asyncio
+async def test_opentelemetry_extension_calls_custom_arg_filter(schema, tracer, mocker):
+    arg_filter = mocker.Mock(return_value={})
+    await graphql(
+        schema,
+        {"query": '{ hello(name: "Bob") }'},
+        extensions=[opentelemetry_extension(tracer=tracer, arg_filter=arg_filter)],
+    )
+    arg_filter.assert_called_once_with({"name": "Bob"}, ANY)
+
+
+@pytest.mark.asyncio
+async def test_opentelemetry_extension_truncates_long_args(
+    schema, tracer, span_exporter
+):
+    await graphql(
+        schema,
+        {"query": '{ hello(name: "Alice") }'},
+        extensions=[opentelemetry_extension(tracer=tracer, max_arg_length=3)],
+    )
+    span = get_spans(span_exporter)["hello"]
+    assert span.attributes["graphql.param.name"] == "Ali..."
+
+
+def test_copy_args_for_tracing_replaces_upload_file_with_its_repr():
+    file_ = BytesIO(b"hello")
+    file_.seek(2)
+    upload_file = UploadFile("test.txt", file_, "text/plain")
+
+    args = copy_args_for_tracing({"files": [upload_file]}, 100)
+    assert args == {
+        "files": [
+            f"{type(upload_file)}(mime_type=text/plain, size=5, filename=test.txt)"
+        ]
+    }
+    assert file_.tell() == 2
+
+
+def test_copy_args_for_tracing_replaces_field_storage_with_its_repr():
+    field_storage = type(
+        "FieldStorage",
+        (),
+        {"filename": "test.txt", "type": "text/plain", "file": None, "value": b"abc"},
+    )()
+    assert copy_args_for_tracing(field_storage, 100) == (
+        f"{type(field_storage)}(mime_type=text/plain, size=3, filename=test.txt)"
+    )
+
+
+def test_get_file_size_returns_size_of_file_on_disk(tmp_path):
+    path = tmp_path / "test.txt"
+    path.write_bytes(b"hello world")
+    with open(path, "rb") as file_:
+        assert get_file_size(file_) == 11
+        assert file_.tell() == 0
+
+
+def test_get_file_size_returns_none_for_unknown_file_size():
+    assert get_file_size(object()) is None
@@ -0,0 +1,96 @@
+from pstats import Stats
+
+import pytest
+
+from ariadne import graphql, graphql_sync
+from ariadne.contrib.tracing.profiling import (
+    ProfilingExtension,
+    profiling_extension,
+    sign_profile_request,
+    signed_header_requested,
+)
+
+SECRET = "s3cr3t"
+
+
+@pytest.mark.asyncio
+async def test_profiling_extension_is_disabled_by_default(schema):
+    _, result = await graphql(
+        schema, {"query": "{ status }"}, extensions=[ProfilingExtension]
+    )
+    assert result == {"data": {"status": True}}
+
+
+@pytest.mark.asyncio
+async def test_profiling_extension_reports_top_functions_when_context_flag_is_set(
+    schema,
+):
+    _, result = await graphql(
+        schema,
+        {"query": "{ status }"},
+        context_value={"profile": True},
+        extensions=[profiling_extension(top=5)],
+    )
+    assert result["data"] == {"status": True}
+    profile = result["extensions"]["profile"]
+    assert profile["totalCalls"] > 0
+    assert len(profile["functions"]) == 5
+    assert set(profile["functions"][0]) == {
+        "function",
+        "calls",
+        "totalTime",
+        "cumulativeTime",
+    }
+
+
+def test_profiling_extension_sync_writes_profile_to_output_dir(schema, tmp_path):
+    _, result = graphql_sync(
+        schema,
+        {"query": "{ status }"},
+        context_value={"profile": True},
+        extensions=[
+            profiling_extension(output_dir=str(tmp_path), report=False),
+        ],
+    )
+    profile = result["extensions"]["profile"]
+    assert "functions" not in profile
+    assert Stats(str(tmp_path / profile["file"])).total_calls > 0
+
+
+def test_profiling_extension_sync_skips_request_without_flag(schema):
+    _, result = graphql_sync(
+        schema,
+        {"query": "{ status }"},
+        context_value={"profile": "yes"},
+        extensions=[ProfilingExtension],
+    )
+    assert "extensions" not in result
+
+
+def test_profiling_extension_raises_error_for_unknown_sort_key():
+    with pytest.raises(ValueError):
+        ProfilingExtension(sort_by="name")
+
+
+def test_signed_header_requested_accepts_valid_signature():
+    check = signed_header_requested(SECRET)
+    environ = {"HTTP_X_ARIADNE_PROFILE": sign_profile_request(SECRET)}
+    assert check({"request": environ})
+
+
+def test_signed_header_requested_rejects_signature_made_with_other_secret():
+    check = signed_header_requested(SECRET)
+    environ = {"HTTP_X_ARIADNE_PROFILE": sign_profile_request("other")}
+    assert not check({"request": environ})
+
+
+def test_signed_header_requested_rejects_expired_signature():
+    check = signed_header_requested(SECRET, max_age=60)
+    environ = {"HTTP_X_ARIADNE_PROFILE": sign_profile_request(SECRET, 1000)}
+    assert not check({"request": environ})
+
+
+def test_signed_header_requested_rejects_malformed_header():
+    check = signed_header_requested(SECRET)
+    assert not check({"request": {"HTTP_X_ARIADNE_PROFILE": "invalid"}})
+    assert not check({"request": {}})
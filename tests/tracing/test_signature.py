@@ -0,0 +1,103 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+from graphql import parse
+
+from ariadne import QueryType, graphql_sync, make_executable_schema
+from ariadne.contrib.tracing.signature import (
+    SIGNATURES_CACHE_SIZE,
+    get_operation_signature,
+    get_signature,
+    print_signature,
+    signatures_cache,
+)
+
+
+def get_fragments(document):
+    return {
+        definition.name.value: definition for definition in document.definitions[1:]
+    }
+
+
+def test_signature_has_literals_aliases_and_whitespace_stripped():
+    document = parse(
+        """
+        query Test($id: ID!) {
+            b: user(id: $id, limit: 10, name: "Bob", ratio: 1.5, tags: [1, 2]) {
+                name
+            }
+            filter(input: {name: "Bob"}) @include(if: true)
+        }
+        """
+    )
+    assert print_signature(document.definitions[0], {}) == (
+        "query Test($id: ID!) { "
+        "filter(input: {}) @include(if: true) "
+        'user(id: $id, limit: 0, name: "", ratio: 0, tags: []) { name } '
+        "}"
+    )
+
+
+def test_signature_has_fields_and_arguments_sorted():
+    document = parse("{ b(y: 1, x: 2) a }")
+    assert print_signature(document.definitions[0], {}) == "{ a b(x: 0, y: 0) }"
+
+
+def test_signature_includes_only_used_fragments_sorted_by_name():
+    document = parse(
+        """
+        { ...Z ...A }
+        fragment Z on Query { z ...B }
+        fragment A on Query { a }
+        fragment B on Query { b }
+        fragment Unused on Query { c }
+        """
+    )
+    assert print_signature(document.definitions[0], get_fragments(document)) == (
+        "{ ...A ...Z } "
+        "fragment A on Query { a } "
+        "fragment B on Query { b } "
+        "fragment Z on Query { z ...B }"
+    )
+
+
+def test_same_signature_and_hash_is_returned_for_equivalent_operations():
+    first = parse('query Test { a: user(name: "Bob") { name email } }').definitions[0]
+    second = parse('query  Test {user(name:"Alice"){email name}}').definitions[0]
+    assert get_signature(first, {}) == get_signature(second, {})
+    assert len(get_signature(first, {}).hash) == 64
+
+
+def test_signature_is_cached_by_query_text_and_operation_name():
+    query = "query Cached { cached }"
+    first = get_signature(parse(query).definitions[0], {})
+    assert signatures_cache[(query, "Cached")] is first
+    assert get_signature(parse(query).definitions[0], {}) is first
+
+
+def test_signatures_cache_is_evicted_by_concurrent_threads():
+    for i in range(SIGNATURES_CACHE_SIZE):
+        get_signature(parse("query Filled%d { a }" % i).definitions[0], {})
+    operations = [parse("query Evicting%d { a }" % i).definitions[0] for i in range(20)]
+    barrier = Barrier(20)
+
+    def cache_signature(operation):
+        barrier.wait()
+        return get_signature(operation, {})
+
+    with ThreadPoolExecutor(max_workers=20) as executor:
+        signatures = list(executor.map(cache_signature, operations))
+    assert len(signatures) == 20
+    assert len(signatures_cache) == SIGNATURES_CACHE_SIZE
+
+
+def test_operation_signature_is_available_to_resolvers():
+    query = QueryType()
+    query.set_field("hello", lambda _, info: get_operation_signature(info).hash)
+    schema = make_executable_schema("type Query { hello: String }", query)
+
+    _, result = graphql_sync(schema, {"query": "{ hello }"})
+    assert (
+        result["data"]["hello"]
+        == get_signature(parse("{hello}").definitions[0], {}).hash
+    )
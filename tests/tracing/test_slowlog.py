@@ -0,0 +1,118 @@
+import logging
+import time
+
+import pytest
+
+from ariadne import QueryType, graphql, graphql_sync, make_executable_schema
+from ariadne.contrib.tracing.slowlog import (
+    SlowOperationLogExtension,
+    get_variables_shape,
+    slow_operation_log_extension,
+)
+
+
+def get_logged_operations(caplog):
+    return [
+        record.graphql_operation
+        for record in caplog.records
+        if hasattr(record, "graphql_operation")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_slow_operation_log_extension_skips_fast_operations(schema, caplog):
+    await graphql(
+        schema, {"query": "{ status }"}, extensions=[SlowOperationLogExtension]
+    )
+    assert not get_logged_operations(caplog)
+
+
+@pytest.mark.asyncio
+async def test_slow_operation_log_extension_logs_operation_over_threshold(
+    schema, caplog
+):
+    caplog.set_level(logging.WARNING, logger="ariadne")
+    await graphql(
+        schema,
+        {
+            "query": "query Test($name: String) { hello(name: $name) a: status }",
+            "variables": {"name": "Bob"},
+        },
+        extensions=[slow_operation_log_extension(threshold=0)],
+    )
+
+    (data,) = get_logged_operations(caplog)
+    assert data["operationName"] == "Test"
+    assert (
+        data["signature"] == "query Test($name: String) { hello(name: $name) status }"
+    )
+    assert len(data["hash"]) == 64
+    assert data["variables"] == {"name": "str"}
+    assert set(data["stages"]) == {"parsing", "validationAndExecution"}
+    assert {field["field"] for field in data["slowFields"]} == {
+        "Query.hello",
+        "Query.status",
+    }
+
+
+def test_slow_operation_log_extension_logs_operation_of_default_resolved_fields(
+    caplog,
+):
+    caplog.set_level(logging.WARNING, logger="ariadne")
+    schema = make_executable_schema("type Query { a: Int }")
+    graphql_sync(
+        schema,
+        {"query": "query Named($id: ID) { a }", "variables": {"id": 1}},
+        root_value={"a": 1},
+        extensions=[slow_operation_log_extension(threshold=0)],
+    )
+
+    (data,) = get_logged_operations(caplog)
+    assert data["operationName"] == "Named"
+    assert data["signature"] == "query Named($id: ID) { a }"
+    assert data["variables"] == {"id": "int"}
+    assert data["slowFields"] == []
+
+
+def test_slow_operation_log_extension_sync_logs_invalid_operation(schema, caplog):
+    logger = logging.getLogger("test_slow_operations")
+    caplog.set_level(logging.INFO, logger="test_slow_operations")
+    graphql_sync(
+        schema,
+        {"query": "{ unknown"},
+        extensions=[
+            slow_operation_log_extension(
+                threshold=0, logger=logger, level=logging.INFO, top_fields=1
+            )
+        ],
+    )
+
+    (data,) = get_logged_operations(caplog)
+    assert data["signature"] is None
+    assert data["stages"] == {
+        "parsing": data["duration"],
+        "validationAndExecution": 0,
+    }
+    assert data["slowFields"] == []
+
+
+def test_slow_operation_log_extension_logs_execution_after_parsing(caplog):
+    caplog.set_level(logging.WARNING, logger="ariadne")
+    query = QueryType()
+    query.set_field("slow", lambda *_: time.sleep(0.05) or 1)
+    schema = make_executable_schema("type Query { slow: Int }", query)
+    graphql_sync(
+        schema,
+        {"query": "{ slow }"},
+        extensions=[slow_operation_log_extension(threshold=0)],
+    )
+
+    (data,) = get_logged_operations(caplog)
+    assert data["stages"]["validationAndExecution"] >= 50
+    assert data["stages"]["parsing"] < 50
+
+
+def test_variables_shape_contains_types_instead_of_values():
+    assert get_variables_shape(
+        {"id": 1, "input": {"tags": ["a", "b"], "email": None}, "ids": []}
+    ) == {"id": "int", "input": {"tags": ["str"], "email": "null"}, "ids": []}
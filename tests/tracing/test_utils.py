@@ -1,8 +1,12 @@
 from unittest.mock import Mock
 
+import pytest
+
+from ariadne import QueryType, make_executable_schema
 from ariadne.contrib.tracing.utils import (
     format_path,
     is_introspection_field,
+    is_traceable_field,
     should_trace,
 )
 
@@ -76,3 +80,37 @@ def test_field_with_custom_resolver_is_included_in_tracing():
         parent_type=Mock(fields={"name": Mock(resolve=True)}),
     )
     assert should_trace(info)
+
+
+@pytest.fixture
+def traced_schema():
+    query = QueryType()
+    query.set_field("user", lambda *_: {"name": "Bob"})
+    return make_executable_schema(
+        """
+            type Query {
+                user: User
+            }
+
+            type User {
+                name: String
+            }
+        """,
+        query,
+    )
+
+
+def test_field_of_introspection_type_is_not_traceable(traced_schema):
+    assert not is_traceable_field(traced_schema.type_map["__Type"], "name", True)
+
+
+def test_field_with_default_resolver_is_not_traceable_by_default(traced_schema):
+    assert not is_traceable_field(traced_schema.type_map["User"], "name")
+
+
+def test_field_with_default_resolver_is_traceable_when_set(traced_schema):
+    assert is_traceable_field(traced_schema.type_map["User"], "name", True)
+
+
+def test_field_with_custom_resolver_is_traceable(traced_schema):
+    assert is_traceable_field(traced_schema.type_map["Query"], "user")
@@ -7,6 +7,7 @@ from werkzeug.wrappers import Response
 
 from ariadne.constants import DATA_TYPE_JSON
 from ariadne.types import ExtensionSync
+from ariadne.validation import QueryLimits
 from ariadne.wsgi import GraphQL
 
 
@@ -101,6 +102,15 @@ def test_custom_validation_rules_function_is_called_with_context_value(
     get_validation_rules.assert_called_once_with({"test": "TEST-CONTEXT"}, ANY, ANY)
 
 
+def test_query_limits_are_checked_on_query_execution(schema):
+    app = GraphQL(schema, query_limits=QueryLimits(max_root_fields=1))
+    success, result = app.execute_query({}, {"query": "{ status hello }"})
+    assert not success
+    assert result["errors"][0]["message"] == (
+        "Operation has too many root fields: 2 exceeds the limit of 1."
+    )
+
+
 def execute_failing_query(app):
     data = json.dumps({"query": "{ error }"})
     app(
@@ -189,6 +199,15 @@ def test_middlewares_are_passed_to_query_executor(schema):
     assert result == {"data": {"hello": "**Hello, BOB!**"}}
 
 
+def test_middleware_manager_is_reused_between_requests(schema):
+    app = GraphQL(schema, middleware=[middleware])
+    for _ in range(2):
+        _, result = app.execute_query({}, {"query": '{ hello(name: "BOB") }'})
+        assert result == {"data": {"hello": "**Hello, BOB!**"}}
+    # pylint: disable=protected-access
+    assert len(app.middleware_manager._cached_resolvers) == 1
+
+
 def test_middleware_function_result_is_passed_to_query_executor(schema):
     def get_middleware(*_):
         return [middleware]